@@ -0,0 +1,109 @@
+"""
+Tiempo de arranque del servicio de pagos por tipo de procesador.
+
+    python -m benchmarks.import_time --runs 10
+
+Cada medición es un intérprete nuevo que importa el builder, construye el
+servicio y procesa un pago. "eager" precarga el procesador de Stripe antes,
+como ocurría cuando `processors/__init__.py` lo importaba siempre; la
+diferencia con "offline" y "local" es lo que ahorra la carga diferida.
+Cada escenario falla si importar el builder ya carga los notificadores.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_SCENARIO = """
+import json, sys, time
+start = time.perf_counter()
+if {eager}:
+    import src.payment_service.processors.stripe_processor
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import CustomerData, PaymentData, PaymentType
+imported = time.perf_counter()
+loaded = sorted(m for m in {notifier_modules!r} if m in sys.modules)
+assert not loaded, f"el builder cargó notificadores al importarse: {{loaded}}"
+
+customer_data = CustomerData(name="Bench", contact_info={{"email": "b@example.com"}})
+payment_data = PaymentData(amount=100, source="tok", currency={currency!r},
+                           type=PaymentType.{payment_type})
+service = (
+    PaymentServiceBuilder()
+    .set_payment_processor(payment_data)
+    .set_notifier(customer_data)
+    .set_logger()
+    .set_listener()
+    .set_payment_validator()
+    .build()
+)
+service.logger.path = {log_path!r}
+if {process}:
+    service.process_transaction(customer_data, payment_data)
+ready = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "ready_ms": (ready - start) * 1000,
+    "stripe_loaded": "stripe" in sys.modules,
+}}), file=sys.stderr)
+"""
+
+# Módulos que el builder solo debe cargar al configurar el notificador
+NOTIFIER_MODULES = (
+    "src.payment_service.notifiers.email",
+    "src.payment_service.notifiers.sms",
+    "src.payment_service.notifiers.dispatcher",
+    "src.payment_service.notifiers.routing_notifier",
+    "email.mime",
+)
+
+# nombre: (moneda, tipo de pago, precargar Stripe, procesar un pago)
+SCENARIOS = {
+    "offline": ("MXN", "OFFLINE", False, True),
+    "local": ("USD", "ONLINE", False, True),
+    "eager (offline)": ("MXN", "OFFLINE", True, True),
+    "stripe": ("MXN", "ONLINE", False, False),
+}
+
+
+def measure(code: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument(
+        "--log-path", default="/dev/null" if sys.platform != "win32" else "NUL"
+    )
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16} {'import':>10} {'ready':>10}  stripe loaded")
+    for name, (currency, payment_type, eager, process) in SCENARIOS.items():
+        code = _SCENARIO.format(
+            currency=currency,
+            payment_type=payment_type,
+            eager=eager,
+            process=process,
+            log_path=args.log_path,
+            notifier_modules=NOTIFIER_MODULES,
+        )
+        samples = [measure(code) for _ in range(args.runs)]
+        import_ms = statistics.median(s["import_ms"] for s in samples)
+        ready_ms = statistics.median(s["ready_ms"] for s in samples)
+        print(
+            f"{name:<16} {import_ms:>8.1f}ms {ready_ms:>8.1f}ms  "
+            f"{samples[0]['stripe_loaded']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Costo de construir los modelos de commons en el camino de cada pago.
+
+    python -m benchmarks.model_construction --number 200000
+
+Compara la construcción validada (`Model(...)`) con `model_construct` para los
+modelos que el servicio crea en cada transacción: el Request de las
+validaciones, la PaymentResponse del procesador y, en lotes, el
+BatchItemResult de cada fila. En pydantic 2.x la validación del núcleo en Rust
+es más rápida que `model_construct` para estos modelos pequeños, por eso el
+servicio los construye validados.
+"""
+
+import argparse
+import timeit
+
+from src.payment_service.commons import (
+    BatchItemResult,
+    ContactInfo,
+    CustomerData,
+    PaymentData,
+    PaymentResponse,
+    Request,
+)
+
+customer_data = CustomerData(
+    name="Bench", contact_info=ContactInfo(email="b@example.com")
+)
+payment_data = PaymentData(amount=100, source="tok_visa")
+response = PaymentResponse(status="succeeded", amount=100, transaction_id="ch_1")
+
+# modelo: (validado, model_construct)
+CASES = {
+    "Request": (
+        lambda: Request(customer_data=customer_data, payment_data=payment_data),
+        lambda: Request.model_construct(
+            customer_data=customer_data, payment_data=payment_data
+        ),
+    ),
+    "PaymentResponse": (
+        lambda: PaymentResponse(
+            status="succeeded", amount=100, transaction_id="ch_1", message="ok"
+        ),
+        lambda: PaymentResponse.model_construct(
+            status="succeeded", amount=100, transaction_id="ch_1", message="ok"
+        ),
+    ),
+    "BatchItemResult": (
+        lambda: BatchItemResult(index=0, status="processed", response=response),
+        lambda: BatchItemResult.model_construct(
+            index=0, status="processed", response=response
+        ),
+    ),
+}
+
+
+def per_call_us(fn, number: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'model':<16} {'validated':>10} {'construct':>10}")
+    for name, (validated, constructed) in CASES.items():
+        timings = [
+            per_call_us(fn, args.number, args.repeat) for fn in (validated, constructed)
+        ]
+        print(f"{name:<16} " + " ".join(f"{us:>8.2f}us" for us in timings))
+
+
+if __name__ == "__main__":
+    main()
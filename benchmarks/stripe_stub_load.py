@@ -0,0 +1,147 @@
+"""
+Prueba de carga del servicio de pagos contra el stand-in local de Stripe.
+
+    python -m benchmarks.stripe_stub_load --requests 20000 --processes 8 \
+        --workers 32 --latency lognormal --median-ms 30 --p99-ms 200
+
+Arranca StripeStubServer en segundo plano (o usa --stub-url con uno lanzado
+aparte con `python -m src.payment_service.stripe_stub`), apunta
+StripePaymentProcessor a él con STRIPE_API_BASE y reparte los pagos entre
+`--processes` procesos, cada uno con un PaymentService y `process_batch`.
+El cliente de Stripe consume unos milisegundos de CPU por llamada, así que
+para pasar de unos cientos de pagos por segundo hacen falta varios procesos.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import CustomerData, PaymentData
+from src.payment_service.metrics import PipelineMetrics
+from src.payment_service.processors import StripeClientConfig, build_stripe_client
+from src.payment_service.stripe_stub import (
+    LatencyProfile,
+    StripeStubServer,
+    StubProfile,
+)
+
+
+def run_batch(
+    api_base: str, requests: int, workers: int
+) -> tuple[int, dict[str, int], PipelineMetrics]:
+    """Procesa `requests` pagos con un PaymentService propio del proceso."""
+    os.environ["STRIPE_API_BASE"] = api_base
+    os.environ.setdefault("STRIPE_API_KEY", "sk_test_stub")
+
+    customer_data = CustomerData(
+        name="Load Test", contact_info={"email": "load@example.com"}
+    )
+    payment_data = PaymentData(amount=100, source="tok_visa")
+    with contextlib.redirect_stdout(io.StringIO()):
+        service = (
+            PaymentServiceBuilder()
+            .set_logger()
+            .set_payment_validator()
+            .set_payment_processor(payment_data)
+            .set_notifier(customer_data)
+            .set_listener()
+            .set_metrics()
+            .build()
+        )
+    # Pool HTTP del tamaño del lote de hilos
+    service.payment_processor.client = build_stripe_client(
+        StripeClientConfig(max_connections=workers)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service.logger.path = os.path.join(tmp, "transactions.log")
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = service.process_batch(
+                [(customer_data, payment_data)] * requests, max_workers=workers
+            )
+    return result.succeeded, result.failures, service.metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=32, help="hilos por proceso")
+    parser.add_argument("--stub-url", default=None)
+    parser.add_argument(
+        "--latency",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="fixed",
+    )
+    parser.add_argument("--median-ms", type=float, default=0.0)
+    parser.add_argument("--p99-ms", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = None
+    api_base = args.stub_url
+    if api_base is None:
+        server = StripeStubServer(
+            ("127.0.0.1", 0),
+            StubProfile(
+                latency=LatencyProfile(args.latency, args.median_ms, args.p99_ms),
+                error_rate=args.error_rate,
+                rate_limit_rate=args.rate_limit_rate,
+                seed=42,
+            ),
+        )
+        server.serve_in_background()
+        api_base = server.api_base
+
+    shares = [
+        args.requests // args.processes + (i < args.requests % args.processes)
+        for i in range(args.processes)
+    ]
+    metrics = PipelineMetrics()
+    succeeded = 0
+    failures: dict[str, int] = {}
+    start = time.perf_counter()
+    if args.processes == 1:
+        results = [run_batch(api_base, shares[0], args.workers)]
+    else:
+        with ProcessPoolExecutor(max_workers=args.processes) as executor:
+            results = list(
+                executor.map(
+                    run_batch,
+                    [api_base] * args.processes,
+                    shares,
+                    [args.workers] * args.processes,
+                )
+            )
+    elapsed = time.perf_counter() - start
+
+    for ok, batch_failures, batch_metrics in results:
+        succeeded += ok
+        metrics.merge(batch_metrics)
+        for kind, count in batch_failures.items():
+            failures[kind] = failures.get(kind, 0) + count
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+        print(f"Stub: {api_base}, {server.requests_served} requests served")
+    print(
+        f"{args.requests} transactions in {elapsed:.2f}s "
+        f"({args.requests / elapsed:,.0f} tx/s), {succeeded} succeeded, "
+        f"failures: {failures}"
+    )
+    for stage, stats in metrics.snapshot()["batch"].items():
+        print(
+            f"  {stage:<10} p50={stats['p50_ms']:.2f}ms p90={stats['p90_ms']:.2f}ms "
+            f"p99={stats['p99_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
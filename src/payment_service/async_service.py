@@ -0,0 +1,163 @@
+import asyncio
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from src.payment_service.commons import (
+    BatchItemResult,
+    BatchResult,
+    CustomerData,
+    PaymentData,
+    PaymentResponse,
+)
+from src.payment_service.idempotency import IdempotencyStore
+from src.payment_service.listeners.manager import ListenerManager
+from src.payment_service.metrics import PipelineMetrics, use_metrics
+from src.payment_service.processors import (
+    AsyncPaymentProcessorProtocol,
+    AsyncRecurringPaymentProtocol,
+    AsyncRefundPaymentProtocol,
+)
+from src.payment_service.validators import ChainHandler
+
+from .async_service_protocol import AsyncPaymentServiceProtocol
+from .loggers import TransactionLogger
+from .notifiers import NotifierProtocol
+from .service_flow import ServiceFlow
+
+
+@dataclass
+class AsyncPaymentService(ServiceFlow, AsyncPaymentServiceProtocol):
+    """
+    Servicio de pagos sobre asyncio.
+
+    Mismo flujo que PaymentService (ver ServiceFlow), pero esperando al
+    procesador con `await` para que un solo event loop mantenga muchos cobros
+    en curso. El logger, los listeners y el notificador son síncronos y se
+    ejecutan con `asyncio.to_thread`, fuera del event loop.
+    """
+
+    payment_processor: AsyncPaymentProcessorProtocol
+    notifier: NotifierProtocol
+    validator: ChainHandler
+    logger: TransactionLogger
+    listener: ListenerManager
+    recurring_processor: AsyncRecurringPaymentProtocol | None = None
+    refund_processor: AsyncRefundPaymentProtocol | None = None
+    idempotency_store: IdempotencyStore | None = None
+    metrics: PipelineMetrics | None = None
+
+    async def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse:
+        """Procesa un pago único (ver PaymentService.process_transaction)"""
+        try:
+            request = self._validate("transaction", customer_data, payment_data)
+        except Exception as e:
+            print(f"Fallo en las validaciones: {e}")
+            raise e
+        payment_data = request.payment_data
+
+        cached_response, request_fingerprint = self._cached_response(
+            request, idempotency_key
+        )
+        if cached_response:
+            return cached_response
+
+        with self._stage("transaction", "processor"):
+            payment_response = await self.payment_processor.process_transaction(
+                customer_data, payment_data, idempotency_key=idempotency_key
+            )
+        self._remember(idempotency_key, request_fingerprint, payment_response)
+        await asyncio.to_thread(
+            self._record_payment,
+            "transaction",
+            customer_data,
+            payment_data,
+            payment_response,
+        )
+        return payment_response
+
+    async def process_batch(
+        self,
+        transactions: Iterable[tuple[CustomerData, PaymentData]],
+        max_concurrency: int = 100,
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchResult:
+        """
+        Procesa un lote de pagos únicos con a lo sumo `max_concurrency` cobros
+        en curso. Igual que PaymentService.process_batch, valida primero, pasa
+        `idempotency_keys` al procesador y al IdempotencyStore, y difiere
+        notificaciones y logs al final del lote.
+        """
+        pairs = list(transactions)
+        items, valid_indexes = self._validate_batch(pairs, idempotency_keys)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        processor = self.payment_processor
+        replayed: set[int] = set()
+
+        async def charge(index: int) -> None:
+            key = idempotency_keys[index] if idempotency_keys else None
+            async with semaphore:
+                try:
+                    response = None
+                    if key and self.idempotency_store:
+                        response = self.idempotency_store.get(key)
+                    if response:
+                        replayed.add(index)
+                    else:
+                        customer_data, payment_data = pairs[index]
+                        with self._stage("batch", "processor"):
+                            response = await processor.process_transaction(
+                                customer_data, payment_data, idempotency_key=key
+                            )
+                        self._remember(key, None, response)
+                    items[index] = BatchItemResult(
+                        index=index, status="processed", response=response
+                    )
+                except Exception as e:
+                    items[index] = BatchItemResult(
+                        index=index, status="error", error=str(e)
+                    )
+
+        await asyncio.gather(*(charge(index) for index in valid_indexes))
+
+        await asyncio.to_thread(
+            self._record_batch, self._processed(pairs, items, replayed)
+        )
+
+        return BatchResult(items=[item for item in items if item is not None])
+
+    async def process_refund(self, transaction_id: str) -> PaymentResponse:
+        """Procesa un reembolso de un pago previo"""
+        if not self.refund_processor:
+            raise NotImplementedError("Refunds not supported by this processor")
+
+        with self._stage("refund", "processor"):
+            refund_response = await self.refund_processor.refund_payment(transaction_id)
+        await asyncio.to_thread(self._record_refund, transaction_id, refund_response)
+        return refund_response
+
+    async def setup_recurring(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        """Configura un pago recurrente (suscripción)"""
+        if not self.recurring_processor:
+            raise NotImplementedError(
+                "Recurring payments not supported by this processor"
+            )
+
+        request = self._validate("recurring", customer_data, payment_data)
+        payment_data = request.payment_data
+
+        with self._stage("recurring", "processor"), use_metrics(self.metrics):
+            recurring_response = await self.recurring_processor.setup_recurring_payment(
+                customer_data, payment_data
+            )
+        await asyncio.to_thread(
+            self._record_subscription, customer_data, payment_data, recurring_response
+        )
+        return recurring_response
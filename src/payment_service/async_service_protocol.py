@@ -0,0 +1,47 @@
+from collections.abc import Iterable, Sequence
+from typing import Protocol
+
+from src.payment_service.commons.batch_result import BatchResult
+from src.payment_service.commons.customer import CustomerData
+from src.payment_service.commons.payment_data import PaymentData
+from src.payment_service.commons.payment_response import PaymentResponse
+from src.payment_service.listeners.manager import ListenerManager
+from src.payment_service.loggers.transaction_logger import TransactionLogger
+from src.payment_service.notifiers.notifier import NotifierProtocol
+from src.payment_service.processors.async_payment import AsyncPaymentProcessorProtocol
+from src.payment_service.processors.async_recurring import (
+    AsyncRecurringPaymentProtocol,
+)
+from src.payment_service.processors.async_refunds import AsyncRefundPaymentProtocol
+from src.payment_service.validators import ChainHandler
+
+
+# Versión asíncrona de PaymentServiceProtocol
+class AsyncPaymentServiceProtocol(Protocol):
+    payment_processor: AsyncPaymentProcessorProtocol
+    notifier: NotifierProtocol
+    validator: ChainHandler
+    logger: TransactionLogger
+    listener: ListenerManager
+    recurring_processor: AsyncRecurringPaymentProtocol | None = None
+    refund_processor: AsyncRefundPaymentProtocol | None = None
+
+    async def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse: ...
+
+    async def process_batch(
+        self,
+        transactions: Iterable[tuple[CustomerData, PaymentData]],
+        max_concurrency: int = 100,
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchResult: ...
+
+    async def process_refund(self, transaction_id: str) -> PaymentResponse: ...
+
+    async def setup_recurring(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse: ...
@@ -1,22 +1,34 @@
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
-from src.payment_service.commons import CustomerData, PaymentData
+from src.payment_service.commons import CustomerData, PaymentData, PaymentType
 from src.payment_service.factory import PaymentProcessorFactory
 from src.payment_service.listeners.accountability_listener import AccountabilityListener
+from src.payment_service.listeners.concurrent_manager import ConcurrentListenerManager
 from src.payment_service.listeners.manager import ListenerManager
-from src.payment_service.notifiers import EmailNotifier, PhoneNotifier
-from src.payment_service.notifiers.default_notifier import LogOnlyNotifier
-from src.payment_service.processors import PaymentProcessorProtocol
+from src.payment_service.processors import (
+    AsyncPaymentProcessorProtocol,
+    PaymentProcessorProtocol,
+    RateLimitedProcessor,
+    RoutingPaymentProcessor,
+)
+from src.payment_service.resilience import RateLimiter, RateLimitMode, TokenBucket
 from src.payment_service.validators import (
     ChainHandler,
     CustomerHandler,
     PaymentHandler,
+    ValidationMode,
 )
 
-from .loggers import TransactionLogger
+from .async_service import AsyncPaymentService
+from .idempotency import IdempotencyStore
+from .loggers import BufferedTransactionLogger, DurabilityPolicy, TransactionLogger
+from .metrics import PipelineMetrics
 from .notifiers import NotifierProtocol
 from .service import PaymentService
 
+if TYPE_CHECKING:
+    from .notifiers import BackpressurePolicy
+
 
 class PaymentServiceBuilder:
     payment_processor: PaymentProcessorProtocol | None = None
@@ -26,11 +38,30 @@ class PaymentServiceBuilder:
     listener: ListenerManager | None = None
     recurring_processor: PaymentProcessorProtocol | None = None
     refund_processor: PaymentProcessorProtocol | None = None
+    async_payment_processor: AsyncPaymentProcessorProtocol | None = None
+    idempotency_store: IdempotencyStore | None = None
+    metrics: PipelineMetrics | None = None
 
     def set_logger(self) -> Self:
         self.logger = TransactionLogger()
         return self
 
+    def set_buffered_logger(
+        self,
+        durability: DurabilityPolicy = DurabilityPolicy.FLUSH,
+        flush_interval: float | None = 1.0,
+        max_buffered_bytes: int = 64 * 1024,
+        path: str = "transactions.log",
+    ) -> Self:
+        """Logger con archivo persistente y escrituras agrupadas."""
+        self.logger = BufferedTransactionLogger(
+            path=path,
+            durability=durability,
+            flush_interval=flush_interval,
+            max_buffered_bytes=max_buffered_bytes,
+        )
+        return self
+
     def set_payment_processor(self, payment_data: PaymentData) -> Self:
         """Factory Method: Crea el procesador de pagos apropiado."""
         self.payment_processor = PaymentProcessorFactory.create_payment_processor(
@@ -38,30 +69,139 @@ class PaymentServiceBuilder:
         )
         return self
 
-    def set_payment_validator(self) -> Self:
-        self.validator = PaymentHandler()
+    def set_routing_processor(self) -> Self:
+        """
+        Elige el procesador en cada llamada según el tipo de pago y la moneda,
+        para que un solo servicio atienda todo tipo de pagos.
+        """
+        factory = PaymentProcessorFactory
+        self.payment_processor = RoutingPaymentProcessor(
+            select=factory.create_payment_processor,
+            refund_routes={
+                # IDs de cargos de Stripe (ch_) y de pagos locales
+                "ch_": lambda: factory.processor_for(PaymentType.ONLINE, "MXN"),
+                "LOCAL-": lambda: factory.processor_for(PaymentType.ONLINE),
+                "OFFLINE-": lambda: factory.processor_for(PaymentType.OFFLINE),
+            },
+        )
+        return self
+
+    def set_rate_limit(
+        self,
+        rate: float,
+        burst: float | None = None,
+        mode: RateLimitMode = RateLimitMode.BLOCK,
+        max_wait: float | None = None,
+        buckets: dict[str, TokenBucket] | None = None,
+    ) -> Self:
+        """
+        Decorator: limita las llamadas del payment_processor a `rate` por
+        segundo y endpoint. `buckets` permite pasar buckets propios, por
+        ejemplo SharedTokenBucket compartidos entre procesos; el de
+        "subscriptions" necesita capacidad para RECURRING_CALLS tokens.
+        """
+        if not self.payment_processor:
+            print("Error: Llamar set_payment_processor() primero")
+            return self
+
+        if buckets is None:
+            buckets = {
+                endpoint: TokenBucket(rate=rate, capacity=burst)
+                for endpoint in ("charges", "refunds")
+            }
+            # Una suscripción consume RECURRING_CALLS tokens de una vez
+            buckets["subscriptions"] = TokenBucket(
+                rate=rate,
+                capacity=max(
+                    burst or max(rate, 1.0), RateLimitedProcessor.RECURRING_CALLS
+                ),
+            )
+        self.payment_processor = RateLimitedProcessor(
+            wrapped_processor=self.payment_processor,
+            limiter=RateLimiter(buckets=buckets, mode=mode, max_wait=max_wait),
+        )
+        return self
+
+    def set_async_payment_processor(self, payment_data: PaymentData) -> Self:
+        """Factory Method: Crea el procesador asíncrono apropiado."""
+        self.async_payment_processor = (
+            PaymentProcessorFactory.create_async_payment_processor(payment_data)
+        )
+        return self
+
+    def set_payment_validator(
+        self, mode: ValidationMode = ValidationMode.SHORT_CIRCUIT
+    ) -> Self:
+        self.validator = PaymentHandler().compile(mode)
         return self
 
-    def set_chain_of_validations(self) -> Self:
+    def set_chain_of_validations(
+        self, mode: ValidationMode = ValidationMode.SHORT_CIRCUIT
+    ) -> Self:
         customer_handler = CustomerHandler()
         payment_handler = PaymentHandler()
 
         # Encadenar: Customer -> Payment
         customer_handler.set_next(payment_handler)
 
-        self.validator = customer_handler
+        # Se compila una vez: cada validación es una llamada en un bucle plano
+        self.validator = customer_handler.compile(mode)
         return self
 
     def set_notifier(self, customer_data: CustomerData) -> Self:
         """Strategy Pattern: Selecciona notificador según contacto."""
+        # Solo se importa el canal elegido
         if customer_data.contact_info.email:
+            from .notifiers.email import EmailNotifier
+
             self.notifier = EmailNotifier()
         elif customer_data.contact_info.phone:
+            from .notifiers.sms import PhoneNotifier
+
             self.notifier = PhoneNotifier(sms_gateway="Twilio")
         else:
+            from .notifiers.default_notifier import LogOnlyNotifier
+
             self.notifier = LogOnlyNotifier()
         return self
 
+    def set_routing_notifier(
+        self, order: tuple[str, ...] = ("email", "phone"), fallback: bool = True
+    ) -> Self:
+        """
+        Strategy por llamada: el canal se elige con el CustomerData de cada
+        pago, en el orden de prioridad `order`, en lugar de fijarlo al construir.
+        """
+        from .notifiers.routing_notifier import RoutingNotifier
+
+        self.notifier = RoutingNotifier(order=order, fallback=fallback)
+        return self
+
+    def set_notification_dispatcher(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        backpressure: "BackpressurePolicy | None" = None,
+    ) -> Self:
+        """
+        Envía las notificaciones del notificador actual en segundo plano.
+
+        `backpressure` por defecto es BackpressurePolicy.BLOCK.
+        """
+        from .notifiers.dispatcher import BackpressurePolicy, NotificationDispatcher
+
+        if not self.notifier:
+            print("Error: Llamar set_notifier() primero")
+            return self
+
+        self.notifier = NotificationDispatcher(
+            notifier=self.notifier,
+            workers=workers,
+            max_queue_size=max_queue_size,
+            backpressure=backpressure or BackpressurePolicy.BLOCK,
+        )
+        return self
+
     def set_recurring_processor(self) -> Self:
         """
         Configura el procesador de pagos recurrentes.
@@ -72,8 +212,9 @@ class PaymentServiceBuilder:
             print("Error: Llamar set_payment_processor() primero")
             return self
 
-        # Verificar si el procesador tiene el método
-        if hasattr(self.payment_processor, "setup_recurring_payment"):
+        # Verificar si el procesador (o el que decora) tiene el método
+        backend = getattr(self.payment_processor, "wrapped_processor", None)
+        if hasattr(backend or self.payment_processor, "setup_recurring_payment"):
             self.recurring_processor = self.payment_processor  # Reutiliza el mismo
             print("Recurring payments: Soportado")
         else:
@@ -92,8 +233,9 @@ class PaymentServiceBuilder:
             print("Error: Llamar set_payment_processor() primero")
             return self
 
-        # Verificar si el procesador tiene el método
-        if hasattr(self.payment_processor, "refund_payment"):
+        # Verificar si el procesador (o el que decora) tiene el método
+        backend = getattr(self.payment_processor, "wrapped_processor", None)
+        if hasattr(backend or self.payment_processor, "refund_payment"):
             self.refund_processor = self.payment_processor  # Reutiliza el mismo
             print("Refunds: Soportado")
         else:
@@ -102,36 +244,42 @@ class PaymentServiceBuilder:
 
         return self
 
-    def set_listener(self):
-        """Configura el listener manager con sus suscriptores."""
-        listener = ListenerManager()
+    def set_idempotency_store(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 24 * 3600.0,
+        fingerprint_ttl_seconds: float = 60.0,
+    ) -> Self:
+        """
+        Activa la deduplicación de reintentos: por clave de idempotencia durante
+        `ttl_seconds`, o por contenido durante `fingerprint_ttl_seconds`.
+        """
+        self.idempotency_store = IdempotencyStore(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            fingerprint_ttl_seconds=fingerprint_ttl_seconds,
+        )
+        return self
+
+    def set_metrics(self, metrics: PipelineMetrics | None = None) -> Self:
+        """Activa los timers por etapa (se puede compartir un PipelineMetrics)."""
+        self.metrics = metrics or PipelineMetrics()
+        return self
+
+    def set_listener(self, concurrent: bool = False):
+        """
+        Configura el listener manager con sus suscriptores.
+
+        Con `concurrent=True` cada listener recibe los eventos en su propio hilo.
+        """
+        listener = ConcurrentListenerManager() if concurrent else ListenerManager()
         accountability_listener = AccountabilityListener()
         listener.suscribe(accountability_listener)
         self.listener = listener
         return self
 
     def build(self):
-        if not all(
-            [
-                self.payment_processor,
-                self.notifier,
-                self.logger,
-                self.listener,
-                self.validator,
-            ]
-        ):
-            missing = [
-                name
-                for name, value in [
-                    ("payment_processor", self.payment_processor),
-                    ("notifier", self.notifier),
-                    ("logger", self.logger),
-                    ("listener", self.listener),
-                    ("validator", self.validator),
-                ]
-                if value is None
-            ]
-            raise ValueError(f"Faltan componentes en el builder: {', '.join(missing)}")
+        self._check_components(("payment_processor", self.payment_processor))
 
         return PaymentService(
             payment_processor=self.payment_processor,
@@ -141,4 +289,45 @@ class PaymentServiceBuilder:
             validator=self.validator,
             recurring_processor=self.recurring_processor,
             refund_processor=self.refund_processor,
+            idempotency_store=self.idempotency_store,
+            metrics=self.metrics,
+        )
+
+    def build_async(self) -> AsyncPaymentService:
+        """
+        Construye la variante asíncrona del servicio.
+
+        Requiere set_async_payment_processor(); recurrencia y reembolsos se
+        habilitan si el procesador (o el procesador que adapta) los soporta.
+        """
+        self._check_components(
+            ("async_payment_processor", self.async_payment_processor)
         )
+
+        processor = self.async_payment_processor
+        backend = getattr(processor, "wrapped_processor", processor)
+        return AsyncPaymentService(
+            payment_processor=processor,
+            notifier=self.notifier,
+            logger=self.logger,
+            listener=self.listener,
+            validator=self.validator,
+            recurring_processor=(
+                processor if hasattr(backend, "setup_recurring_payment") else None
+            ),
+            refund_processor=processor if hasattr(backend, "refund_payment") else None,
+            idempotency_store=self.idempotency_store,
+            metrics=self.metrics,
+        )
+
+    def _check_components(self, processor: tuple[str, object]) -> None:
+        components = [
+            processor,
+            ("notifier", self.notifier),
+            ("logger", self.logger),
+            ("listener", self.listener),
+            ("validator", self.validator),
+        ]
+        missing = [name for name, value in components if value is None]
+        if missing:
+            raise ValueError(f"Faltan componentes en el builder: {', '.join(missing)}")
@@ -0,0 +1,4 @@
+from .protocol import LookupCacheProtocol
+from .ttl_cache import TTLCache
+
+__all__ = ["LookupCacheProtocol", "TTLCache"]
@@ -0,0 +1,16 @@
+from typing import Protocol
+
+
+class LookupCacheProtocol[K, V](Protocol):
+    """
+    Interfaz de las cachés de consultas (TTLCache u otra implementación,
+    p. ej. respaldada por Redis).
+    """
+
+    def get(self, key: K) -> V | None: ...
+
+    def set(self, key: K, value: V) -> None: ...
+
+    def invalidate(self, key: K) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
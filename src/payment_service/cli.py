@@ -0,0 +1,224 @@
+"""
+Cobro masivo desde un archivo de pagos (CSV o JSONL).
+
+    python -m src.payment_service.cli payments.jsonl --workers 16 --quiet
+
+El archivo pasa por un pipeline de generadores, un bloque a la vez:
+leer y validar el esquema (ingestion.RequestReader) -> validaciones del
+servicio -> enrutar por tipo de pago y moneda -> procesar con `--workers`
+cobros en paralelo -> log. La memoria depende de `--chunk-size`, no del
+tamaño del archivo. Un arreglo JSON se valida entero de una vez, así que no
+se acepta: hay que convertirlo antes a JSONL.
+
+Tras cada bloque se guarda un checkpoint; al volver a ejecutar el mismo
+comando se retoma desde la última fila terminada (`--restart` lo ignora).
+Si el proceso cae a mitad de un bloque, ese bloque se vuelve a enviar, pero
+cada fila se cobra con una clave de idempotencia derivada del archivo y su
+número de fila (Checkpoint.idempotency_key), así la pasarela no la cobra dos
+veces.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
+
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import BatchResult
+from src.payment_service.ingestion import (
+    CSV_SUFFIXES,
+    JSONL_SUFFIXES,
+    Checkpoint,
+    RequestChunk,
+    RequestReader,
+    process_chunks,
+)
+from src.payment_service.metrics import PipelineMetrics
+from src.payment_service.service import PaymentService
+
+_NS_PER_MS = 1_000_000
+
+
+def build_service(args: argparse.Namespace, metrics: PipelineMetrics) -> PaymentService:
+    builder = (
+        PaymentServiceBuilder()
+        .set_routing_processor()
+        .set_routing_notifier()
+        .set_buffered_logger(path=args.log_path)
+        .set_listener()
+        .set_chain_of_validations()
+        .set_metrics(metrics)
+    )
+    if args.rate:
+        builder.set_rate_limit(rate=args.rate)
+    return builder.build()
+
+
+def summarize(chunk: RequestChunk, result: BatchResult) -> dict[str, int]:
+    failures = result.failures
+    return {
+        "succeeded": result.succeeded,
+        "pending": result.pending,
+        "declined": failures["declined"],
+        "invalid": failures["invalid"] + len(chunk.errors),
+        "error": failures["error"],
+    }
+
+
+def rejected_rows(chunk: RequestChunk, result: BatchResult) -> Iterator[dict]:
+    """Filas que no se cobraron: errores de esquema, validación o procesador."""
+    for error in chunk.errors:
+        yield {"row": error.row, "status": "invalid", "errors": list(error.errors)}
+    for item in result.items:
+        if item.status != "processed":
+            yield {
+                "row": chunk.row_of(item.index),
+                "status": item.status,
+                "errors": [item.error],
+            }
+
+
+def run(args: argparse.Namespace, out: TextIO) -> int:
+    if Path(args.path).suffix.lower() not in JSONL_SUFFIXES | CSV_SUFFIXES:
+        print(
+            f"{args.path}: expected a .csv or .jsonl file; JSON arrays are read "
+            "whole, convert them to JSONL first",
+            file=sys.stderr,
+        )
+        return 2
+
+    checkpoint_path = args.checkpoint or f"{args.path}.checkpoint"
+    if args.restart:
+        checkpoint = Checkpoint.for_source(args.path)
+    else:
+        try:
+            checkpoint = Checkpoint.load(checkpoint_path, args.path)
+        except ValueError as e:
+            print(f"{e}; use --restart to start over", file=sys.stderr)
+            return 2
+    if checkpoint.rows_done:
+        print(f"Resuming {args.path} after row {checkpoint.rows_done}", file=out)
+
+    metrics = PipelineMetrics()
+    service = build_service(args, metrics)
+    reader = RequestReader(chunk_size=args.chunk_size)
+    processed = 0
+    exit_code = 0
+    start = time.perf_counter()
+
+    # Las etapas son generadores encadenados: cada bloque se lee, valida,
+    # procesa y registra antes de leer el siguiente
+    chunks = reader.read(args.path, skip_rows=checkpoint.rows_done)
+    results = process_chunks(
+        service,
+        chunks,
+        max_workers=args.workers,
+        idempotency_key=checkpoint.idempotency_key,
+    )
+    with contextlib.ExitStack() as stack:
+        stack.callback(service.logger.close)
+        errors_file = (
+            stack.enter_context(open(args.errors, "a", encoding="utf-8"))
+            if args.errors
+            else None
+        )
+        if args.quiet:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        try:
+            chunk_start = time.perf_counter_ns()
+            for chunk, result in results:
+                if errors_file:
+                    for rejected in rejected_rows(chunk, result):
+                        errors_file.write(json.dumps(rejected) + "\n")
+                    errors_file.flush()
+                # El log va a disco antes que el checkpoint que lo da por hecho
+                service.logger.flush()
+                checkpoint.advance(chunk.last_row, summarize(chunk, result))
+                checkpoint.save(checkpoint_path)
+
+                processed += len(chunk) + len(chunk.errors)
+                metrics.record("cli", "chunk", time.perf_counter_ns() - chunk_start)
+                chunk_start = time.perf_counter_ns()
+        except KeyboardInterrupt:
+            print(
+                f"Interrupted; resume from row {checkpoint.rows_done} by running "
+                "the same command again",
+                file=sys.stderr,
+            )
+            exit_code = 130
+
+    report(out, checkpoint, metrics, processed, time.perf_counter() - start)
+    return exit_code
+
+
+def report(
+    out: TextIO,
+    checkpoint: Checkpoint,
+    metrics: PipelineMetrics,
+    processed: int,
+    elapsed: float,
+) -> None:
+    rate = processed / elapsed if elapsed else 0.0
+    print(
+        f"\nRows this run: {processed} in {elapsed:.2f}s ({rate:,.0f} rows/s)",
+        file=out,
+    )
+    print(f"Last row done: {checkpoint.rows_done}", file=out)
+    print(
+        "Totals: " + ", ".join(f"{k}={v}" for k, v in checkpoint.counts.items()),
+        file=out,
+    )
+
+    print(
+        f"\n{'stage':<22} {'count':>8} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}",
+        file=out,
+    )
+    for (operation, stage), histogram in sorted(metrics.histograms.items()):
+        if not histogram.count:
+            continue
+        percentiles = [histogram.percentile(p) for p in (50, 90, 99)]
+        print(
+            f"{operation + '.' + stage:<22} {histogram.count:>8} "
+            + " ".join(f"{ns / _NS_PER_MS:>7.2f}ms" for ns in percentiles)
+            + f" {(histogram.max or 0) / _NS_PER_MS:>7.2f}ms",
+            file=out,
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="Archivo .csv o .jsonl/.ndjson")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Cobros en paralelo por bloque"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=None, help="Máximo de cobros por segundo"
+    )
+    parser.add_argument(
+        "--checkpoint", default=None, help="Por defecto <path>.checkpoint"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignora el checkpoint existente"
+    )
+    parser.add_argument("--log-path", default="transactions.log")
+    parser.add_argument("--errors", default=None, help="JSONL con las filas rechazadas")
+    parser.add_argument(
+        "--quiet", action="store_true", help="Oculta la salida por pago"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    return run(args, sys.stdout)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
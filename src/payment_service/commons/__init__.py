@@ -1,14 +1,51 @@
+import importlib
+from typing import TYPE_CHECKING
+
+from .batch_result import BatchItemResult, BatchResult
 from .contact import ContactInfo
 from .customer import CustomerData
-from .payment_data import PaymentData, PaymentType
+from .payment_data import (
+    PAYMENT_TYPE_CODES,
+    PAYMENT_TYPES_BY_CODE,
+    PaymentData,
+    PaymentType,
+)
 from .payment_response import PaymentResponse
-from .request import Request
+from .request import Request, RowRequest
+
+if TYPE_CHECKING:
+    from .payment_batch import PaymentBatch, PaymentRow, StringTable
+
+# Los lotes columnares necesitan NumPy (opcional): se importan al usarse
+_LAZY = {
+    "PaymentBatch": ".payment_batch",
+    "PaymentRow": ".payment_batch",
+    "StringTable": ".payment_batch",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    "PAYMENT_TYPES_BY_CODE",
+    "PAYMENT_TYPE_CODES",
+    "BatchItemResult",
+    "BatchResult",
     "ContactInfo",
     "CustomerData",
+    "PaymentBatch",
     "PaymentData",
     "PaymentResponse",
+    "PaymentRow",
     "PaymentType",
     "Request",
+    "RowRequest",
+    "StringTable",
 ]
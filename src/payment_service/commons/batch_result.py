@@ -0,0 +1,53 @@
+from pydantic import BaseModel, Field
+
+from src.payment_service.commons.payment_response import PaymentResponse
+
+# Estados aceptados que todavía no se cobran (p. ej. pagos offline): no son
+# éxitos ni rechazos
+PENDING_STATUSES = frozenset({"pending", "offline_pending"})
+
+
+class BatchItemResult(BaseModel):
+    """Resultado de una fila del lote, en la misma posición que la entrada."""
+
+    index: int
+    status: str  # "processed", "invalid" o "error"
+    response: PaymentResponse | None = None
+    error: str | None = None
+
+
+class BatchResult(BaseModel):
+    """Resultados por fila y resumen de fallos de un lote de transacciones"""
+
+    items: list[BatchItemResult] = Field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(
+            1
+            for item in self.items
+            if item.response is not None and item.response.status == "succeeded"
+        )
+
+    @property
+    def pending(self) -> int:
+        """Pagos aceptados pendientes de cobro, como los offline."""
+        return sum(
+            1
+            for item in self.items
+            if item.response is not None and item.response.status in PENDING_STATUSES
+        )
+
+    @property
+    def failures(self) -> dict[str, int]:
+        """Cuenta los fallos por etapa: validación, error del procesador o rechazo."""
+        summary = {"invalid": 0, "error": 0, "declined": 0}
+        for item in self.items:
+            if item.status != "processed":
+                summary[item.status] += 1
+            elif item.response is not None and not (
+                item.response.status == "succeeded"
+                or item.response.status in PENDING_STATUSES
+            ):
+                summary["declined"] += 1
+        return summary
@@ -0,0 +1,215 @@
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import overload
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "PaymentBatch requiere NumPy: pip install 'solid-design-patterns[batch]'"
+    ) from e
+
+from .payment_data import (
+    PAYMENT_TYPE_CODES,
+    PAYMENT_TYPES_BY_CODE,
+    PaymentData,
+    PaymentType,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StringTable:
+    """
+    Columna de textos en un solo buffer UTF-8.
+
+    La fila i es `blob[starts[i]:ends[i]]`. `starts` y `ends` son vistas del
+    mismo array de offsets, así cualquier slice es otra vista sin copiar.
+    """
+
+    blob: bytes
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "StringTable":
+        encoded = [value.encode() for value in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(b"".join(encoded), offsets[:-1], offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> str:
+        return self.blob[self.starts[index] : self.ends[index]].decode()
+
+    def slice(self, rows: slice) -> "StringTable":
+        return StringTable(self.blob, self.starts[rows], self.ends[rows])
+
+    def present(self) -> np.ndarray:
+        """Máscara de filas con texto no vacío."""
+        return self.ends > self.starts
+
+
+class PaymentRow:
+    """
+    Vista ligera de una fila de PaymentBatch.
+
+    Expone `amount`, `source`, `currency` y `type` como PaymentData, así los
+    procesadores, los loggers y la cadena de validación (vía RowRequest) la
+    aceptan sin crear modelos. `to_payment_data()` la convierte cuando hace
+    falta un modelo pydantic.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "PaymentBatch", index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    @property
+    def amount(self) -> int:
+        return int(self._batch.amounts[self._index])
+
+    @property
+    def source(self) -> str:
+        return self._batch.sources[self._index]
+
+    @property
+    def currency(self) -> str:
+        return self._batch.currencies[self._batch.currency_codes[self._index]]
+
+    @property
+    def type(self) -> PaymentType:
+        return PAYMENT_TYPES_BY_CODE[self._batch.type_codes[self._index]]
+
+    @property
+    def customer_ref(self) -> str:
+        return self._batch.customer_refs[self._index]
+
+    def to_payment_data(self) -> PaymentData:
+        return PaymentData(
+            amount=self.amount,
+            source=self.source,
+            currency=self.currency,
+            type=self.type,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"PaymentRow(amount={self.amount}, source={self.source!r}, "
+            f"currency={self.currency!r}, type={self.type}, "
+            f"customer_ref={self.customer_ref!r})"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentBatch:
+    """
+    Lote columnar de pagos para cargas masivas.
+
+    Los importes son un array int64; monedas y tipos de pago se guardan como
+    códigos enteros pequeños (índices en `currencies` y PAYMENT_TYPE_CODES);
+    sources y referencias de cliente van en StringTables. Un millón de filas
+    ocupa decenas de MB en lugar de los GB de un millón de PaymentData.
+
+    Los slices (`batch[a:b]`) son vistas sin copia y la iteración produce
+    PaymentRow.
+    """
+
+    amounts: np.ndarray
+    type_codes: np.ndarray
+    currency_codes: np.ndarray
+    currencies: tuple[str, ...]
+    sources: StringTable
+    customer_refs: StringTable
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[int, str, str, PaymentType, str]]
+    ) -> "PaymentBatch":
+        """
+        Construye el lote desde tuplas
+        (amount, source, currency, payment_type, customer_ref).
+        """
+        currency_index: dict[str, int] = {}
+        amounts: list[int] = []
+        type_codes: list[int] = []
+        currency_codes: list[int] = []
+        sources: list[str] = []
+        customer_refs: list[str] = []
+        for amount, source, currency, payment_type, customer_ref in rows:
+            amounts.append(amount)
+            type_codes.append(PAYMENT_TYPE_CODES[payment_type])
+            currency_codes.append(
+                currency_index.setdefault(currency, len(currency_index))
+            )
+            sources.append(source)
+            customer_refs.append(customer_ref)
+
+        return cls(
+            amounts=np.array(amounts, dtype=np.int64),
+            type_codes=np.array(type_codes, dtype=np.uint8),
+            currency_codes=np.array(currency_codes, dtype=np.uint16),
+            currencies=tuple(currency_index),
+            sources=StringTable.from_strings(sources),
+            customer_refs=StringTable.from_strings(customer_refs),
+        )
+
+    @classmethod
+    def from_payments(
+        cls,
+        payments: Iterable[PaymentData],
+        customer_refs: Sequence[str] | None = None,
+    ) -> "PaymentBatch":
+        payments = list(payments)
+        refs = customer_refs if customer_refs is not None else [""] * len(payments)
+        return cls.from_rows(
+            (p.amount, p.source, p.currency, p.type, ref)
+            for p, ref in zip(payments, refs, strict=True)
+        )
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @overload
+    def __getitem__(self, index: int) -> PaymentRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PaymentBatch": ...
+
+    def __getitem__(self, index: int | slice) -> "PaymentRow | PaymentBatch":
+        if isinstance(index, slice):
+            return PaymentBatch(
+                amounts=self.amounts[index],
+                type_codes=self.type_codes[index],
+                currency_codes=self.currency_codes[index],
+                currencies=self.currencies,
+                sources=self.sources.slice(index),
+                customer_refs=self.customer_refs.slice(index),
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PaymentBatch index out of range")
+        return PaymentRow(self, index)
+
+    def __iter__(self) -> Iterator[PaymentRow]:
+        for index in range(len(self)):
+            yield PaymentRow(self, index)
+
+    def source_present(self) -> np.ndarray:
+        """Máscara de filas con source, para BatchPaymentValidator."""
+        return self.sources.present()
+
+    def nbytes(self) -> int:
+        """Memoria aproximada de las columnas (sin contar vistas compartidas)."""
+        return (
+            self.amounts.nbytes
+            + self.type_codes.nbytes
+            + self.currency_codes.nbytes
+            + len(self.sources.blob)
+            + self.sources.starts.nbytes
+            + len(self.customer_refs.blob)
+            + self.customer_refs.starts.nbytes
+        )
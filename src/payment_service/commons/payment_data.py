@@ -8,6 +8,14 @@ class PaymentType(Enum):
     ONLINE = "online"
 
 
+# Códigos enteros de PaymentType para lotes columnares (arrays de enteros)
+PAYMENT_TYPE_CODES: dict[PaymentType, int] = {
+    PaymentType.OFFLINE: 0,
+    PaymentType.ONLINE: 1,
+}
+PAYMENT_TYPES_BY_CODE: tuple[PaymentType, ...] = tuple(PAYMENT_TYPE_CODES)
+
+
 class PaymentData(BaseModel):
     amount: int
     source: str
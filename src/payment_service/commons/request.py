@@ -1,8 +1,51 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
 from pydantic import BaseModel
 
 from src.payment_service.commons import CustomerData, PaymentData
 
+if TYPE_CHECKING:
+    from .payment_batch import PaymentRow
+
 
 class Request(BaseModel):
     customer_data: CustomerData
     payment_data: PaymentData
+
+    @classmethod
+    def of(
+        cls, customer_data: CustomerData, payment_data: "PaymentData | PaymentRow"
+    ) -> "Self | RowRequest":
+        """
+        Request para los validadores.
+
+        Una PaymentRow de PaymentBatch se envuelve en un RowRequest en lugar de
+        materializarse como PaymentData.
+        """
+        if not isinstance(payment_data, PaymentData) and hasattr(
+            payment_data, "to_payment_data"
+        ):
+            return RowRequest(customer_data, payment_data)
+        return cls(customer_data=customer_data, payment_data=payment_data)
+
+
+@dataclass(frozen=True, slots=True)
+class RowRequest:
+    """
+    Request de una fila de PaymentBatch.
+
+    Los validadores, procesadores y loggers leen de la fila los mismos
+    atributos que de un PaymentData, así un lote de un millón de filas no crea
+    un millón de modelos. `model_dump_json` materializa la fila solo para la
+    huella de idempotencia.
+    """
+
+    customer_data: CustomerData
+    payment_data: "PaymentRow"
+
+    def model_dump_json(self) -> str:
+        return Request(
+            customer_data=self.customer_data,
+            payment_data=self.payment_data.to_payment_data(),
+        ).model_dump_json()
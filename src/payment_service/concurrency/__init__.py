@@ -0,0 +1,3 @@
+from .single_flight import AsyncSingleFlight, SingleFlight
+
+__all__ = ["AsyncSingleFlight", "SingleFlight"]
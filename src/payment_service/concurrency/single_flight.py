@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Call[V]:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: V | None = None
+    error: BaseException | None = None
+
+
+@dataclass
+class SingleFlight[K, V]:
+    """
+    Coalesce llamadas concurrentes con la misma clave (hilos).
+
+    Mientras una llamada para `key` está en curso, los demás llamadores con la
+    misma clave esperan y reciben su resultado (o su excepción) en lugar de
+    repetir el trabajo. `shared` cuenta las llamadas que se ahorraron.
+    """
+
+    shared: int = field(default=0, init=False)
+    _calls: dict[K, _Call[V]] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+@dataclass
+class AsyncSingleFlight[K, V]:
+    """
+    Versión asyncio de SingleFlight para corrutinas del mismo event loop.
+
+    La llamada corre en su propia tarea y cada llamador la espera con
+    `asyncio.shield`: si se cancela quien la inició, los demás siguen
+    esperando el resultado en lugar de recibir esa cancelación.
+    """
+
+    shared: int = field(default=0, init=False)
+    _calls: dict[K, asyncio.Future[V]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: K, task: asyncio.Future[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Marcada como recuperada aunque nadie espere
@@ -1,5 +1,7 @@
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
+from src.payment_service.commons.batch_result import BatchResult
 from src.payment_service.commons.customer import CustomerData
 from src.payment_service.commons.payment_data import PaymentData
 from src.payment_service.commons.payment_response import PaymentResponse
@@ -12,9 +14,19 @@ class PaymentServiceDecoratorProtocol(Protocol):
     wrapped_service: PaymentServiceProtocol
 
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse: ...
 
+    def process_batch(
+        self,
+        transactions: Iterable[tuple[CustomerData, PaymentData]],
+        max_workers: int = 8,
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchResult: ...
+
     def process_refund(self, transaction_id: str) -> PaymentResponse: ...
 
     def setup_recurring(
@@ -1,27 +1,191 @@
+import threading
+from collections.abc import Callable
+from typing import ClassVar
+
 from src.payment_service.commons import PaymentData, PaymentType
 from src.payment_service.processors import (
-    LocalPaymentProcessor,
-    OfflinePaymentProcessor,
+    AsyncPaymentProcessorProtocol,
     PaymentProcessorProtocol,
-    StripePaymentProcessor,
 )
 
+# Clave de moneda que aplica cuando no hay una ruta para la moneda concreta
+ANY_CURRENCY = "*"
+
+
+class _Route[P]:
+    """Entrada de la tabla: crea el procesador una sola vez y lo reutiliza."""
+
+    __slots__ = ("_instance", "_lock", "create", "shared")
+
+    def __init__(self, create: Callable[[], P], shared: bool = True) -> None:
+        self.create = create
+        self.shared = shared
+        self._instance: P | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> P:
+        if not self.shared:
+            return self.create()
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self.create()
+                instance = self._instance
+        return instance
+
+
+type _Table[P] = dict[PaymentType, dict[str, _Route[P]]]
+
+
+# Constructores de las rutas por defecto. Importan el procesador al crearlo,
+# así el SDK de Stripe solo se carga si se usa una ruta de Stripe.
+def _offline() -> PaymentProcessorProtocol:
+    from src.payment_service.processors import OfflinePaymentProcessor
+
+    return OfflinePaymentProcessor()
+
+
+def _local() -> PaymentProcessorProtocol:
+    from src.payment_service.processors import LocalPaymentProcessor
+
+    return LocalPaymentProcessor()
+
+
+def _stripe() -> PaymentProcessorProtocol:
+    from src.payment_service.processors import StripePaymentProcessor
+
+    return StripePaymentProcessor()
+
+
+def _async_adapted(
+    create: Callable[[], PaymentProcessorProtocol],
+) -> Callable[[], AsyncPaymentProcessorProtocol]:
+    def create_async() -> AsyncPaymentProcessorProtocol:
+        from src.payment_service.processors import AsyncProcessorAdapter
+
+        return AsyncProcessorAdapter(create())
+
+    return create_async
+
+
+def _async_stripe() -> AsyncPaymentProcessorProtocol:
+    from src.payment_service.processors import AsyncStripePaymentProcessor
+
+    return AsyncStripePaymentProcessor()
+
 
 class PaymentProcessorFactory:
-    @staticmethod
+    """
+    Factory Method con tabla de rutas (tipo de pago, moneda) -> procesador.
+
+    Cada ruta crea su procesador la primera vez que se pide y después devuelve
+    siempre la misma instancia (los procesadores son seguros entre hilos), así
+    Stripe se configura una sola vez. Resolver una ruta son dos búsquedas en
+    diccionarios sin crear objetos. Se pueden registrar rutas nuevas en
+    tiempo de ejecución con `register`.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _routes: ClassVar[_Table[PaymentProcessorProtocol]] = {
+        PaymentType.OFFLINE: {ANY_CURRENCY: _Route(_offline)},
+        PaymentType.ONLINE: {
+            "MXN": _Route(_stripe),
+            ANY_CURRENCY: _Route(_local),
+        },
+    }
+    _async_routes: ClassVar[_Table[AsyncPaymentProcessorProtocol]] = {
+        PaymentType.OFFLINE: {ANY_CURRENCY: _Route(_async_adapted(_offline))},
+        PaymentType.ONLINE: {
+            # Compartido: el procesador crea un cliente httpx por event loop
+            "MXN": _Route(_async_stripe),
+            ANY_CURRENCY: _Route(_async_adapted(_local)),
+        },
+    }
+
+    @classmethod
+    def register(
+        cls,
+        payment_type: PaymentType,
+        currency: str,
+        create: Callable[[], PaymentProcessorProtocol],
+        shared: bool = True,
+    ) -> None:
+        """
+        Registra (o reemplaza) la ruta de un tipo de pago y moneda.
+
+        `currency=ANY_CURRENCY` define la ruta por defecto del tipo de pago y
+        `shared=False` crea un procesador nuevo en cada llamada.
+        """
+        with cls._lock:
+            cls._routes = cls._with_route(
+                cls._routes, payment_type, currency, _Route(create, shared)
+            )
+
+    @classmethod
+    def register_async(
+        cls,
+        payment_type: PaymentType,
+        currency: str,
+        create: Callable[[], AsyncPaymentProcessorProtocol],
+        shared: bool = True,
+    ) -> None:
+        """Como `register`, para los procesadores asíncronos."""
+        with cls._lock:
+            cls._async_routes = cls._with_route(
+                cls._async_routes, payment_type, currency, _Route(create, shared)
+            )
+
+    @classmethod
     def create_payment_processor(
+        cls,
         payment_data: PaymentData,
     ) -> PaymentProcessorProtocol:
-        """Crea un procesador de pagos basado en el tipo de pago"""
-        match payment_data.type:
-            case PaymentType.OFFLINE:
-                return OfflinePaymentProcessor()
-            case PaymentType.ONLINE:
-                match payment_data.currency:
-                    case "MXN":
-                        return StripePaymentProcessor()
-                    case _:
-                        return LocalPaymentProcessor()
-
-            case _:
-                raise ValueError("Tipo de pago no soportado")
+        """Devuelve el procesador de pagos para el tipo de pago y la moneda"""
+        return cls._resolve(cls._routes, payment_data.type, payment_data.currency).get()
+
+    @classmethod
+    def processor_for(
+        cls, payment_type: PaymentType, currency: str = ANY_CURRENCY
+    ) -> PaymentProcessorProtocol:
+        """Procesador de una ruta concreta, sin necesitar un PaymentData."""
+        return cls._resolve(cls._routes, payment_type, currency).get()
+
+    @classmethod
+    def create_async_payment_processor(
+        cls,
+        payment_data: PaymentData,
+    ) -> AsyncPaymentProcessorProtocol:
+        """
+        Devuelve el procesador asíncrono para el tipo de pago y la moneda.
+
+        Stripe usa su cliente asíncrono nativo; el resto de procesadores son
+        locales y se adaptan ejecutándolos en un hilo.
+        """
+        return cls._resolve(
+            cls._async_routes, payment_data.type, payment_data.currency
+        ).get()
+
+    @staticmethod
+    def _resolve[P](
+        routes: _Table[P], payment_type: PaymentType, currency: str
+    ) -> _Route[P]:
+        by_currency = routes.get(payment_type)
+        if by_currency is not None:
+            route = by_currency.get(currency) or by_currency.get(ANY_CURRENCY)
+            if route is not None:
+                return route
+        raise ValueError("Tipo de pago no soportado")
+
+    @staticmethod
+    def _with_route[P](
+        routes: _Table[P],
+        payment_type: PaymentType,
+        currency: str,
+        route: _Route[P],
+    ) -> _Table[P]:
+        # Copy-on-write: las lecturas no toman el lock y siempre ven una
+        # tabla completa
+        table = {key: dict(by_currency) for key, by_currency in routes.items()}
+        table.setdefault(payment_type, {})[currency] = route
+        return table
@@ -0,0 +1,4 @@
+from .key import fingerprint
+from .store import IdempotencyStore
+
+__all__ = ["IdempotencyStore", "fingerprint"]
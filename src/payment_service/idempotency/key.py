@@ -0,0 +1,9 @@
+import hashlib
+
+from src.payment_service.commons import Request
+
+
+def fingerprint(request: Request) -> str:
+    """Deriva una clave de idempotencia estable a partir del contenido del Request."""
+    digest = hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+    return f"req-{digest[:32]}"
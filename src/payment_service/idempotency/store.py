@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+
+from src.payment_service.cache import TTLCache
+from src.payment_service.commons import PaymentResponse
+
+
+@dataclass
+class IdempotencyStore:
+    """
+    Guarda las respuestas completadas por clave de idempotencia.
+
+    Un reintento con la misma clave dentro de la ventana `ttl_seconds` recibe la
+    respuesta guardada sin volver a llamar a la pasarela. Solo se guardan las
+    respuestas que llegaron a la pasarela (con transaction_id), para que un
+    fallo de red pueda reintentarse.
+
+    Sin clave explícita solo se detectan los dobles envíos inmediatos (doble
+    clic, reintento del cliente) por la huella del contenido, con la ventana
+    corta `fingerprint_ttl_seconds`: dos compras iguales y legítimas del mismo
+    cliente, separadas más que esa ventana, se cobran las dos.
+    """
+
+    max_entries: int = 10_000
+    ttl_seconds: float = 24 * 3600.0
+    fingerprint_ttl_seconds: float = 60.0
+    _responses: TTLCache[str, PaymentResponse] = field(init=False, repr=False)
+    _recent: TTLCache[str, PaymentResponse] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._responses = TTLCache(
+            max_entries=self.max_entries, ttl_seconds=self.ttl_seconds
+        )
+        self._recent = TTLCache(
+            max_entries=self.max_entries, ttl_seconds=self.fingerprint_ttl_seconds
+        )
+
+    def get(self, key: str) -> PaymentResponse | None:
+        return self._responses.get(key)
+
+    def save(self, key: str, response: PaymentResponse) -> None:
+        if response.transaction_id:
+            self._responses.set(key, response)
+
+    def get_recent(self, fingerprint: str) -> PaymentResponse | None:
+        """Respuesta de un Request idéntico dentro de la ventana corta."""
+        return self._recent.get(fingerprint)
+
+    def save_recent(self, fingerprint: str, response: PaymentResponse) -> None:
+        if response.transaction_id:
+            self._recent.set(fingerprint, response)
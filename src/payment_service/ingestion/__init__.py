@@ -0,0 +1,16 @@
+from .checkpoint import Checkpoint
+from .chunk import RequestChunk, RowError
+from .pipeline import process_chunks, process_chunks_async
+from .reader import CSV_COLUMNS, CSV_SUFFIXES, JSONL_SUFFIXES, RequestReader
+
+__all__ = [
+    "CSV_COLUMNS",
+    "CSV_SUFFIXES",
+    "JSONL_SUFFIXES",
+    "Checkpoint",
+    "RequestChunk",
+    "RequestReader",
+    "RowError",
+    "process_chunks",
+    "process_chunks_async",
+]
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progreso de un archivo procesado en bloques, para retomarlo tras una caída.
+
+    `rows_done` es la última fila cuyo bloque terminó (procesado y registrado);
+    los contadores acumulan los resultados de todas las ejecuciones. `size` y
+    `mtime_ns` identifican la versión del archivo: un checkpoint de otro
+    archivo, o del mismo modificado, no se aplica.
+
+    `idempotency_key(row)` da la clave de cobro de cada fila de esa versión:
+    al retomar, las filas del bloque que se repite llevan la misma clave y la
+    pasarela no las cobra otra vez.
+    """
+
+    source: str
+    size: int
+    mtime_ns: int
+    rows_done: int = 0
+    counts: dict[str, int] = field(
+        default_factory=lambda: {
+            "succeeded": 0,
+            "pending": 0,
+            "declined": 0,
+            "invalid": 0,
+            "error": 0,
+        }
+    )
+
+    @classmethod
+    def for_source(cls, source: str | os.PathLike[str]) -> "Checkpoint":
+        path = Path(source).resolve()
+        stat = path.stat()
+        return cls(source=str(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], source: str | os.PathLike[str]
+    ) -> "Checkpoint":
+        """
+        Checkpoint guardado para `source`, o uno nuevo si no hay.
+
+        Lanza ValueError si el guardado corresponde a otro archivo.
+        """
+        fresh = cls.for_source(source)
+        try:
+            with open(path, encoding="utf-8") as file:
+                saved = cls(**json.load(file))
+        except FileNotFoundError:
+            return fresh
+        if (saved.source, saved.size, saved.mtime_ns) != (
+            fresh.source,
+            fresh.size,
+            fresh.mtime_ns,
+        ):
+            raise ValueError(f"Checkpoint {path} belongs to another file or version")
+        return saved
+
+    def idempotency_key(self, row: int) -> str:
+        """Clave determinista de la fila `row` de esta versión del archivo."""
+        identity = f"{self.source}\0{self.size}\0{self.mtime_ns}\0{row}"
+        return "bulk-" + hashlib.sha256(identity.encode()).hexdigest()[:32]
+
+    def advance(self, rows_done: int, counts: dict[str, int]) -> None:
+        self.rows_done = max(self.rows_done, rows_done)
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Escritura atómica: archivo temporal + fsync + os.replace, así una caída
+        deja el checkpoint anterior o el nuevo, nunca uno a medias.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(asdict(self), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
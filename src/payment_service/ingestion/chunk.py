@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+
+from src.payment_service.commons import CustomerData, PaymentData, Request
+
+
+@dataclass(frozen=True, slots=True)
+class RowError:
+    """Fila del archivo que no pasó la validación del esquema."""
+
+    row: int  # 1-based: línea en JSONL, posición del elemento en un arreglo JSON
+    errors: tuple[str, ...]
+
+    def __str__(self) -> str:
+        return f"row {self.row}: " + "; ".join(self.errors)
+
+
+@dataclass(slots=True)
+class RequestChunk:
+    """
+    Bloque de Requests ya validados, listo para `PaymentService.process_batch`.
+
+    `rows[i]` es la fila del archivo de `requests[i]`, así los índices del
+    BatchResult se traducen a filas con `row_of`. `errors` son las filas del
+    bloque que no se pudieron validar.
+    """
+
+    requests: list[Request] = field(default_factory=list)
+    rows: list[int] = field(default_factory=list)
+    errors: list[RowError] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def transactions(self) -> list[tuple[CustomerData, PaymentData]]:
+        return [
+            (request.customer_data, request.payment_data) for request in self.requests
+        ]
+
+    def row_of(self, index: int) -> int:
+        return self.rows[index]
+
+    @property
+    def last_row(self) -> int:
+        """Última fila del archivo cubierta por el bloque (válida o no)."""
+        return max(
+            self.rows[-1] if self.rows else 0,
+            self.errors[-1].row if self.errors else 0,
+        )
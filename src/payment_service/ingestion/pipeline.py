@@ -0,0 +1,64 @@
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+
+from src.payment_service.async_service_protocol import AsyncPaymentServiceProtocol
+from src.payment_service.commons import BatchResult
+from src.payment_service.service_protocol import PaymentServiceProtocol
+
+from .chunk import RequestChunk
+
+
+def process_chunks(
+    service: PaymentServiceProtocol,
+    chunks: Iterable[RequestChunk],
+    max_workers: int = 8,
+    idempotency_key: Callable[[int], str] | None = None,
+) -> Iterator[tuple[RequestChunk, BatchResult]]:
+    """
+    Envía cada bloque validado a `process_batch` y devuelve su resultado.
+
+    Los índices del BatchResult son posiciones dentro del bloque; `chunk.row_of`
+    los traduce a filas del archivo. Los bloques se procesan de uno en uno,
+    así la memoria no crece con el tamaño del archivo. `idempotency_key`
+    convierte el número de fila en la clave de idempotencia de su cobro.
+    """
+    for chunk in chunks:
+        if not chunk.requests:
+            yield chunk, BatchResult()
+            continue
+        yield (
+            chunk,
+            service.process_batch(
+                chunk.transactions(),
+                max_workers=max_workers,
+                idempotency_keys=_keys(chunk, idempotency_key),
+            ),
+        )
+
+
+async def process_chunks_async(
+    service: AsyncPaymentServiceProtocol,
+    chunks: Iterable[RequestChunk],
+    max_concurrency: int = 100,
+    idempotency_key: Callable[[int], str] | None = None,
+) -> AsyncIterator[tuple[RequestChunk, BatchResult]]:
+    """Como `process_chunks`, con el servicio asíncrono."""
+    for chunk in chunks:
+        if not chunk.requests:
+            yield chunk, BatchResult()
+            continue
+        yield (
+            chunk,
+            await service.process_batch(
+                chunk.transactions(),
+                max_concurrency=max_concurrency,
+                idempotency_keys=_keys(chunk, idempotency_key),
+            ),
+        )
+
+
+def _keys(
+    chunk: RequestChunk, idempotency_key: Callable[[int], str] | None
+) -> list[str] | None:
+    if idempotency_key is None:
+        return None
+    return [idempotency_key(row) for row in chunk.rows]
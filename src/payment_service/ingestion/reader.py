@@ -0,0 +1,253 @@
+import csv
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from src.payment_service.commons import (
+    ContactInfo,
+    CustomerData,
+    PaymentData,
+    Request,
+)
+
+from .chunk import RequestChunk, RowError
+
+type Buffer = bytes | bytearray | mmap.mmap
+type Source = str | os.PathLike[str] | Buffer
+
+JSONL_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+CSV_SUFFIXES = frozenset({".csv"})
+
+# Columnas del CSV plano -> (modelo, campo) del Request anidado
+CSV_COLUMNS = {
+    "name": ("customer_data", "name"),
+    "customer_id": ("customer_data", "customer_id"),
+    "email": ("contact_info", "email"),
+    "phone": ("contact_info", "phone"),
+    "amount": ("payment_data", "amount"),
+    "source": ("payment_data", "source"),
+    "currency": ("payment_data", "currency"),
+    "type": ("payment_data", "type"),
+}
+
+# Columnas de campos sin default: una celda vacía se pasa como "" (p. ej. el
+# source de un pago offline) en lugar de omitir el campo
+_REQUIRED_COLUMNS = frozenset(
+    column
+    for column, (model, name) in CSV_COLUMNS.items()
+    if {
+        "customer_data": CustomerData,
+        "contact_info": ContactInfo,
+        "payment_data": PaymentData,
+    }[model]
+    .model_fields[name]
+    .is_required()
+)
+
+
+def _row_errors(error: ValidationError) -> tuple[str, ...]:
+    return tuple(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'input'}: {detail['msg']}"
+        for detail in error.errors(include_url=False)
+    )
+
+
+@dataclass
+class RequestReader:
+    """
+    Lee archivos de pagos (JSON o JSONL) y los valida en bloques.
+
+    Cada bloque de `chunk_size` filas se valida con una sola llamada a
+    `TypeAdapter.validate_json` (el parser y la validación corren en el núcleo
+    en Rust de pydantic), sin crear diccionarios intermedios en Python. Solo
+    si el bloque trae filas inválidas se vuelve a validar fila por fila para
+    conservar las válidas y reportar el error de cada una.
+
+    Las rutas se leen con mmap: JSONL se recorre por líneas con memoria
+    acotada al bloque; un arreglo JSON es un único documento y se valida
+    entero antes de repartirlo en bloques. Los CSV (columnas de CSV_COLUMNS)
+    se leen como texto en streaming y se validan con `validate_python`.
+
+    `skip_rows` descarta sin validar las filas con número menor o igual, para
+    retomar un archivo desde un checkpoint.
+    """
+
+    chunk_size: int = 1000
+    _many: TypeAdapter[list[Request]] = field(
+        default_factory=lambda: TypeAdapter(list[Request]), init=False, repr=False
+    )
+    _one: TypeAdapter[Request] = field(
+        default_factory=lambda: TypeAdapter(Request), init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+    def read(
+        self, path: str | os.PathLike[str], skip_rows: int = 0
+    ) -> Iterator[RequestChunk]:
+        """Elige el formato por la extensión: .jsonl/.ndjson, .csv o JSON."""
+        suffix = Path(path).suffix.lower()
+        if suffix in JSONL_SUFFIXES:
+            return self.read_jsonl(path, skip_rows)
+        if suffix in CSV_SUFFIXES:
+            return self.read_csv(path, skip_rows)
+        return self.read_json(path, skip_rows)
+
+    def read_jsonl(self, source: Source, skip_rows: int = 0) -> Iterator[RequestChunk]:
+        """Un Request por línea; las líneas vacías se ignoran."""
+        with _buffer(source) as buffer:
+            lines: list[bytes] = []
+            rows: list[int] = []
+            for row, line in enumerate(_lines(buffer), start=1):
+                if row <= skip_rows or not line.strip():
+                    continue
+                lines.append(line)
+                rows.append(row)
+                if len(lines) == self.chunk_size:
+                    yield self._validate_lines(lines, rows)
+                    lines, rows = [], []
+            if lines:
+                yield self._validate_lines(lines, rows)
+
+    def read_json(self, source: Source, skip_rows: int = 0) -> Iterator[RequestChunk]:
+        """
+        Un arreglo JSON de Requests.
+
+        No es streaming: el documento se copia entero a memoria y se valida de
+        una vez antes de repartirlo en bloques. Para archivos grandes, JSONL o
+        CSV mantienen la memoria acotada al bloque.
+        """
+        with _buffer(source) as buffer:
+            data = buffer[:] if isinstance(buffer, mmap.mmap) else buffer
+        try:
+            requests = self._many.validate_json(data)
+        except ValidationError as e:
+            if any(not detail["loc"] for detail in e.errors(include_url=False)):
+                raise ValueError(f"Invalid payments file: {e}") from e
+            yield from self._validate_items(from_json(data)[skip_rows:], skip_rows)
+            return
+
+        for start in range(skip_rows, len(requests), self.chunk_size):
+            block = requests[start : start + self.chunk_size]
+            yield RequestChunk(
+                requests=block, rows=list(range(start + 1, start + len(block) + 1))
+            )
+
+    def read_csv(
+        self, path: str | os.PathLike[str], skip_rows: int = 0
+    ) -> Iterator[RequestChunk]:
+        """
+        CSV con cabecera; las filas se numeran por línea del archivo (la
+        cabecera es la línea 1). Las celdas vacías toman el valor por defecto, o
+        "" en los campos que no lo tienen (como `source` en un pago offline).
+        """
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.DictReader(file)
+            items: list[dict] = []
+            rows: list[int] = []
+            for record in reader:
+                row = reader.line_num
+                if row <= skip_rows:
+                    continue
+                items.append(_nest(record))
+                rows.append(row)
+                if len(items) == self.chunk_size:
+                    yield self._validate_records(items, rows)
+                    items, rows = [], []
+            if items:
+                yield self._validate_records(items, rows)
+
+    def _validate_lines(self, lines: list[bytes], rows: list[int]) -> RequestChunk:
+        try:
+            requests = self._many.validate_json(b"[" + b",".join(lines) + b"]")
+        except ValidationError:
+            pass  # Al menos una fila inválida: se separan fila por fila
+        else:
+            # Una línea con varios objetos ("{...},{...}") también es un
+            # arreglo válido al unirla: si no hay un Request por línea, las
+            # filas quedarían desalineadas y se validan una por una
+            if len(requests) == len(lines):
+                return RequestChunk(requests=requests, rows=rows)
+
+        chunk = RequestChunk()
+        for row, line in zip(rows, lines, strict=True):
+            try:
+                chunk.requests.append(self._one.validate_json(line))
+                chunk.rows.append(row)
+            except ValidationError as e:
+                chunk.errors.append(RowError(row, _row_errors(e)))
+        return chunk
+
+    def _validate_records(self, items: list[dict], rows: list[int]) -> RequestChunk:
+        try:
+            return RequestChunk(requests=self._many.validate_python(items), rows=rows)
+        except ValidationError:
+            pass  # Igual que en JSONL: se separan fila por fila
+
+        chunk = RequestChunk()
+        for row, item in zip(rows, items, strict=True):
+            try:
+                chunk.requests.append(self._one.validate_python(item))
+                chunk.rows.append(row)
+            except ValidationError as e:
+                chunk.errors.append(RowError(row, _row_errors(e)))
+        return chunk
+
+    def _validate_items(
+        self, items: list, skip_rows: int = 0
+    ) -> Iterator[RequestChunk]:
+        for start in range(0, len(items), self.chunk_size):
+            block = items[start : start + self.chunk_size]
+            first_row = skip_rows + start + 1
+            yield self._validate_records(
+                block, list(range(first_row, first_row + len(block)))
+            )
+
+
+@contextmanager
+def _buffer(source: Source) -> Iterator[Buffer]:
+    """Los buffers se usan tal cual; las rutas se abren con mmap de solo lectura."""
+    if isinstance(source, bytes | bytearray | mmap.mmap):
+        yield source
+        return
+    with open(source, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""  # mmap no admite archivos vacíos
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _nest(record: dict[str, str | None]) -> dict:
+    """Convierte una fila plana del CSV en el dict anidado de Request."""
+    nested: dict[str, dict] = {
+        "customer_data": {},
+        "contact_info": {},
+        "payment_data": {},
+    }
+    for column, value in record.items():
+        target = CSV_COLUMNS.get(column)
+        if target is not None and (value or column in _REQUIRED_COLUMNS):
+            model, name = target
+            nested[model][name] = value or ""
+    nested["customer_data"]["contact_info"] = nested.pop("contact_info")
+    return nested
+
+
+def _lines(buffer: Buffer) -> Iterator[bytes]:
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield buffer[start:end]
+        start = end + 1
@@ -1,5 +1,23 @@
 from src.payment_service.listeners.accountability_listener import AccountabilityListener
+from src.payment_service.listeners.concurrent_manager import ConcurrentListenerManager
+from src.payment_service.listeners.events import (
+    PaymentEvent,
+    PaymentFailed,
+    PaymentSucceeded,
+    RefundProcessed,
+    SubscriptionCreated,
+)
 from src.payment_service.listeners.lsitener import Listener
 from src.payment_service.listeners.manager import ListenerManager
 
-__all__ = ["AccountabilityListener", "ListenerManager", "Listener"]
+__all__ = [
+    "AccountabilityListener",
+    "ConcurrentListenerManager",
+    "Listener",
+    "ListenerManager",
+    "PaymentEvent",
+    "PaymentFailed",
+    "PaymentSucceeded",
+    "RefundProcessed",
+    "SubscriptionCreated",
+]
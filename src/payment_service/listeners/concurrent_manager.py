@@ -0,0 +1,183 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from src.payment_service.listeners.lsitener import Listener
+from src.payment_service.listeners.manager import ListenerManager
+
+_STOP = object()
+
+
+@dataclass
+class _ListenerWorker:
+    """
+    Cola y hilo propios de un listener, con sus contadores.
+
+    El hilo del worker no llama al listener directamente: le pasa cada evento a
+    un hilo de handler y espera el resultado como mucho `handler_timeout`
+    segundos. Si vence, el evento cuenta como timeout y el handler colgado se
+    abandona (Python no puede matar hilos) y se arranca otro, así un listener
+    que se cuelga no bloquea su cola para siempre.
+    """
+
+    listener: Listener
+    max_queue_size: int
+    handler_timeout: float
+    processed: int = 0
+    errors: int = 0
+    dropped: int = 0
+    timeouts: int = 0
+    last_lag: float = 0.0
+    events: queue.Queue = field(init=False)
+    thread: threading.Thread = field(init=False)
+    _calls: queue.SimpleQueue = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.events = queue.Queue(maxsize=self.max_queue_size)
+        self._start_handler()
+        self.thread = threading.Thread(
+            target=self._work,
+            name=f"listener-{type(self.listener).__name__}",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def _start_handler(self) -> None:
+        self._calls = queue.SimpleQueue()
+        threading.Thread(
+            target=self._handle,
+            args=(self._calls,),
+            name=f"listener-{type(self.listener).__name__}-handler",
+            daemon=True,
+        ).start()
+
+    def _handle(self, calls: queue.SimpleQueue) -> None:
+        while True:
+            item = calls.get()
+            if item is _STOP:
+                return
+            event, future = item
+            try:
+                future.set_result(self.listener.notify(event))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _work(self) -> None:
+        while True:
+            item = self.events.get()
+            try:
+                if item is _STOP:
+                    self._calls.put(_STOP)
+                    return
+                enqueued_at, event = item
+                self.last_lag = time.monotonic() - enqueued_at
+                future: Future = Future()
+                self._calls.put((event, future))
+                try:
+                    future.result(timeout=self.handler_timeout)
+                    self.processed += 1
+                except TimeoutError:
+                    self.timeouts += 1
+                    print(
+                        f"Listener {type(self.listener).__name__} superó "
+                        f"{self.handler_timeout}s; se abandona su hilo"
+                    )
+                    self._calls.put(_STOP)  # Lo recoge si algún día termina
+                    self._start_handler()
+                except Exception as e:
+                    # Aislamiento: el fallo de un listener no afecta a los demás
+                    self.errors += 1
+                    print(f"Listener {type(self.listener).__name__} falló: {e}")
+            finally:
+                self.events.task_done()
+
+
+@dataclass
+class ConcurrentListenerManager[T](ListenerManager[T]):
+    """
+    ListenerManager que entrega los eventos en segundo plano.
+
+    Cada listener tiene su propia cola acotada y su hilo, así un listener lento
+    o que lanza excepciones no bloquea el pago ni a los demás listeners. Si la
+    cola de un listener sigue llena tras `enqueue_timeout` segundos el evento
+    se descarta para ese listener. Cada evento tiene como mucho
+    `handler_timeout` segundos: si el listener no termina, el evento cuenta
+    como timeout en metrics() y la cola sigue con un hilo nuevo.
+    """
+
+    max_queue_size: int = 1000
+    enqueue_timeout: float = 0.05
+    handler_timeout: float = 1.0
+    _workers: dict[int, _ListenerWorker] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        for listener in self.listeners:
+            self._start_worker(listener)
+        for topic_listeners in self.topics.values():
+            for listener in topic_listeners:
+                self._start_worker(listener)
+
+    def suscribe(self, listener: Listener, *topics: type) -> None:
+        super().suscribe(listener, *topics)
+        self._start_worker(listener)
+
+    def unsuscribe(self, listener: Listener) -> None:
+        super().unsuscribe(listener)
+        worker = self._workers.pop(id(listener), None)
+        if worker:
+            worker.events.put(_STOP)
+
+    def _start_worker(self, listener: Listener) -> None:
+        if id(listener) in self._workers:
+            return
+        self._workers[id(listener)] = _ListenerWorker(
+            listener=listener,
+            max_queue_size=self.max_queue_size,
+            handler_timeout=self.handler_timeout,
+        )
+
+    def _dispatch(self, listener: Listener, event: T) -> None:
+        worker = self._workers[id(listener)]
+        try:
+            worker.events.put((time.monotonic(), event), timeout=self.enqueue_timeout)
+        except queue.Full:
+            worker.dropped += 1
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Profundidad de cola, lag (segundos) y contadores de cada listener."""
+        return {
+            f"{type(worker.listener).__name__}#{index}": {
+                "queue_depth": worker.events.qsize(),
+                "lag_seconds": worker.last_lag,
+                "processed": worker.processed,
+                "errors": worker.errors,
+                "dropped": worker.dropped,
+                "timeouts": worker.timeouts,
+            }
+            for index, worker in enumerate(self._workers.values())
+        }
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Espera a que todos los listeners procesen sus colas."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in list(self._workers.values()):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            with worker.events.all_tasks_done:
+                if not worker.events.all_tasks_done.wait_for(
+                    lambda q=worker.events: not q.unfinished_tasks, remaining
+                ):
+                    return False
+        return True
+
+    def shutdown(self, timeout: float | None = None) -> bool:
+        """Procesa lo pendiente y detiene los hilos de los listeners."""
+        drained = self.drain(timeout)
+        for worker in self._workers.values():
+            worker.events.put(_STOP)
+            worker.thread.join(timeout)
+        self._workers.clear()
+        return drained
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+
+from src.payment_service.commons import CustomerData, PaymentResponse
+
+# Eventos tipados del servicio de pagos. Cada clase es un tópico de
+# ListenerManager; el texto del evento solo se construye si un listener
+# lo pide con str(event).
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentSucceeded:
+    customer_data: CustomerData
+    payment_response: PaymentResponse
+
+    def __str__(self) -> str:
+        return (
+            f"Pago exitoso: {self.payment_response}\n"
+            f"{self.payment_response.transaction_id}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentFailed:
+    customer_data: CustomerData
+    payment_response: PaymentResponse
+
+    def __str__(self) -> str:
+        return f"Error en el pago - Motivo: {self.payment_response.message}"
+
+
+@dataclass(frozen=True, slots=True)
+class RefundProcessed:
+    transaction_id: str
+    refund_response: PaymentResponse
+
+    def __str__(self) -> str:
+        return (
+            f"Reembolso de {self.transaction_id}: {self.refund_response.status}"
+            f" - {self.refund_response.message}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionCreated:
+    customer_data: CustomerData
+    subscription_response: PaymentResponse
+
+    def __str__(self) -> str:
+        return (
+            f"Suscripción {self.subscription_response.transaction_id} para "
+            f"{self.customer_data.name}: {self.subscription_response.status}"
+        )
+
+
+type PaymentEvent = (
+    PaymentSucceeded | PaymentFailed | RefundProcessed | SubscriptionCreated
+)
@@ -5,14 +5,73 @@ from src.payment_service.listeners.lsitener import Listener
 
 @dataclass
 class ListenerManager[T]:
+    """
+    Observer con índice tópico -> suscriptores.
+
+    `listeners` reciben todos los eventos; `topics` guarda los listeners
+    suscritos a un tipo de evento concreto (también reciben sus subclases).
+    """
+
     listeners: list[Listener] = field(default_factory=list)
+    topics: dict[type, list[Listener]] = field(default_factory=dict)
+    _index: dict[type, tuple[Listener, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
-    def suscribe(self, listener: Listener) -> None:
-        self.listeners.append(listener)
+    def suscribe(self, listener: Listener, *topics: type) -> None:
+        """Suscribe a los tópicos indicados, o a todos los eventos si no hay."""
+        if topics:
+            for topic in topics:
+                self.topics.setdefault(topic, []).append(listener)
+        else:
+            self.listeners.append(listener)
+        self._index.clear()
 
     def unsuscribe(self, listener: Listener) -> None:
-        self.listeners.remove(listener)
+        found = listener in self.listeners
+        if found:
+            self.listeners.remove(listener)
+        for subscribers in self.topics.values():
+            if listener in subscribers:
+                subscribers.remove(listener)
+                found = True
+        if not found:
+            raise ValueError("Listener is not subscribed")
+        self._index.clear()
+
+    def subscribers(self, topic: type) -> tuple[Listener, ...]:
+        """Listeners que reciben eventos de tipo `topic` (resultado cacheado)."""
+        subscribers = self._index.get(topic)
+        if subscribers is None:
+            matched = list(self.listeners)
+            for subscribed_topic, topic_listeners in self.topics.items():
+                if issubclass(topic, subscribed_topic):
+                    matched.extend(
+                        listener
+                        for listener in topic_listeners
+                        if listener not in matched
+                    )
+            subscribers = self._index[topic] = tuple(matched)
+        return subscribers
+
+    def has_subscribers(self, topic: type) -> bool:
+        return bool(self.subscribers(topic))
+
+    def publish(self, topic: type[T], *args) -> None:
+        """
+        Construye el evento `topic(*args)` y lo notifica, solo si alguien lo
+        escucha.
+        """
+        subscribers = self.subscribers(topic)
+        if subscribers:
+            event = topic(*args)
+            for listener in subscribers:
+                self._dispatch(listener, event)
 
     def notify(self, event: T) -> None:
-        for listener in self.listeners:
-            listener.notify(event)
+        for listener in self.subscribers(type(event)):
+            self._dispatch(listener, event)
+
+    def _dispatch(self, listener: Listener, event: T) -> None:
+        """Entrega el evento a un listener; las subclases cambian cómo."""
+        listener.notify(event)
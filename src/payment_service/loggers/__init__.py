@@ -1,3 +1,4 @@
+from .buffered_logger import BufferedTransactionLogger, DurabilityPolicy
 from .transaction_logger import TransactionLogger
 
-__all__ = ["TransactionLogger"]
+__all__ = ["BufferedTransactionLogger", "DurabilityPolicy", "TransactionLogger"]
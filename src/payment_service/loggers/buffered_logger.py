@@ -0,0 +1,144 @@
+import atexit
+import contextlib
+import os
+import threading
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Self, TextIO
+
+from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+
+from .transaction_logger import TransactionLogger
+
+# Loggers abiertos, por id: se cierran (vaciando el buffer) al salir del
+# intérprete aunque nadie llame a close()
+_open_loggers: "weakref.WeakValueDictionary[int, BufferedTransactionLogger]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    for logger in list(_open_loggers.values()):
+        logger.close()
+
+
+class DurabilityPolicy(Enum):
+    NONE = "none"  # Solo se escribe al buffer del archivo
+    FLUSH = "flush"  # flush() al sistema operativo en cada grupo
+    FSYNC = "fsync"  # flush() + os.fsync() en cada grupo (group commit)
+
+
+@dataclass
+class BufferedTransactionLogger(TransactionLogger):
+    """
+    TransactionLogger que mantiene el archivo abierto y agrupa las escrituras.
+
+    Los registros se acumulan en memoria y se escriben juntos cuando el buffer
+    supera `max_buffered_bytes`, cuando pasan `flush_interval` segundos o al
+    llamar a flush()/close(). `durability` decide si cada grupo se vuelca al
+    sistema operativo o hasta el disco. Los registros pendientes se escriben
+    también al salir del intérprete si no se llamó a close().
+    """
+
+    durability: DurabilityPolicy = DurabilityPolicy.FLUSH
+    max_buffered_bytes: int = 64 * 1024
+    flush_interval: float | None = 1.0
+    _buffer: list[str] = field(default_factory=list, init=False, repr=False)
+    _buffered_bytes: int = field(default=0, init=False, repr=False)
+    _file: TextIO | None = field(default=None, init=False, repr=False)
+    _files: contextlib.ExitStack = field(
+        default_factory=contextlib.ExitStack, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _closed: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False
+    )
+    _last_flush: float = field(default_factory=time.monotonic, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        _open_loggers[id(self)] = self
+        if self.flush_interval:
+            threading.Thread(
+                target=self._flush_periodically, name="log-flusher", daemon=True
+            ).start()
+
+    def log(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        payment_response: PaymentResponse,
+    ):
+        self._append(
+            self._format_payment(customer_data, payment_data, payment_response)
+        )
+
+    def log_batch(
+        self,
+        entries: Iterable[tuple[CustomerData, PaymentData, PaymentResponse]],
+    ):
+        self._append("".join(self._format_payment(*entry) for entry in entries))
+
+    def log_refund(self, transaction_id: str, refund_response: PaymentResponse):
+        self._append(self._format_refund(transaction_id, refund_response))
+
+    def flush(self) -> None:
+        """Escribe los registros pendientes aplicando la política de durabilidad."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Vacía el buffer y cierra el archivo; el logger no admite más registros."""
+        self._closed.set()
+        with self._lock:
+            self._flush_locked()
+            self._files.close()
+            self._file = None
+        _open_loggers.pop(id(self), None)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _append(self, record: str) -> None:
+        with self._lock:
+            # Dentro del lock: un close() concurrente no puede colarse entre la
+            # comprobación y la escritura y dejar el archivo reabierto
+            if self._closed.is_set():
+                raise ValueError("BufferedTransactionLogger is closed")
+            self._buffer.append(record)
+            self._buffered_bytes += len(record)
+            if self._buffered_bytes >= self.max_buffered_bytes or (
+                self.flush_interval is not None
+                and time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = self._open()
+        self._file.write("".join(self._buffer))
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        if self.durability is not DurabilityPolicy.NONE:
+            self._file.flush()
+        if self.durability is DurabilityPolicy.FSYNC:
+            os.fsync(self._file.fileno())
+
+    def _open(self) -> TextIO:
+        # El ExitStack es dueño del archivo: close() lo cierra
+        return self._files.enter_context(open(self.path, "a"))
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
@@ -5,21 +6,49 @@ from src.payment_service.commons import CustomerData, PaymentData, PaymentRespon
 
 @dataclass
 class TransactionLogger:
+    path: str = "transactions.log"
+
     def log(
         self,
         customer_data: CustomerData,
         payment_data: PaymentData,
         payment_response: PaymentResponse,
     ):
-        with open("transactions.log", "a") as log_file:
-            log_file.write(f"{customer_data.name} paid {payment_data.amount}\n")
-            log_file.write(f"Payment status: {payment_response.status}\n")
-            if payment_response.transaction_id:
-                log_file.write(f"Transaction ID: {payment_response.transaction_id}\n")
-            log_file.write(f"Message: {payment_response.message}\n")
+        with open(self.path, "a") as log_file:
+            log_file.write(
+                self._format_payment(customer_data, payment_data, payment_response)
+            )
+
+    def log_batch(
+        self,
+        entries: Iterable[tuple[CustomerData, PaymentData, PaymentResponse]],
+    ):
+        """Registra un lote de transacciones con una sola apertura y escritura."""
+        with open(self.path, "a") as log_file:
+            log_file.write("".join(self._format_payment(*entry) for entry in entries))
 
     def log_refund(self, transaction_id: str, refund_response: PaymentResponse):
-        with open("transactions.log", "a") as log_file:
-            log_file.write(f"Refund processed for transaction {transaction_id}\n")
-            log_file.write(f"Refund status: {refund_response.status}\n")
-            log_file.write(f"Message: {refund_response.message}\n")
+        with open(self.path, "a") as log_file:
+            log_file.write(self._format_refund(transaction_id, refund_response))
+
+    @staticmethod
+    def _format_payment(
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        payment_response: PaymentResponse,
+    ) -> str:
+        record = (
+            f"{customer_data.name} paid {payment_data.amount}\n"
+            f"Payment status: {payment_response.status}\n"
+        )
+        if payment_response.transaction_id:
+            record += f"Transaction ID: {payment_response.transaction_id}\n"
+        return record + f"Message: {payment_response.message}\n"
+
+    @staticmethod
+    def _format_refund(transaction_id: str, refund_response: PaymentResponse) -> str:
+        return (
+            f"Refund processed for transaction {transaction_id}\n"
+            f"Refund status: {refund_response.status}\n"
+            f"Message: {refund_response.message}\n"
+        )
@@ -1,5 +1,7 @@
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
+from src.payment_service.commons.batch_result import BatchResult
 from src.payment_service.commons.customer import CustomerData
 from src.payment_service.commons.payment_data import PaymentData
 from src.payment_service.commons.payment_response import PaymentResponse
@@ -12,13 +14,31 @@ class PaymentServiceLogging(PaymentServiceDecoratorProtocol):
     wrapped_service: PaymentServiceProtocol
 
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse:
         print("Starting to process transaction")
-        response = self.wrapped_service.process_transaction(customer_data, payment_data)
+        response = self.wrapped_service.process_transaction(
+            customer_data, payment_data, idempotency_key
+        )
         print("Finished processing transaction")
         return response
 
+    def process_batch(
+        self,
+        transactions: Iterable[tuple[CustomerData, PaymentData]],
+        max_workers: int = 8,
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchResult:
+        print("Starting to process batch")
+        result = self.wrapped_service.process_batch(
+            transactions, max_workers, idempotency_keys
+        )
+        print(f"Finished processing batch: {result.failures}")
+        return result
+
     def process_refund(self, transaction_id: str) -> PaymentResponse:
         print(f"Start process refund using: {transaction_id}")
         response = self.wrapped_service.process_refund(transaction_id)
@@ -76,91 +76,12 @@ if __name__ == "__main__":
     print("BUILDER PATTERN + STRATEGY PATTERN + FACTORY METHOD")
     print("=" * 70)
 
-    # ===== TEST 1: Cliente con Email =====
-    print("\n--- TEST 1: Cliente con Email ---")
-
-    customer_data = CustomerData(
-        name="Manuela Torres",
-        contact_info=ContactInfo(email="manuela.torres@yahoo.com"),
-    )
-
-    payment_data = PaymentData(
-        amount=12000,  # $120.00
-        source="tok_mastercard",
-        currency="MXN",
-        type=PaymentType.ONLINE,
-    )
-
-    # ✅ CORRECTO: Pasa customer_data directamente
-    # El builder aplicará el Strategy Pattern internamente
+    # Un solo servicio para todos los clientes y tipos de pago: el procesador
+    # y el notificador se eligen en cada llamada
     service = (
         PaymentServiceBuilder()
-        .set_payment_processor(payment_data)
-        .set_notifier(customer_data)  # ✅ Pasa CustomerData, no NotifierProtocol
-        .set_recurring_processor()
-        .set_refund_processor()
-        .set_logger()
-        .set_listener()
-        .set_chain_of_validations()
-        .build()
-    )
-
-    try:
-        response = service.process_transaction(customer_data, payment_data)
-        print(f"✅ Payment Status: {response.status}")
-        print(f"   Amount: ${response.amount / 100:.2f} {payment_data.currency}")
-        print(f"   Transaction ID: {response.transaction_id}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-
-    # ===== TEST 2: Cliente con Teléfono =====
-    print("\n--- TEST 2: Cliente con Teléfono ---")
-
-    customer_with_phone = CustomerData(
-        name="Carlos Mendez",
-        contact_info=ContactInfo(phone="5551234567"),
-    )
-
-    payment_data_usd = PaymentData(
-        amount=5000, source="tok_visa", currency="USD", type=PaymentType.ONLINE
-    )
-
-    service2 = (
-        PaymentServiceBuilder()
-        .set_payment_processor(payment_data_usd)
-        .set_notifier(customer_with_phone)  # ✅ Strategy seleccionará SMS
-        .set_recurring_processor()
-        .set_refund_processor()
-        .set_logger()
-        .set_listener()
-        .set_chain_of_validations()
-        .build()
-    )
-
-    try:
-        response = service2.process_transaction(customer_with_phone, payment_data_usd)
-        print(f"✅ Payment Status: {response.status}")
-        print(f"   Amount: ${response.amount / 100:.2f} {payment_data_usd.currency}")
-        print(f"   Transaction ID: {response.transaction_id}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-
-    # ===== TEST 3: Cliente sin Contacto =====
-    print("\n--- TEST 3: Cliente sin Contacto ---")
-
-    customer_no_contact = CustomerData(
-        name="Usuario Anónimo",
-        contact_info=ContactInfo(),  # Sin email ni teléfono
-    )
-
-    payment_offline = PaymentData(
-        amount=8000, source="", currency="MXN", type=PaymentType.OFFLINE
-    )
-
-    service3 = (
-        PaymentServiceBuilder()
-        .set_payment_processor(payment_offline)
-        .set_notifier(customer_no_contact)
+        .set_routing_processor()
+        .set_routing_notifier()  # ✅ Strategy por cliente, no por servicio
         .set_recurring_processor()
         .set_refund_processor()
         .set_logger()
@@ -169,13 +90,51 @@ if __name__ == "__main__":
         .build()
     )
 
-    try:
-        response = service3.process_transaction(customer_no_contact, payment_offline)
-        print(f"✅ Payment Status: {response.status}")
-        print(f"   Amount: ${response.amount / 100:.2f} {payment_offline.currency}")
-        print(f"   Transaction ID: {response.transaction_id}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    tests = [
+        (
+            "TEST 1: Cliente con Email",
+            CustomerData(
+                name="Manuela Torres",
+                contact_info=ContactInfo(email="manuela.torres@yahoo.com"),
+            ),
+            PaymentData(
+                amount=12000,  # $120.00
+                source="tok_mastercard",
+                currency="MXN",
+                type=PaymentType.ONLINE,
+            ),
+        ),
+        (
+            "TEST 2: Cliente con Teléfono",
+            CustomerData(
+                name="Carlos Mendez",
+                contact_info=ContactInfo(phone="5551234567"),
+            ),
+            PaymentData(
+                amount=5000, source="tok_visa", currency="USD", type=PaymentType.ONLINE
+            ),
+        ),
+        (
+            "TEST 3: Cliente sin Contacto",
+            CustomerData(
+                name="Usuario Anónimo",
+                contact_info=ContactInfo(),  # Sin email ni teléfono
+            ),
+            PaymentData(
+                amount=8000, source="", currency="MXN", type=PaymentType.OFFLINE
+            ),
+        ),
+    ]
+
+    for title, customer_data, payment_data in tests:
+        print(f"\n--- {title} ---")
+        try:
+            response = service.process_transaction(customer_data, payment_data)
+            print(f"✅ Payment Status: {response.status}")
+            print(f"   Amount: ${response.amount / 100:.2f} {payment_data.currency}")
+            print(f"   Transaction ID: {response.transaction_id}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
 
     print("\n" + "=" * 70)
     print("PRUEBAS COMPLETADAS")
@@ -0,0 +1,5 @@
+from .context import active_metrics, use_metrics
+from .histogram import LogLinearHistogram
+from .pipeline_metrics import PipelineMetrics
+
+__all__ = ["LogLinearHistogram", "PipelineMetrics", "active_metrics", "use_metrics"]
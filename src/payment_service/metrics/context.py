@@ -0,0 +1,30 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .pipeline_metrics import PipelineMetrics
+
+_active: ContextVar[PipelineMetrics | None] = ContextVar(
+    "payment_metrics", default=None
+)
+
+
+def active_metrics() -> PipelineMetrics | None:
+    """PipelineMetrics del servicio que hace la llamada en curso, si tiene."""
+    return _active.get()
+
+
+@contextmanager
+def use_metrics(metrics: PipelineMetrics | None) -> Iterator[None]:
+    """
+    Publica las métricas del servicio durante una llamada al procesador.
+
+    Los procesadores se comparten entre servicios (tabla de rutas de la
+    factory), así que no guardan las métricas de ninguno: las toman de aquí en
+    cada llamada.
+    """
+    token = _active.set(metrics)
+    try:
+        yield
+    finally:
+        _active.reset(token)
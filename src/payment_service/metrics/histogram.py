@@ -0,0 +1,100 @@
+import threading
+from dataclasses import dataclass, field
+
+# 16 sub-buckets lineales por cada potencia de dos: error relativo <= 6.25 %
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(value: int) -> int:
+    """Índice del bucket log-lineal que contiene `value` (entero >= 0)."""
+    if value < SUB_BUCKETS:
+        return value
+    exponent = value.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKETS * (exponent + 1) + (value >> exponent) - SUB_BUCKETS
+
+
+def bucket_lower_bound(index: int) -> int:
+    """Menor valor que cae en el bucket `index`."""
+    if index < SUB_BUCKETS:
+        return index
+    exponent, sub_bucket = divmod(index - SUB_BUCKETS, SUB_BUCKETS)
+    return (SUB_BUCKETS + sub_bucket) << exponent
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Mayor valor que cae en el bucket `index`."""
+    return bucket_lower_bound(index + 1) - 1
+
+
+@dataclass
+class LogLinearHistogram:
+    """
+    Histograma de latencias con buckets log-lineales.
+
+    Registra enteros (nanosegundos) en memoria acotada y con error relativo
+    fijo; dos histogramas se combinan sumando sus buckets con `merge`, por lo
+    que pueden agregarse entre hilos, procesos o instancias del servicio.
+    """
+
+    counts: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    total: int = 0
+    min: int | None = None
+    max: int | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __getstate__(self) -> dict:
+        # El lock no se serializa: el histograma viaja entre procesos
+        with self._lock:
+            state = self.__dict__.copy()
+            state["counts"] = dict(self.counts)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record(self, value: int) -> None:
+        index = bucket_index(value)
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def merge(self, other: "LogLinearHistogram") -> None:
+        """Suma los buckets de `other` a este histograma."""
+        with other._lock:
+            counts = dict(other.counts)
+            count, total, low, high = other.count, other.total, other.min, other.max
+        if not count:
+            return
+        with self._lock:
+            for index, bucket_count in counts.items():
+                self.counts[index] = self.counts.get(index, 0) + bucket_count
+            self.count += count
+            self.total += total
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+
+    def percentile(self, percent: float) -> int:
+        """Valor aproximado (límite superior del bucket) del percentil dado."""
+        with self._lock:
+            if not self.count:
+                return 0
+            rank = max(1, round(self.count * percent / 100))
+            seen = 0
+            for index in sorted(self.counts):
+                seen += self.counts[index]
+                if seen >= rank:
+                    return min(bucket_upper_bound(index), self.max or 0)
+            return self.max or 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
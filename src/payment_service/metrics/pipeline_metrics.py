@@ -0,0 +1,78 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from .histogram import LogLinearHistogram
+
+_NS_PER_MS = 1_000_000
+
+
+class _StageTimer:
+    """Context manager que mide una etapa y la registra al salir."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: LogLinearHistogram) -> None:
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        self._histogram.record(time.perf_counter_ns() - self._start)
+
+
+@dataclass
+class PipelineMetrics:
+    """
+    Latencias por operación y etapa del servicio de pagos.
+
+    Cada par (operación, etapa), por ejemplo ("transaction", "processor"),
+    tiene su propio LogLinearHistogram.
+    """
+
+    histograms: dict[tuple[str, str], LogLinearHistogram] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __getstate__(self) -> dict:
+        return {"histograms": dict(self.histograms)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.histograms = state["histograms"]
+        self._lock = threading.Lock()
+
+    def histogram(self, operation: str, stage: str) -> LogLinearHistogram:
+        key = (operation, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, LogLinearHistogram())
+        return histogram
+
+    def stage(self, operation: str, stage: str) -> _StageTimer:
+        """Mide el bloque `with` como una muestra de la etapa."""
+        return _StageTimer(self.histogram(operation, stage))
+
+    def record(self, operation: str, stage: str, elapsed_ns: int) -> None:
+        self.histogram(operation, stage).record(elapsed_ns)
+
+    def merge(self, other: "PipelineMetrics") -> None:
+        for (operation, stage), histogram in list(other.histograms.items()):
+            self.histogram(operation, stage).merge(histogram)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Resumen en milisegundos: {operación: {etapa: {count, mean, p50, ...}}}.
+        """
+        snapshot: dict[str, dict[str, dict[str, float]]] = {}
+        for (operation, stage), histogram in list(self.histograms.items()):
+            snapshot.setdefault(operation, {})[stage] = {
+                "count": histogram.count,
+                "mean_ms": histogram.mean / _NS_PER_MS,
+                "p50_ms": histogram.percentile(50) / _NS_PER_MS,
+                "p90_ms": histogram.percentile(90) / _NS_PER_MS,
+                "p99_ms": histogram.percentile(99) / _NS_PER_MS,
+                "max_ms": (histogram.max or 0) / _NS_PER_MS,
+            }
+        return snapshot
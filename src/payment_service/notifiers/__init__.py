@@ -1,6 +1,45 @@
-from .default_notifier import LogOnlyNotifier
-from .email import EmailNotifier
+import importlib
+from typing import TYPE_CHECKING
+
 from .notifier import NotifierProtocol
-from .sms import PhoneNotifier
 
-__all__ = ["NotifierProtocol", "EmailNotifier", "PhoneNotifier", "LogOnlyNotifier"]
+if TYPE_CHECKING:
+    from .default_notifier import LogOnlyNotifier
+    from .dispatcher import BackpressurePolicy, NotificationDispatcher
+    from .email import EmailNotifier
+    from .routing_notifier import RoutingNotifier
+    from .sms import PhoneNotifier
+
+# Los canales se importan al usarse por primera vez
+_LAZY = {
+    "LogOnlyNotifier": ".default_notifier",
+    "BackpressurePolicy": ".dispatcher",
+    "NotificationDispatcher": ".dispatcher",
+    "EmailNotifier": ".email",
+    "RoutingNotifier": ".routing_notifier",
+    "PhoneNotifier": ".sms",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
+
+__all__ = [
+    "BackpressurePolicy",
+    "EmailNotifier",
+    "LogOnlyNotifier",
+    "NotificationDispatcher",
+    "NotifierProtocol",
+    "PhoneNotifier",
+    "RoutingNotifier",
+]
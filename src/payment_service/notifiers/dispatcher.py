@@ -0,0 +1,206 @@
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+from src.payment_service.commons.customer import CustomerData
+
+from .notifier import NotifierProtocol
+
+_STOP = object()
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Segundos hasta `deadline` (None: sin límite)."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class BackpressurePolicy(Enum):
+    BLOCK = "block"  # El llamador espera a que haya espacio en la cola
+    DROP_OLDEST = "drop_oldest"  # Se descarta la notificación más antigua
+    SPILL_TO_DISK = "spill_to_disk"  # Se guarda en disco para reenviarla luego
+
+
+@dataclass
+class NotificationDispatcher(NotifierProtocol):
+    """
+    Decorator de NotifierProtocol que envía las notificaciones fuera del
+    camino crítico del pago.
+
+    Las llamadas solo encolan la notificación en una cola acotada que vacía un
+    pool de hilos con el notificador envuelto (EmailNotifier, PhoneNotifier,
+    LogOnlyNotifier...). `backpressure` decide qué pasa con la cola llena y
+    drain()/shutdown() esperan a que se envíe lo pendiente. Tras shutdown()
+    ya nadie vacía la cola: las notificaciones nuevas se guardan en disco con
+    SPILL_TO_DISK y si no se descartan y se cuentan en `rejected`.
+    """
+
+    notifier: NotifierProtocol
+    workers: int = 4
+    max_queue_size: int = 1000
+    backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK
+    spill_path: str = "notifications.spill"
+    dropped: int = field(default=0, init=False)
+    spilled: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+    rejected: int = field(default=0, init=False)
+    _queue: queue.Queue = field(init=False, repr=False)
+    _threads: list[threading.Thread] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _closed: threading.Event = field(
+        default_factory=threading.Event, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        for number in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"notifier-{number}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def send_confirmation(self, customer_data: CustomerData):
+        self._enqueue(("confirmation", customer_data, None))
+
+    def send_failure_notification(
+        self, customer_data: CustomerData, error_message: str
+    ):
+        self._enqueue(("failure", customer_data, error_message))
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Espera a que se envíen las notificaciones encoladas; False si vence."""
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def shutdown(self, timeout: float | None = None) -> bool:
+        """
+        Vacía la cola y detiene los hilos. Devuelve False si quedó algo pendiente.
+
+        `timeout` acota toda la espera: si un hilo está bloqueado con la cola
+        llena no se espera a que haya sitio para su señal de parada.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._closed.set()
+        drained = self.drain(timeout)
+        for _ in self._threads:
+            try:
+                self._queue.put(_STOP, timeout=_remaining(deadline))
+            except queue.Full:
+                drained = False
+                break
+        for thread in self._threads:
+            thread.join(_remaining(deadline))
+        # Lo que se coló en la cola mientras se cerraba ya no se enviará
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._queue.task_done()
+            if item is not _STOP:
+                self._reject(item)
+                drained = False
+        # Con la cola ya vacía, los hilos que sigan bloqueados se detendrán al
+        # terminar su envío
+        for thread in self._threads:
+            if thread.is_alive():
+                self._queue.put_nowait(_STOP)
+        self._threads.clear()
+        return drained
+
+    def replay_spilled(self) -> int:
+        """Vuelve a encolar las notificaciones guardadas en disco."""
+        with self._lock:
+            try:
+                with open(self.spill_path) as spill_file:
+                    lines = spill_file.readlines()
+            except FileNotFoundError:
+                return 0
+            open(self.spill_path, "w").close()
+        for line in lines:
+            record = json.loads(line)
+            customer_data = CustomerData.model_validate(record["customer_data"])
+            self._enqueue((record["kind"], customer_data, record["error_message"]))
+        return len(lines)
+
+    def _enqueue(self, item: tuple[str, CustomerData, str | None]) -> None:
+        if self._closed.is_set():
+            self._reject(item)
+            return
+        match self.backpressure:
+            case BackpressurePolicy.BLOCK:
+                self._queue.put(item)
+            case BackpressurePolicy.DROP_OLDEST:
+                while True:
+                    try:
+                        self._queue.put_nowait(item)
+                        return
+                    except queue.Full:
+                        self._drop_oldest()
+            case BackpressurePolicy.SPILL_TO_DISK:
+                try:
+                    self._queue.put_nowait(item)
+                except queue.Full:
+                    self._spill(item)
+
+    def _reject(self, item: tuple[str, CustomerData, str | None]) -> None:
+        if self.backpressure is BackpressurePolicy.SPILL_TO_DISK:
+            self._spill(item)
+            return
+        print("NotificationDispatcher: cerrado, notificación descartada")
+        with self._lock:
+            self.rejected += 1
+
+    def _drop_oldest(self) -> None:
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            return
+        self._queue.task_done()
+        with self._lock:
+            self.dropped += 1
+
+    def _spill(self, item: tuple[str, CustomerData, str | None]) -> None:
+        kind, customer_data, error_message = item
+        record = {
+            "kind": kind,
+            "customer_data": customer_data.model_dump(mode="json"),
+            "error_message": error_message,
+        }
+        with self._lock:
+            with open(self.spill_path, "a") as spill_file:
+                spill_file.write(json.dumps(record) + "\n")
+            self.spilled += 1
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                kind, customer_data, error_message = item
+                if kind == "confirmation":
+                    self.notifier.send_confirmation(customer_data)
+                else:
+                    self.notifier.send_failure_notification(
+                        customer_data, str(error_message)
+                    )
+            except Exception as e:
+                print(f"NotificationDispatcher: fallo al notificar - {e}")
+                with self._lock:
+                    self.failed += 1
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+
+from src.payment_service.commons import CustomerData
+
+from .default_notifier import LogOnlyNotifier
+from .email import EmailNotifier
+from .notifier import NotifierProtocol
+from .sms import PhoneNotifier
+
+
+@dataclass
+class RoutingNotifier(NotifierProtocol):
+    """
+    Strategy por llamada: elige el canal según el CustomerData recibido.
+
+    `channels` asocia cada dato de ContactInfo ("email", "phone") con un
+    notificador ya construido y `order` es la prioridad entre ellos. Se usa el
+    primer canal para el que el cliente tiene dato; con `fallback`, si ese
+    canal falla se prueba el siguiente. Sin canales disponibles se usa
+    `default`. Así un solo servicio notifica a todos los clientes.
+    """
+
+    channels: dict[str, NotifierProtocol] = field(
+        default_factory=lambda: {
+            "email": EmailNotifier(),
+            "phone": PhoneNotifier(sms_gateway="Twilio"),
+        }
+    )
+    order: tuple[str, ...] = ("email", "phone")
+    default: NotifierProtocol = field(default_factory=LogOnlyNotifier)
+    fallback: bool = True
+
+    def send_confirmation(self, customer_data: CustomerData) -> None:
+        for notifier in self._candidates(customer_data):
+            try:
+                notifier.send_confirmation(customer_data)
+                return
+            except Exception as e:
+                if not self.fallback:
+                    raise
+                print(f"Notifier {type(notifier).__name__} failed: {e}")
+        self.default.send_confirmation(customer_data)
+
+    def send_failure_notification(
+        self, customer_data: CustomerData, error_message: str
+    ) -> None:
+        for notifier in self._candidates(customer_data):
+            try:
+                notifier.send_failure_notification(customer_data, error_message)
+                return
+            except Exception as e:
+                if not self.fallback:
+                    raise
+                print(f"Notifier {type(notifier).__name__} failed: {e}")
+        self.default.send_failure_notification(customer_data, error_message)
+
+    def _candidates(self, customer_data: CustomerData):
+        contact_info = customer_data.contact_info
+        for channel in self.order:
+            if getattr(contact_info, channel, None):
+                yield self.channels[channel]
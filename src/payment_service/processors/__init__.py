@@ -1,15 +1,74 @@
-from .local_processor import LocalPaymentProcessor
-from .offline_processor import OfflinePaymentProcessor
+import importlib
+from typing import TYPE_CHECKING
+
+from .async_payment import AsyncPaymentProcessorProtocol
+from .async_recurring import AsyncRecurringPaymentProtocol
+from .async_refunds import AsyncRefundPaymentProtocol
 from .payment import PaymentProcessorProtocol
 from .recurring import RecurringPaymentProtocol
 from .refunds import RefundPaymentProtocol
-from .stripe_processor import StripePaymentProcessor
+
+if TYPE_CHECKING:
+    from .async_adapter import AsyncProcessorAdapter
+    from .async_stripe_processor import AsyncStripePaymentProcessor
+    from .local_processor import LocalPaymentProcessor
+    from .offline_processor import OfflinePaymentProcessor
+    from .rate_limited_processor import RateLimitedProcessor
+    from .routing_processor import RoutingPaymentProcessor
+    from .stripe_client import (
+        StripeClientConfig,
+        build_async_stripe_client,
+        build_stripe_client,
+    )
+    from .stripe_processor import StripePaymentProcessor
+    from .stripe_resilience import StripeResilience
+
+# Los procesadores se importan al usarse por primera vez: así los workers
+# offline o locales no cargan el SDK de Stripe ni leen el .env
+_LAZY = {
+    "AsyncProcessorAdapter": ".async_adapter",
+    "AsyncStripePaymentProcessor": ".async_stripe_processor",
+    "LocalPaymentProcessor": ".local_processor",
+    "OfflinePaymentProcessor": ".offline_processor",
+    "RateLimitedProcessor": ".rate_limited_processor",
+    "RoutingPaymentProcessor": ".routing_processor",
+    "StripeClientConfig": ".stripe_client",
+    "build_async_stripe_client": ".stripe_client",
+    "build_stripe_client": ".stripe_client",
+    "StripePaymentProcessor": ".stripe_processor",
+    "StripeResilience": ".stripe_resilience",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
 
 __all__ = [
+    "AsyncPaymentProcessorProtocol",
+    "AsyncProcessorAdapter",
+    "AsyncRecurringPaymentProtocol",
+    "AsyncRefundPaymentProtocol",
+    "AsyncStripePaymentProcessor",
+    "LocalPaymentProcessor",
+    "OfflinePaymentProcessor",
     "PaymentProcessorProtocol",
+    "RateLimitedProcessor",
     "RecurringPaymentProtocol",
     "RefundPaymentProtocol",
-    "OfflinePaymentProcessor",
+    "RoutingPaymentProcessor",
+    "StripeClientConfig",
     "StripePaymentProcessor",
-    "LocalPaymentProcessor",
+    "StripeResilience",
+    "build_async_stripe_client",
+    "build_stripe_client",
 ]
@@ -0,0 +1,54 @@
+import asyncio
+from dataclasses import dataclass
+
+from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+
+from .async_payment import AsyncPaymentProcessorProtocol
+from .async_recurring import AsyncRecurringPaymentProtocol
+from .async_refunds import AsyncRefundPaymentProtocol
+from .payment import PaymentProcessorProtocol
+
+
+@dataclass
+class AsyncProcessorAdapter(
+    AsyncPaymentProcessorProtocol,
+    AsyncRecurringPaymentProtocol,
+    AsyncRefundPaymentProtocol,
+):
+    """
+    Adapter: expone un procesador síncrono con los protocolos asíncronos.
+
+    Cada llamada se ejecuta en un hilo con `asyncio.to_thread` para no bloquear
+    el event loop. Los métodos de reembolso y recurrencia solo funcionan si el
+    procesador envuelto los implementa.
+    """
+
+    wrapped_processor: PaymentProcessorProtocol
+
+    async def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse:
+        return await asyncio.to_thread(
+            self.wrapped_processor.process_transaction,
+            customer_data,
+            payment_data,
+            idempotency_key=idempotency_key,
+        )
+
+    async def setup_recurring_payment(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        return await asyncio.to_thread(
+            self.wrapped_processor.setup_recurring_payment,  # type: ignore[attr-defined]
+            customer_data,
+            payment_data,
+        )
+
+    async def refund_payment(self, transaction_id: str) -> PaymentResponse:
+        return await asyncio.to_thread(
+            self.wrapped_processor.refund_payment,  # type: ignore[attr-defined]
+            transaction_id,
+        )
@@ -0,0 +1,25 @@
+from typing import Protocol
+
+from src.payment_service.commons import (
+    CustomerData,
+    PaymentData,
+    PaymentResponse,
+)
+
+
+class AsyncPaymentProcessorProtocol(Protocol):
+    """
+    Protocolo asíncrono para procesar pagos únicos.
+
+    Versión `async` de PaymentProcessorProtocol: las implementaciones no bloquean
+    el hilo mientras esperan a la pasarela, de modo que un solo event loop puede
+    mantener muchos cobros en curso. `idempotency_key` tiene el mismo
+    significado que en PaymentProcessorProtocol.
+    """
+
+    async def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse: ...
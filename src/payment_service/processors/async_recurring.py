@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+
+
+class AsyncRecurringPaymentProtocol(Protocol):
+    """
+    Protocolo asíncrono para configurar pagos recurrentes.
+
+    Versión `async` de RecurringPaymentProtocol.
+    """
+
+    async def setup_recurring_payment(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse: ...
@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from src.payment_service.commons.payment_response import PaymentResponse
+
+
+class AsyncRefundPaymentProtocol(Protocol):
+    """
+    Protocolo asíncrono para gestionar reembolsos.
+
+    Versión `async` de RefundPaymentProtocol.
+    """
+
+    async def refund_payment(self, transaction_id: str) -> PaymentResponse: ...
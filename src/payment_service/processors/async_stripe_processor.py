@@ -0,0 +1,362 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import stripe
+
+from src.payment_service.cache import LookupCacheProtocol
+from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+from src.payment_service.concurrency import AsyncSingleFlight
+from src.payment_service.metrics import PipelineMetrics, active_metrics
+from src.payment_service.resilience import CircuitOpenError
+
+from .async_payment import AsyncPaymentProcessorProtocol
+from .async_recurring import AsyncRecurringPaymentProtocol
+from .async_refunds import AsyncRefundPaymentProtocol
+from .stripe_client import build_async_stripe_client
+from .stripe_lookup_cache import (
+    customer_cache_key,
+    default_lookup_cache,
+    payment_method_cache_key,
+)
+from .stripe_resilience import StripeResilience, write_options
+
+
+@dataclass
+class _LoopResources:
+    """Cliente y agrupador de consultas de un event loop."""
+
+    client: stripe.StripeClient
+    customer_flights: AsyncSingleFlight[str, stripe.Customer] = field(
+        default_factory=AsyncSingleFlight
+    )
+
+
+@dataclass
+class AsyncStripePaymentProcessor(
+    AsyncPaymentProcessorProtocol,
+    AsyncRecurringPaymentProtocol,
+    AsyncRefundPaymentProtocol,
+):
+    """
+    Variante asíncrona de StripePaymentProcessor.
+
+    Usa los métodos `*_async` del StripeClient, así cada cobro en curso solo
+    ocupa una corrutina en lugar de un hilo. Las conexiones salen de un pool
+    httpx configurable con `build_async_stripe_client(StripeClientConfig(...))`.
+    Como en la versión síncrona, los pasos de la suscripción se miden y se
+    registran en `metrics` o en las del servicio que llama.
+
+    Las conexiones httpx quedan ligadas al event loop que las abrió, así que
+    sin un `client` explícito se crea uno con `client_factory` por event loop
+    (y se libera con el loop). Todos los servicios que comparten el
+    procesador en un mismo loop comparten también su pool.
+    """
+
+    client: stripe.StripeClient | None = None
+    client_factory: Callable[[], stripe.StripeClient] = build_async_stripe_client
+    price_id: str = field(default_factory=lambda: os.getenv("STRIPE_PRICE_ID", ""))
+    resilience: StripeResilience = field(default_factory=StripeResilience)
+    customer_cache: LookupCacheProtocol | None = field(
+        default_factory=default_lookup_cache
+    )
+    payment_method_cache: LookupCacheProtocol | None = field(
+        default_factory=default_lookup_cache
+    )
+    metrics: PipelineMetrics | None = None
+    _loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopResources] = (
+        field(default_factory=weakref.WeakKeyDictionary, init=False, repr=False)
+    )
+    _loops_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def _resources(self) -> _LoopResources:
+        loop = asyncio.get_running_loop()
+        resources = self._loops.get(loop)
+        if resources is None:
+            with self._loops_lock:
+                resources = self._loops.get(loop)
+                if resources is None:
+                    resources = self._loops[loop] = _LoopResources(
+                        self.client or self.client_factory()
+                    )
+        return resources
+
+    def circuit_states(self) -> dict[str, dict[str, object]]:
+        """Estado de los circuit breakers por endpoint, para monitoreo."""
+        return self.resilience.circuit_states()
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Tamaño, aciertos y fallos de las cachés de consultas."""
+        return {
+            name: cache.stats()
+            for name, cache in (
+                ("customers", self.customer_cache),
+                ("payment_methods", self.payment_method_cache),
+            )
+            if cache is not None
+        }
+
+    def invalidate_customer(self, customer_data: CustomerData) -> None:
+        if self.customer_cache is not None:
+            self.customer_cache.invalidate(customer_cache_key(customer_data))
+
+    def invalidate_payment_method(self, customer_id: str, payment_source: str) -> None:
+        if self.payment_method_cache is not None:
+            self.payment_method_cache.invalidate(
+                payment_method_cache_key(customer_id, payment_source)
+            )
+
+    async def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse:
+        try:
+            options = write_options(idempotency_key)
+            charge = await self.resilience.call_async(
+                "charges",
+                lambda: self._resources().client.v1.charges.create_async(
+                    params={
+                        "amount": payment_data.amount,
+                        "currency": "usd",
+                        "source": payment_data.source,
+                        "description": "Charge for " + customer_data.name,
+                    },
+                    options=options,
+                ),
+            )
+            print("Payment successful")
+            return PaymentResponse(
+                status=charge["status"],
+                amount=charge["amount"],
+                transaction_id=charge["id"],
+                message="Payment successful",
+            )
+
+        except (stripe.StripeError, CircuitOpenError) as e:
+            print("Payment failed:", e)
+            return PaymentResponse(
+                status="failed",
+                amount=payment_data.amount,
+                transaction_id=None,
+                message=str(e),
+            )
+
+    async def refund_payment(self, transaction_id: str) -> PaymentResponse:
+        """Metodo para hacer un reembolso"""
+        try:
+            options = write_options(None)
+            refund = await self.resilience.call_async(
+                "refunds",
+                lambda: self._resources().client.v1.refunds.create_async(
+                    params={"charge": transaction_id}, options=options
+                ),
+            )
+            print("Refund successful")
+            return PaymentResponse(
+                status=refund["status"],
+                amount=refund["amount"],
+                transaction_id=refund["id"],
+                message="Refund successful",
+            )
+
+        except (stripe.StripeError, CircuitOpenError) as e:
+            print("Refund failed:", e)
+            return PaymentResponse(
+                status="failed",
+                amount=0,
+                transaction_id=None,
+                message=str(e),
+            )
+
+    async def setup_recurring_payment(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        """
+        Metodo que configura pagos automáticos recurrentes.
+
+        Igual que StripePaymentProcessor: tres llamadas, y la consulta del
+        cliente y el adjunto del método de pago en paralelo si ya se conoce
+        el ID del cliente.
+        """
+        timings: dict[str, int] = {}
+        try:
+            customer_id = customer_data.customer_id
+            if customer_id:
+                customer, payment_method = await asyncio.gather(
+                    self._timed(
+                        timings,
+                        "customer",
+                        lambda: self._get_or_create_customer(customer_data),
+                    ),
+                    self._timed(
+                        timings,
+                        "payment_method",
+                        lambda: self._attach_payment_method(
+                            customer_id, payment_data.source
+                        ),
+                    ),
+                )
+            else:
+                customer = await self._timed(
+                    timings,
+                    "customer",
+                    lambda: self._get_or_create_customer(customer_data),
+                )
+                payment_method = await self._timed(
+                    timings,
+                    "payment_method",
+                    lambda: self._attach_payment_method(
+                        customer.id, payment_data.source
+                    ),
+                )
+
+            subscription = await self._timed(
+                timings,
+                "subscription",
+                lambda: self._create_subscription(customer.id, payment_method.id),
+            )
+            print("Recurring payment setup successful")
+            print(
+                "Recurring setup timings:",
+                ", ".join(f"{step}={ns / 1e6:.1f}ms" for step, ns in timings.items()),
+            )
+
+            # unit_amount es null en precios por niveles: se informa 0
+            amount = subscription["items"]["data"][0]["price"]["unit_amount"] or 0
+            return PaymentResponse(
+                status=subscription["status"],
+                amount=amount,
+                transaction_id=subscription["id"],
+                message="Recurring payment setup successful",
+            )
+        except (stripe.StripeError, CircuitOpenError) as e:
+            print("Recurring payment setup failed:", e)
+            return PaymentResponse(
+                status="failed",
+                amount=0,
+                transaction_id=None,
+                message=str(e),
+            )
+        finally:
+            self._record(timings)
+
+    async def _timed[T](
+        self, timings: dict[str, int], step: str, fn: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Espera un paso de la suscripción y guarda su duración en ns."""
+        start = time.perf_counter_ns()
+        try:
+            return await fn()
+        finally:
+            timings[step] = time.perf_counter_ns() - start
+
+    def _record(self, timings: dict[str, int]) -> None:
+        """Registra los pasos medidos en las métricas propias o del servicio."""
+        metrics = self.metrics or active_metrics()
+        if metrics is not None:
+            for step, elapsed in timings.items():
+                metrics.record("recurring", f"stripe_{step}", elapsed)
+
+    async def _create_subscription(
+        self, customer_id: str, payment_method_id: str
+    ) -> stripe.Subscription:
+        options = write_options(None)
+        return await self.resilience.call_async(
+            "subscriptions",
+            lambda: self._resources().client.v1.subscriptions.create_async(
+                params={
+                    "customer": customer_id,
+                    "items": [{"price": self.price_id}],
+                    "default_payment_method": payment_method_id,
+                    "expand": ["latest_invoice.payment_intent"],
+                },
+                options=options,
+            ),
+        )
+
+    async def _get_or_create_customer(
+        self, customer_data: CustomerData
+    ) -> stripe.Customer:
+        """
+        Creates a new customer in Stripe or retrieves an existing one.
+        Returning customers are served from customer_cache.
+        """
+        key = customer_cache_key(customer_data)
+        if self.customer_cache is not None:
+            customer = self.customer_cache.get(key)
+            if customer is not None:
+                print(f"Customer cached: {customer.id}")
+                return customer
+
+        return await self._resources().customer_flights.do(
+            key, lambda: self._fetch_and_cache_customer(key, customer_data)
+        )
+
+    async def _fetch_and_cache_customer(
+        self, key: str, customer_data: CustomerData
+    ) -> stripe.Customer:
+        customer = await self._fetch_customer(customer_data)
+        if self.customer_cache is not None:
+            self.customer_cache.set(key, customer)
+            self.customer_cache.set(f"id:{customer.id}", customer)
+        return customer
+
+    async def _fetch_customer(self, customer_data: CustomerData) -> stripe.Customer:
+        if customer_data.customer_id:
+            customer = await self.resilience.call_async(
+                "customers",
+                lambda: self._resources().client.v1.customers.retrieve_async(
+                    customer_data.customer_id
+                ),
+            )
+            print(f"Customer retrieved: {customer.id}")
+        else:
+            if not customer_data.contact_info.email:
+                raise ValueError("Email required for subscriptions")
+            options = write_options(None)
+            customer = await self.resilience.call_async(
+                "customers",
+                lambda: self._resources().client.v1.customers.create_async(
+                    params={
+                        "name": customer_data.name,
+                        "email": customer_data.contact_info.email,
+                    },
+                    options=options,
+                ),
+            )
+            print(f"Customer created: {customer.id}")
+        return customer
+
+    async def _attach_payment_method(
+        self, customer_id: str, payment_source: str
+    ) -> stripe.PaymentMethod:
+        """
+        Attaches a payment method to a customer, unless payment_method_cache
+        says it is already attached.
+        """
+        key = payment_method_cache_key(customer_id, payment_source)
+        if self.payment_method_cache is not None:
+            payment_method = self.payment_method_cache.get(key)
+            if payment_method is not None:
+                print(f"Payment method {payment_method.id} already attached")
+                return payment_method
+
+        options = write_options(None)
+        payment_method = await self.resilience.call_async(
+            "payment_methods",
+            lambda: self._resources().client.v1.payment_methods.attach_async(
+                payment_source, params={"customer": customer_id}, options=options
+            ),
+        )
+        print(f"Payment method {payment_method.id} attached to customer {customer_id}")
+        if self.payment_method_cache is not None:
+            self.payment_method_cache.set(key, payment_method)
+        return payment_method
@@ -20,7 +20,10 @@ class LocalPaymentProcessor(
     """
 
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse:
         """Simula un pago único exitoso."""
         print(f"Processing local payment for {customer_data.name}")
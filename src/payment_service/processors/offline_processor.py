@@ -6,7 +6,10 @@ from src.payment_service.processors.payment import PaymentProcessorProtocol
 
 class OfflinePaymentProcessor(PaymentProcessorProtocol):
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse:
         print("Processing offline payment for", customer_data.name)
         return PaymentResponse(
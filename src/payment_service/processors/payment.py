@@ -14,8 +14,14 @@ class PaymentProcessorProtocol(Protocol):
     Este protocolo define la interfaz para procesadores de pago. Las implementaciones
     deben proporcionar un método `process_transaction` que toma datos del cliente y
     datos de pago, y retorna un objeto PaymentResponse.
+
+    `idempotency_key` identifica la solicitud: las pasarelas que lo soportan
+    deben usarlo para que un reintento no genere un segundo cobro.
     """
 
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse: ...
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+from src.payment_service.resilience import RateLimiter
+
+from .payment import PaymentProcessorProtocol
+from .recurring import RecurringPaymentProtocol
+from .refunds import RefundPaymentProtocol
+
+
+@dataclass
+class RateLimitedProcessor(
+    PaymentProcessorProtocol, RecurringPaymentProtocol, RefundPaymentProtocol
+):
+    """
+    Decorator: limita las llamadas salientes del procesador envuelto.
+
+    Cada método consume del endpoint correspondiente del limiter ("charges",
+    "refunds" o "subscriptions") un token por llamada saliente a la pasarela:
+    uno por cobro o reembolso y RECURRING_CALLS por suscripción. Si no se
+    obtienen los tokens la llamada no llega al procesador y se devuelve una
+    respuesta con status "rate_limited". Los métodos de reembolso y
+    recurrencia solo funcionan si el procesador envuelto los implementa.
+    """
+
+    # Cliente, método de pago y suscripción (StripePaymentProcessor)
+    RECURRING_CALLS: ClassVar[int] = 3
+
+    wrapped_processor: PaymentProcessorProtocol
+    limiter: RateLimiter
+
+    def rate_limit_stats(self) -> dict[str, dict[str, float]]:
+        """Saturación y contadores de cada bucket, para monitoreo."""
+        return self.limiter.snapshot()
+
+    def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse:
+        if not self.limiter.acquire("charges"):
+            return self._rejected("charges", payment_data.amount)
+        return self.wrapped_processor.process_transaction(
+            customer_data, payment_data, idempotency_key=idempotency_key
+        )
+
+    def setup_recurring_payment(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        if not self.limiter.acquire("subscriptions", cost=self.RECURRING_CALLS):
+            return self._rejected("subscriptions", 0)
+        return self.wrapped_processor.setup_recurring_payment(  # type: ignore[attr-defined]
+            customer_data, payment_data
+        )
+
+    def refund_payment(self, transaction_id: str) -> PaymentResponse:
+        if not self.limiter.acquire("refunds"):
+            return self._rejected("refunds", 0)
+        return self.wrapped_processor.refund_payment(transaction_id)  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _rejected(endpoint: str, amount: int) -> PaymentResponse:
+        print(f"Rate limit exceeded for {endpoint}")
+        return PaymentResponse(
+            status="rate_limited",
+            amount=amount,
+            transaction_id=None,
+            message=f"Rate limit exceeded for {endpoint}",
+        )
@@ -0,0 +1,66 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+
+from .payment import PaymentProcessorProtocol
+from .recurring import RecurringPaymentProtocol
+from .refunds import RefundPaymentProtocol
+
+
+@dataclass
+class RoutingPaymentProcessor(
+    PaymentProcessorProtocol, RecurringPaymentProtocol, RefundPaymentProtocol
+):
+    """
+    Procesador que elige el backend en cada llamada.
+
+    Los pagos y suscripciones se envían al procesador que devuelve `select`
+    para su PaymentData (normalmente la tabla de PaymentProcessorFactory, que
+    reutiliza las instancias). Los reembolsos solo traen el ID de la
+    transacción, así que se enrutan por su prefijo con `refund_routes`
+    (prefijo -> función que devuelve el procesador). Así un único servicio
+    atiende pagos MXN, USD y offline sin reconstruirse.
+    """
+
+    select: Callable[[PaymentData], PaymentProcessorProtocol]
+    refund_routes: dict[str, Callable[[], PaymentProcessorProtocol]] = field(
+        default_factory=dict
+    )
+
+    def process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
+    ) -> PaymentResponse:
+        return self.select(payment_data).process_transaction(
+            customer_data, payment_data, idempotency_key=idempotency_key
+        )
+
+    def setup_recurring_payment(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        processor = self.select(payment_data)
+        if not hasattr(processor, "setup_recurring_payment"):
+            return self._unsupported(
+                f"Recurring payments not supported for "
+                f"{payment_data.type.value} {payment_data.currency} payments"
+            )
+        return processor.setup_recurring_payment(customer_data, payment_data)
+
+    def refund_payment(self, transaction_id: str) -> PaymentResponse:
+        for prefix, route in self.refund_routes.items():
+            if transaction_id.startswith(prefix):
+                processor = route()
+                if not hasattr(processor, "refund_payment"):
+                    break
+                return processor.refund_payment(transaction_id)
+        return self._unsupported(f"Refunds not supported for {transaction_id}")
+
+    @staticmethod
+    def _unsupported(message: str) -> PaymentResponse:
+        print(message)
+        return PaymentResponse(
+            status="failed", amount=0, transaction_id=None, message=message
+        )
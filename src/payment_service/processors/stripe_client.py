@@ -0,0 +1,114 @@
+import functools
+import os
+from dataclasses import dataclass, field
+
+import requests
+import stripe
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+_ = load_dotenv()
+
+
+@dataclass(frozen=True)
+class StripeClientConfig:
+    """
+    Configuración del StripeClient y de su pool de conexiones HTTP.
+
+    La API key se lee del entorno (STRIPE_API_KEY) una sola vez, al crear la
+    configuración. STRIPE_API_BASE (o `api_base`) apunta el cliente a otro
+    servidor, por ejemplo el stand-in local `stripe_stub` para benchmarks.
+    """
+
+    api_key: str = field(default_factory=lambda: os.getenv("STRIPE_API_KEY", ""))
+    api_base: str | None = field(
+        default_factory=lambda: os.getenv("STRIPE_API_BASE") or None
+    )
+    max_connections: int = 20
+    keepalive_expiry: float = 30.0  # Solo transporte httpx (asíncrono)
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    # Los reintentos los gestiona StripeResilience con claves de idempotencia
+    max_network_retries: int = 0
+    verify_ssl_certs: bool = True
+
+
+class _PooledHTTPX:
+    """
+    Módulo httpx para HTTPXClient cuyo AsyncClient lleva los límites del pool.
+
+    HTTPXClient crea su AsyncClient con el `verify` que corresponde a
+    `verify_ssl_certs`; aquí solo se añaden los límites, así no se crea (ni
+    se pierde) un segundo cliente.
+
+    Se inyecta con el parámetro privado `_lib` de stripe.HTTPXClient, el único
+    punto en que la librería deja elegir cómo se crea el AsyncClient. Existe
+    en todas las versiones admitidas por pyproject.toml (stripe>=10.12,<17);
+    antes de ampliar el rango hay que comprobar que sigue ahí.
+    """
+
+    def __init__(self, config: StripeClientConfig) -> None:
+        import httpx
+
+        self._httpx = httpx
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        # Mismo nombre que en httpx: HTTPXClient llama a `_lib.AsyncClient(...)`
+        self.AsyncClient = functools.partial(httpx.AsyncClient, limits=limits)
+
+    def __getattr__(self, name: str):
+        return getattr(self._httpx, name)
+
+
+def build_stripe_client(
+    config: StripeClientConfig | None = None,
+) -> stripe.StripeClient:
+    """
+    Crea un StripeClient síncrono con una sesión HTTP compartida.
+
+    Todos los hilos usan la misma sesión, cuyo pool mantiene hasta
+    `max_connections` conexiones TLS vivas, reutilizadas entre cobros,
+    reembolsos y suscripciones.
+    """
+    config = config or StripeClientConfig()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.max_connections)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return stripe.StripeClient(
+        config.api_key,
+        http_client=stripe.RequestsClient(
+            timeout=(config.connect_timeout, config.read_timeout),
+            session=session,
+            verify_ssl_certs=config.verify_ssl_certs,
+        ),
+        max_network_retries=config.max_network_retries,
+        base_addresses=_base_addresses(config),
+    )
+
+
+def build_async_stripe_client(
+    config: StripeClientConfig | None = None,
+) -> stripe.StripeClient:
+    """Crea un StripeClient asíncrono sobre un pool httpx configurado."""
+    config = config or StripeClientConfig()
+    import httpx
+
+    http_client = stripe.HTTPXClient(
+        timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+        verify_ssl_certs=config.verify_ssl_certs,
+        _lib=_PooledHTTPX(config),
+    )
+    return stripe.StripeClient(
+        config.api_key,
+        http_client=http_client,
+        max_network_retries=config.max_network_retries,
+        base_addresses=_base_addresses(config),
+    )
+
+
+def _base_addresses(config: StripeClientConfig) -> dict[str, str]:
+    return {"api": config.api_base} if config.api_base else {}
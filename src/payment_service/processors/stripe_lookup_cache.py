@@ -0,0 +1,24 @@
+from src.payment_service.cache import LookupCacheProtocol, TTLCache
+from src.payment_service.commons import CustomerData
+
+# Los clientes y métodos de pago cambian poco: 5 minutos evita las consultas
+# repetidas sin servir datos muy viejos
+LOOKUP_TTL_SECONDS = 300.0
+
+
+def default_lookup_cache() -> LookupCacheProtocol:
+    return TTLCache(max_entries=10_000, ttl_seconds=LOOKUP_TTL_SECONDS)
+
+
+def customer_cache_key(customer_data: CustomerData) -> str:
+    """Clave del cliente en caché: su customer_id o, si no lo tiene, su email."""
+    if customer_data.customer_id:
+        return f"id:{customer_data.customer_id}"
+    if not customer_data.contact_info.email:
+        raise ValueError("Email required for subscriptions")
+    return f"email:{customer_data.contact_info.email.lower()}"
+
+
+def payment_method_cache_key(customer_id: str, payment_source: str) -> str:
+    """Clave de un método de pago ya adjuntado a un cliente."""
+    return f"{customer_id}:{payment_source}"
@@ -1,32 +1,115 @@
 import os
-from dataclasses import dataclass
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 import stripe
-from dotenv import load_dotenv
 
+from src.payment_service.cache import LookupCacheProtocol
 from src.payment_service.commons import CustomerData, PaymentData, PaymentResponse
+from src.payment_service.concurrency import SingleFlight
+from src.payment_service.metrics import PipelineMetrics, active_metrics
 from src.payment_service.processors.payment import PaymentProcessorProtocol
 from src.payment_service.processors.recurring import RecurringPaymentProtocol
 from src.payment_service.processors.refunds import RefundPaymentProtocol
-
-_ = load_dotenv()
+from src.payment_service.processors.stripe_client import build_stripe_client
+from src.payment_service.processors.stripe_lookup_cache import (
+    customer_cache_key,
+    default_lookup_cache,
+    payment_method_cache_key,
+)
+from src.payment_service.processors.stripe_resilience import (
+    StripeResilience,
+    write_options,
+)
+from src.payment_service.resilience import CircuitOpenError
 
 
 @dataclass
 class StripePaymentProcessor(
     PaymentProcessorProtocol, RecurringPaymentProtocol, RefundPaymentProtocol
 ):
+    """
+    Procesador de pagos sobre un StripeClient propio.
+
+    El cliente (API key y pool de conexiones) se construye una vez y no se
+    toca el estado global del módulo `stripe`, así una instancia se puede
+    compartir entre hilos. Para ajustar el pool se pasa
+    `client=build_stripe_client(StripeClientConfig(...))`.
+
+    Cada llamada pasa por `resilience`: los errores transitorios (429, 5xx,
+    conexión) se reintentan con la misma clave de idempotencia y un circuit
+    breaker por endpoint falla rápido mientras Stripe no responde.
+
+    `customer_cache` y `payment_method_cache` son cachés read-through de los
+    clientes y métodos de pago ya vistos (None las desactiva). Las consultas o
+    altas concurrentes del mismo cliente se agrupan en una sola llamada.
+
+    Los tiempos de cada paso de `setup_recurring_payment` se imprimen y se
+    registran en la operación "recurring" de `metrics` o, si no se indica, del
+    servicio que hace la llamada (ver metrics.use_metrics).
+    """
+
+    client: stripe.StripeClient = field(default_factory=build_stripe_client)
+    price_id: str = field(default_factory=lambda: os.getenv("STRIPE_PRICE_ID", ""))
+    resilience: StripeResilience = field(default_factory=StripeResilience)
+    customer_cache: LookupCacheProtocol | None = field(
+        default_factory=default_lookup_cache
+    )
+    payment_method_cache: LookupCacheProtocol | None = field(
+        default_factory=default_lookup_cache
+    )
+    metrics: PipelineMetrics | None = None
+    _customer_flights: SingleFlight[str, stripe.Customer] = field(
+        default_factory=SingleFlight, init=False, repr=False
+    )
+
+    def circuit_states(self) -> dict[str, dict[str, object]]:
+        """Estado de los circuit breakers por endpoint, para monitoreo."""
+        return self.resilience.circuit_states()
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Tamaño, aciertos y fallos de las cachés de consultas."""
+        return {
+            name: cache.stats()
+            for name, cache in (
+                ("customers", self.customer_cache),
+                ("payment_methods", self.payment_method_cache),
+            )
+            if cache is not None
+        }
+
+    def invalidate_customer(self, customer_data: CustomerData) -> None:
+        """Olvida el cliente en caché (p. ej. tras modificarlo fuera del servicio)."""
+        if self.customer_cache is not None:
+            self.customer_cache.invalidate(customer_cache_key(customer_data))
+
+    def invalidate_payment_method(self, customer_id: str, payment_source: str) -> None:
+        if self.payment_method_cache is not None:
+            self.payment_method_cache.invalidate(
+                payment_method_cache_key(customer_id, payment_source)
+            )
+
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse:
-        stripe.api_key = os.getenv("STRIPE_API_KEY")
-
         try:
-            charge = stripe.Charge.create(
-                amount=payment_data.amount,
-                currency="usd",
-                source=payment_data.source,
-                description="Charge for " + customer_data.name,
+            options = write_options(idempotency_key)
+            charge = self.resilience.call(
+                "charges",
+                lambda: self.client.v1.charges.create(
+                    params={
+                        "amount": payment_data.amount,
+                        "currency": "usd",
+                        "source": payment_data.source,
+                        "description": "Charge for " + customer_data.name,
+                    },
+                    options=options,
+                ),
             )
             print("Payment successful")
             return PaymentResponse(
@@ -36,7 +119,7 @@ class StripePaymentProcessor(
                 message="Payment successful",
             )
 
-        except stripe.StripeError as e:
+        except (stripe.StripeError, CircuitOpenError) as e:
             print("Payment failed:", e)
             return PaymentResponse(
                 status="failed",
@@ -48,11 +131,15 @@ class StripePaymentProcessor(
     def refund_payment(self, transaction_id: str) -> PaymentResponse:
         """Metodo para hacer un reembolos"""
 
-        stripe.api_key = os.getenv("STRIPE_API_KEY")
-
         try:
             # 1. Crea un reembolso usando el ID del cargo original
-            refund = stripe.Refund.create(charge=transaction_id)
+            options = write_options(None)
+            refund = self.resilience.call(
+                "refunds",
+                lambda: self.client.v1.refunds.create(
+                    params={"charge": transaction_id}, options=options
+                ),
+            )
 
             print("Refund successful")
 
@@ -64,7 +151,7 @@ class StripePaymentProcessor(
                 message="Refund successful",
             )
 
-        except stripe.StripeError as e:
+        except (stripe.StripeError, CircuitOpenError) as e:
             print("Refund failed:", e)
             return PaymentResponse(
                 status="failed",
@@ -76,45 +163,76 @@ class StripePaymentProcessor(
     def setup_recurring_payment(
         self, customer_data: CustomerData, payment_data: PaymentData
     ) -> PaymentResponse:
-        """Metodo que configura pagos automáticos recurrentes"""
-
-        stripe.api_key = os.getenv("STRIPE_API_KEY")
+        """
+        Metodo que configura pagos automáticos recurrentes.
 
-        # Obtiene el id del plan de suscripción
-        price_id = os.getenv("STRIPE_PRICE_ID", "")
+        Son tres llamadas en lugar de cinco: el método de pago se adjunta sin
+        consultarlo antes y se fija como predeterminado en la propia
+        suscripción. Si ya se conoce el ID del cliente, su consulta y el
+        adjunto del método de pago se hacen en paralelo.
+        """
 
+        timings: dict[str, int] = {}
         try:
-            # 1. Obtener o crear cliente en Stripe
-            customer = self._get_or_create_customer(customer_data)
+            # 1 y 2. Obtener o crear el cliente y adjuntarle el método de pago
+            customer_id = customer_data.customer_id
+            if customer_id:
+                # Un hilo por llamada: con N llamadas concurrentes hay N adjuntos
+                # en paralelo, sin esperar a un pool compartido de tamaño fijo
+                with ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="stripe-steps"
+                ) as steps:
+                    attach = steps.submit(
+                        self._timed,
+                        timings,
+                        "payment_method",
+                        lambda: self._attach_payment_method(
+                            customer_id, payment_data.source
+                        ),
+                    )
+                    customer = self._timed(
+                        timings,
+                        "customer",
+                        lambda: self._get_or_create_customer(customer_data),
+                    )
+                    payment_method = attach.result()
+            else:
+                customer = self._timed(
+                    timings,
+                    "customer",
+                    lambda: self._get_or_create_customer(customer_data),
+                )
+                payment_method = self._timed(
+                    timings,
+                    "payment_method",
+                    lambda: self._attach_payment_method(
+                        customer.id, payment_data.source
+                    ),
+                )
 
-            # 2. Adjuntar método de pago al cliente
-            payment_method = self._attach_payment_method(
-                customer.id, payment_data.source
-            )
-
-            # 3. Establecer método de pago como predeterminado
-            self._set_default_payment_method(customer.id, payment_method.id)
-
-            # 4. Crear la suscripción
-            subscription = stripe.Subscription.create(
-                customer=customer.id,
-                items=[
-                    {"price": price_id},  # Plan al que se suscribe
-                ],
-                expand=["latest_invoice.payment_intent"],
+            # 3. Crear la suscripción con el método de pago predeterminado
+            subscription = self._timed(
+                timings,
+                "subscription",
+                lambda: self._create_subscription(customer.id, payment_method.id),
             )
 
             print("Recurring payment setup successful")
+            print(
+                "Recurring setup timings:",
+                ", ".join(f"{step}={ns / 1e6:.1f}ms" for step, ns in timings.items()),
+            )
 
-            # 5. Retornar respuesta exitosa
-            amount = subscription["items"]["data"][0]["price"]["unit_amount"]
+            # 4. Retornar respuesta exitosa
+            # unit_amount es null en precios por niveles: se informa 0
+            amount = subscription["items"]["data"][0]["price"]["unit_amount"] or 0
             return PaymentResponse(
                 status=subscription["status"],
                 amount=amount,
                 transaction_id=subscription["id"],
                 message="Recurring payment setup successful",
             )
-        except stripe.StripeError as e:
+        except (stripe.StripeError, CircuitOpenError) as e:
             print("Recurring payment setup failed:", e)
             return PaymentResponse(
                 status="failed",
@@ -122,19 +240,89 @@ class StripePaymentProcessor(
                 transaction_id=None,
                 message=str(e),
             )
+        finally:
+            self._record(timings)
+
+    def _timed[T](self, timings: dict[str, int], step: str, fn: Callable[[], T]) -> T:
+        """Ejecuta un paso de la suscripción y guarda su duración en ns."""
+        start = time.perf_counter_ns()
+        try:
+            return fn()
+        finally:
+            timings[step] = time.perf_counter_ns() - start
+
+    def _record(self, timings: dict[str, int]) -> None:
+        """Registra los pasos medidos en las métricas propias o del servicio."""
+        metrics = self.metrics or active_metrics()
+        if metrics is not None:
+            for step, elapsed in timings.items():
+                metrics.record("recurring", f"stripe_{step}", elapsed)
+
+    def _create_subscription(
+        self, customer_id: str, payment_method_id: str
+    ) -> stripe.Subscription:
+        options = write_options(None)
+        return self.resilience.call(
+            "subscriptions",
+            lambda: self.client.v1.subscriptions.create(
+                params={
+                    "customer": customer_id,
+                    "items": [
+                        {"price": self.price_id},  # Plan al que se suscribe
+                    ],
+                    # Define qué tarjeta se usará para cobros automáticos
+                    "default_payment_method": payment_method_id,
+                    "expand": ["latest_invoice.payment_intent"],
+                },
+                options=options,
+            ),
+        )
 
     def _get_or_create_customer(self, customer_data: CustomerData) -> stripe.Customer:
         """
         Creates a new customer in Stripe or retrieves an existing one.
+        Returning customers are served from customer_cache.
         """
+        key = customer_cache_key(customer_data)
+        if self.customer_cache is not None:
+            customer = self.customer_cache.get(key)
+            if customer is not None:
+                print(f"Customer cached: {customer.id}")
+                return customer
+
+        return self._customer_flights.do(
+            key, lambda: self._fetch_and_cache_customer(key, customer_data)
+        )
+
+    def _fetch_and_cache_customer(
+        self, key: str, customer_data: CustomerData
+    ) -> stripe.Customer:
+        customer = self._fetch_customer(customer_data)
+        if self.customer_cache is not None:
+            self.customer_cache.set(key, customer)
+            self.customer_cache.set(f"id:{customer.id}", customer)
+        return customer
+
+    def _fetch_customer(self, customer_data: CustomerData) -> stripe.Customer:
         if customer_data.customer_id:
-            customer = stripe.Customer.retrieve(customer_data.customer_id)
+            customer = self.resilience.call(
+                "customers",
+                lambda: self.client.v1.customers.retrieve(customer_data.customer_id),
+            )
             print(f"Customer retrieved: {customer.id}")
         else:
             if not customer_data.contact_info.email:
                 raise ValueError("Email required for subscriptions")
-            customer = stripe.Customer.create(
-                name=customer_data.name, email=customer_data.contact_info.email
+            options = write_options(None)
+            customer = self.resilience.call(
+                "customers",
+                lambda: self.client.v1.customers.create(
+                    params={
+                        "name": customer_data.name,
+                        "email": customer_data.contact_info.email,
+                    },
+                    options=options,
+                ),
             )
             print(f"Customer created: {customer.id}")
         return customer
@@ -143,27 +331,27 @@ class StripePaymentProcessor(
         self, customer_id: str, payment_source: str
     ) -> stripe.PaymentMethod:
         """
-        Attaches a payment method to a customer.
+        Attaches a payment method to a customer, unless payment_method_cache
+        says it is already attached.
         """
-        payment_method = stripe.PaymentMethod.retrieve(payment_source)
-        stripe.PaymentMethod.attach(
-            payment_method.id,
-            customer=customer_id,
+        key = payment_method_cache_key(customer_id, payment_source)
+        if self.payment_method_cache is not None:
+            payment_method = self.payment_method_cache.get(key)
+            if payment_method is not None:
+                print(f"Payment method {payment_method.id} already attached")
+                return payment_method
+
+        # attach devuelve el PaymentMethod, no hace falta consultarlo antes
+        options = write_options(None)
+        payment_method = self.resilience.call(
+            "payment_methods",
+            lambda: self.client.v1.payment_methods.attach(
+                payment_source,
+                params={"customer": customer_id},
+                options=options,
+            ),
         )
         print(f"Payment method {payment_method.id} attached to customer {customer_id}")
+        if self.payment_method_cache is not None:
+            self.payment_method_cache.set(key, payment_method)
         return payment_method
-
-    def _set_default_payment_method(
-        self, customer_id: str, payment_method_id: str
-    ) -> None:
-        """
-        Sets the default payment method for a customer.
-        """
-        # Define qué tarjeta se usará para cobros automáticos
-        stripe.Customer.modify(
-            customer_id,
-            invoice_settings={
-                "default_payment_method": payment_method_id,
-            },
-        )
-        print(f"Default payment method set for customer {customer_id}")
@@ -0,0 +1,77 @@
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import stripe
+
+from src.payment_service.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    retry_call,
+    retry_call_async,
+)
+
+# Un circuit breaker por cada servicio de la API de Stripe que se usa
+STRIPE_ENDPOINTS = (
+    "charges",
+    "refunds",
+    "customers",
+    "payment_methods",
+    "subscriptions",
+)
+
+
+def is_retryable_stripe_error(error: Exception) -> bool:
+    """429, errores de conexión y 5xx son transitorios; el resto no se reintenta."""
+    if isinstance(error, stripe.RateLimitError | stripe.APIConnectionError):
+        return True
+    status = getattr(error, "http_status", None)
+    return (
+        isinstance(error, stripe.StripeError)
+        and status is not None
+        and (status == 429 or status >= 500)
+    )
+
+
+def write_options(idempotency_key: str | None) -> stripe.RequestOptions:
+    """
+    Opciones para una escritura: la misma clave de idempotencia se reutiliza
+    en todos los reintentos de la solicitud.
+    """
+    return {"idempotency_key": idempotency_key or f"retry-{uuid.uuid4()}"}
+
+
+@dataclass
+class StripeResilience:
+    """
+    Reintentos con backoff y circuit breaker por endpoint para las llamadas a
+    Stripe. circuit_states() expone el estado de cada breaker.
+    """
+
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    breakers: dict[str, CircuitBreaker] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.breakers = {
+            endpoint: CircuitBreaker(
+                endpoint,
+                failure_threshold=self.failure_threshold,
+                reset_timeout=self.reset_timeout,
+            )
+            for endpoint in STRIPE_ENDPOINTS
+        }
+
+    def call[R](self, endpoint: str, call: Callable[[], R]) -> R:
+        return retry_call(
+            call, self.retry_policy, self.breakers[endpoint], is_retryable_stripe_error
+        )
+
+    async def call_async[R](self, endpoint: str, call: Callable[[], Awaitable[R]]) -> R:
+        return await retry_call_async(
+            call, self.retry_policy, self.breakers[endpoint], is_retryable_stripe_error
+        )
+
+    def circuit_states(self) -> dict[str, dict[str, object]]:
+        return {name: breaker.snapshot() for name, breaker in self.breakers.items()}
@@ -0,0 +1,21 @@
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .rate_limiter import (
+    RateLimiter,
+    RateLimitMode,
+    SharedTokenBucket,
+    TokenBucket,
+)
+from .retry import RetryPolicy, retry_call, retry_call_async
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "RateLimitMode",
+    "RateLimiter",
+    "RetryPolicy",
+    "SharedTokenBucket",
+    "TokenBucket",
+    "retry_call",
+    "retry_call_async",
+]
@@ -0,0 +1,86 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"  # Las llamadas pasan
+    OPEN = "open"  # Las llamadas fallan de inmediato
+    HALF_OPEN = "half_open"  # Se deja pasar una llamada de prueba
+
+
+class CircuitOpenError(Exception):
+    """La llamada no se hizo porque el circuito del endpoint está abierto."""
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Circuit breaker de un endpoint.
+
+    Tras `failure_threshold` fallos seguidos se abre y rechaza las llamadas
+    durante `reset_timeout` segundos; después deja pasar una llamada de
+    prueba que lo cierra si tiene éxito o lo vuelve a abrir si falla.
+    """
+
+    name: str
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    state: CircuitState = field(default=CircuitState.CLOSED, init=False)
+    consecutive_failures: int = field(default=0, init=False)
+    opened_at: float = field(default=0.0, init=False)
+    rejected: int = field(default=0, init=False)
+    _trial_in_flight: bool = field(default=False, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def before_call(self) -> None:
+        """Lanza CircuitOpenError si la llamada no debe hacerse."""
+        with self._lock:
+            if self.state is CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"Circuit '{self.name}' is open")
+                self.state = CircuitState.HALF_OPEN
+            if self.state is CircuitState.HALF_OPEN:
+                if self._trial_in_flight:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"Circuit '{self.name}' is half-open")
+                self._trial_in_flight = True
+
+    def release_trial(self) -> None:
+        """
+        Libera la llamada de prueba sin cambiar el estado, cuando se cancela
+        (CancelledError, KeyboardInterrupt) antes de saber si el endpoint
+        responde: la siguiente llamada hará de prueba.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if (
+                self.state is CircuitState.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict[str, object]:
+        """Estado para monitoreo."""
+        with self._lock:
+            return {
+                "state": self.state.value,
+                "consecutive_failures": self.consecutive_failures,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,197 @@
+import multiprocessing
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from multiprocessing.shared_memory import SharedMemory
+
+
+class RateLimitMode(Enum):
+    """Qué hacer cuando un bucket se queda sin tokens."""
+
+    BLOCK = "block"  # Esperar hasta que haya token (o hasta max_wait)
+    REJECT = "reject"  # Rechazar de inmediato
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket thread-safe: `rate` tokens por segundo, hasta `capacity`.
+
+    Los contadores (acquired, rejected, waits) son de este proceso y sirven
+    para medir la saturación del limitador.
+    """
+
+    rate: float
+    capacity: float | None = None
+    acquired: int = field(default=0, init=False)
+    rejected: int = field(default=0, init=False)
+    waits: int = field(default=0, init=False)
+    wait_seconds: float = field(default=0.0, init=False)
+    _tokens: float = field(default=0.0, init=False, repr=False)
+    _updated: float = field(default=0.0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _stats_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.capacity is None:
+            self.capacity = max(self.rate, 1.0)
+        self._store(self.capacity, time.monotonic())
+
+    def try_acquire(self, cost: float = 1.0) -> bool:
+        """Toma `cost` tokens si están disponibles, sin esperar."""
+        acquired = self._reserve(cost) == 0.0
+        self._count(acquired)
+        return acquired
+
+    def acquire(self, max_wait: float | None = None, cost: float = 1.0) -> bool:
+        """
+        Espera hasta tomar `cost` tokens. Devuelve False si harían falta más
+        de `max_wait` segundos (None espera lo necesario).
+        """
+        start = time.monotonic()
+        deadline = None if max_wait is None else start + max_wait
+        while True:
+            wait = self._reserve(cost)
+            if wait == 0.0:
+                self._count(True, time.monotonic() - start)
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self._count(False)
+                return False
+            time.sleep(wait)
+
+    def available(self) -> float:
+        with self._lock:
+            tokens, updated = self._load()
+            now = time.monotonic()
+            return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def snapshot(self) -> dict[str, float]:
+        """Contadores y saturación (0 = bucket lleno, 1 = sin tokens)."""
+        available = self.available()
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "available": available,
+            "saturation": 1.0 - available / self.capacity,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "waits": self.waits,
+            "wait_seconds": self.wait_seconds,
+        }
+
+    def _count(self, acquired: bool, waited: float = 0.0) -> None:
+        with self._stats_lock:
+            if not acquired:
+                self.rejected += 1
+                return
+            self.acquired += 1
+            if waited > 0.0005:
+                self.waits += 1
+                self.wait_seconds += waited
+
+    def _reserve(self, cost: float = 1.0) -> float:
+        """Toma `cost` tokens y devuelve 0.0, o los segundos hasta tenerlos."""
+        if cost > self.capacity:
+            raise ValueError(f"cost {cost} exceeds bucket capacity {self.capacity}")
+        with self._lock:
+            tokens, updated = self._load()
+            now = time.monotonic()
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+            if tokens >= cost:
+                self._store(tokens - cost, now)
+                return 0.0
+            self._store(tokens, now)
+            return (cost - tokens) / self.rate
+
+    def _load(self) -> tuple[float, float]:
+        return self._tokens, self._updated
+
+    def _store(self, tokens: float, updated: float) -> None:
+        self._tokens, self._updated = tokens, updated
+
+
+_STATE = struct.Struct("dd")  # tokens, instante de la última recarga
+
+
+@dataclass
+class SharedTokenBucket(TokenBucket):
+    """
+    TokenBucket cuyo estado vive en memoria compartida, para que varios
+    procesos respeten el mismo límite.
+
+    Se crea en el proceso padre y se pasa tal cual a los hijos (por ejemplo
+    como argumento de `multiprocessing.Process`); cada hijo se conecta al mismo
+    segmento por su nombre. El creador llama a `unlink()` al terminar.
+    """
+
+    _lock: threading.Lock = field(default_factory=multiprocessing.Lock, repr=False)
+    _memory: SharedMemory = field(
+        default_factory=lambda: SharedMemory(create=True, size=_STATE.size),
+        repr=False,
+    )
+
+    def close(self) -> None:
+        self._memory.close()
+
+    def unlink(self) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+    def __getstate__(self) -> dict:
+        # Los contadores son por proceso: el hijo empieza de cero
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "lock": self._lock,
+            "name": self._memory.name,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.rate = state["rate"]
+        self.capacity = state["capacity"]
+        self._lock = state["lock"]
+        self._memory = SharedMemory(name=state["name"])
+        self._stats_lock = threading.Lock()
+        self.acquired = self.rejected = self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _load(self) -> tuple[float, float]:
+        return _STATE.unpack_from(self._memory.buf)
+
+    def _store(self, tokens: float, updated: float) -> None:
+        _STATE.pack_into(self._memory.buf, 0, tokens, updated)
+
+
+@dataclass
+class RateLimiter:
+    """
+    Un TokenBucket por endpoint ("charges", "refunds", "subscriptions"...).
+
+    Los endpoints sin bucket no se limitan; varios endpoints pueden compartir
+    el mismo bucket para aplicar un límite global.
+    """
+
+    buckets: dict[str, TokenBucket]
+    mode: RateLimitMode = RateLimitMode.BLOCK
+    max_wait: float | None = None
+
+    def acquire(self, endpoint: str, cost: float = 1.0) -> bool:
+        """Toma `cost` tokens del bucket del endpoint (uno por llamada saliente)."""
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            return True
+        if self.mode is RateLimitMode.REJECT:
+            return bucket.try_acquire(cost)
+        return bucket.acquire(self.max_wait, cost)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {
+            endpoint: bucket.snapshot() for endpoint, bucket in self.buckets.items()
+        }
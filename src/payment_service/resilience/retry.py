@@ -0,0 +1,86 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from .circuit_breaker import CircuitBreaker
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Reintentos con backoff exponencial y jitter completo."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+
+    def backoff(self, attempt: int) -> float:
+        """Espera antes del reintento número `attempt` (empezando en 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+def retry_call[R](
+    call: Callable[[], R],
+    policy: RetryPolicy,
+    breaker: CircuitBreaker,
+    is_retryable: Callable[[Exception], bool],
+) -> R:
+    """
+    Ejecuta `call` a través del circuit breaker, reintentando los errores
+    que `is_retryable` considera transitorios. Solo esos errores cuentan como
+    fallos del breaker; el resto (p. ej. una tarjeta rechazada) se propaga
+    sin reintentar.
+    """
+    attempt = 1
+    while True:
+        breaker.before_call()
+        try:
+            result = call()
+        except Exception as e:
+            if not is_retryable(e):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+        except BaseException:
+            # Cancelada a mitad: sin resultado, pero la prueba no puede quedar
+            # tomada o el breaker seguiría medio abierto para siempre
+            breaker.release_trial()
+            raise
+        else:
+            breaker.record_success()
+            return result
+        time.sleep(policy.backoff(attempt))
+        attempt += 1
+
+
+async def retry_call_async[R](
+    call: Callable[[], Awaitable[R]],
+    policy: RetryPolicy,
+    breaker: CircuitBreaker,
+    is_retryable: Callable[[Exception], bool],
+) -> R:
+    """Versión asíncrona de retry_call."""
+    attempt = 1
+    while True:
+        breaker.before_call()
+        try:
+            result = await call()
+        except Exception as e:
+            if not is_retryable(e):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+        except BaseException:
+            # Como en retry_call: una cancelación libera la llamada de prueba
+            breaker.release_trial()
+            raise
+        else:
+            breaker.record_success()
+            return result
+        await asyncio.sleep(policy.backoff(attempt))
+        attempt += 1
@@ -1,16 +1,19 @@
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Self
 
-from stripe import StripeError
-
 from src.payment_service.commons import (
+    BatchItemResult,
+    BatchResult,
     CustomerData,
     PaymentData,
     PaymentResponse,
-    Request,
 )
 from src.payment_service.factory import PaymentProcessorFactory
+from src.payment_service.idempotency import IdempotencyStore
 from src.payment_service.listeners.manager import ListenerManager
+from src.payment_service.metrics import PipelineMetrics, use_metrics
 from src.payment_service.processors import (
     PaymentProcessorProtocol,
     RecurringPaymentProtocol,
@@ -20,12 +23,13 @@ from src.payment_service.validators import ChainHandler
 
 from .loggers import TransactionLogger
 from .notifiers import NotifierProtocol
+from .service_flow import ServiceFlow
 from .service_protocol import PaymentServiceProtocol
 
 
 @dataclass
 # paso 2, implementar la clase concreta del servicio de pagos
-class PaymentService(PaymentServiceProtocol):
+class PaymentService(ServiceFlow, PaymentServiceProtocol):
     payment_processor: PaymentProcessorProtocol
     notifier: NotifierProtocol
     validator: ChainHandler
@@ -33,6 +37,8 @@ class PaymentService(PaymentServiceProtocol):
     listener: ListenerManager
     recurring_processor: RecurringPaymentProtocol | None = None
     refund_processor: RefundPaymentProtocol | None = None
+    idempotency_store: IdempotencyStore | None = None
+    metrics: PipelineMetrics | None = None
 
     @classmethod
     def create_with_payment_processor(cls, payment_data: PaymentData, **kwargs) -> Self:
@@ -49,57 +55,127 @@ class PaymentService(PaymentServiceProtocol):
         self.notifier = notifier
 
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse:
-        """Procesa un pago único"""
+        """
+        Procesa un pago único.
+
+        Con un IdempotencyStore configurado, un reintento con la misma
+        `idempotency_key` recibe la respuesta guardada. Sin clave, solo un
+        Request idéntico dentro de la ventana corta de huellas se trata como
+        duplicado.
+        """
+
+        with self._stage("transaction", "total"):
+            return self._process_transaction(
+                customer_data, payment_data, idempotency_key
+            )
 
+    def _process_transaction(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None,
+    ) -> PaymentResponse:
         # require_contact = not isinstance(self.notifier, LogOnlyNotifier)
 
         try:
-            request = Request(customer_data=customer_data, payment_data=payment_data)
-            self.validator.handle(request=request)
+            request = self._validate("transaction", customer_data, payment_data)
         except Exception as e:
             print(f"Fallo en las validaciones: {e}")
             raise e
+        payment_data = request.payment_data
 
-        try:
+        cached_response, request_fingerprint = self._cached_response(
+            request, idempotency_key
+        )
+        if cached_response:
+            return cached_response
+
+        with self._stage("transaction", "processor"):
             payment_response = self.payment_processor.process_transaction(
-                customer_data, payment_data
-            )
-            self.listener.notify(
-                f"Pago exitoso: {payment_response}\n{payment_response.transaction_id}"
+                customer_data, payment_data, idempotency_key=idempotency_key
             )
-            if payment_response.status == "succeeded":
-                self.notifier.send_confirmation(customer_data)
-            else:
-                # Notificar internamente (listeners)
-                self.listener.notify(
-                    f"Error en el pago - Motivo: {payment_response.message}"
-                )
-
-                # Notificar al CLIENTE del fallo
-                self.notifier.send_failure_notification(
-                    customer_data, str(payment_response.message)
+        self._remember(idempotency_key, request_fingerprint, payment_response)
+        self._record_payment(
+            "transaction", customer_data, payment_data, payment_response
+        )
+        return payment_response
+
+    def process_batch(
+        self,
+        transactions: Iterable[tuple[CustomerData, PaymentData]],
+        max_workers: int = 8,
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchResult:
+        """
+        Procesa un lote de pagos únicos.
+
+        Valida todo el lote antes de cobrar, procesa las filas válidas con a lo
+        sumo `max_workers` cobros en paralelo y difiere listeners, notificaciones
+        y logs a una pasada final. Una fila inválida o con error no aborta el lote.
+        Acepta las PaymentRow de un PaymentBatch como `payment_data` y las
+        procesa sin convertirlas en modelos.
+
+        `idempotency_keys[i]` identifica la fila i (p. ej. archivo y número de
+        fila): llega al procesador y al IdempotencyStore como en
+        `process_transaction`, así reenviar el lote no cobra dos veces.
+        """
+        pairs = list(transactions)
+
+        # 1. Validar todo el lote
+        items, valid_indexes = self._validate_batch(pairs, idempotency_keys)
+
+        # Filas ya cobradas según el IdempotencyStore: no se registran de nuevo
+        replayed: set[int] = set()
+
+        def charge(index: int) -> PaymentResponse:
+            customer_data, payment_data = pairs[index]
+            key = idempotency_keys[index] if idempotency_keys else None
+            if key and self.idempotency_store:
+                cached_response = self.idempotency_store.get(key)
+                if cached_response:
+                    replayed.add(index)
+                    return cached_response
+            with self._stage("batch", "processor"):
+                payment_response = self.payment_processor.process_transaction(
+                    customer_data, payment_data, idempotency_key=key
                 )
-
-            self.logger.log(customer_data, payment_data, payment_response)
+            self._remember(key, None, payment_response)
             return payment_response
 
-        except StripeError as e:
-            raise e
+        # 2. Procesar con concurrencia acotada
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(charge, i): i for i in valid_indexes}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    items[index] = BatchItemResult(
+                        index=index, status="processed", response=future.result()
+                    )
+                except Exception as e:
+                    items[index] = BatchItemResult(
+                        index=index, status="error", error=str(e)
+                    )
+
+        # 3. Sinks diferidos: un único log del lote, listeners y notificaciones
+        self._record_batch(self._processed(pairs, items, replayed))
+
+        return BatchResult(items=[item for item in items if item is not None])
 
     def process_refund(self, transaction_id: str) -> PaymentResponse:
         """Procesa un reembolso de un pago previo"""
         if not self.refund_processor:
             raise NotImplementedError("Refunds not supported by this processor")
 
-        try:
-            refund_response = self.refund_processor.refund_payment(transaction_id)
-            self.logger.log_refund(transaction_id, refund_response)
-            return refund_response
-
-        except StripeError as e:
-            raise e
+        with self._stage("refund", "total"):
+            with self._stage("refund", "processor"):
+                refund_response = self.refund_processor.refund_payment(transaction_id)
+            self._record_refund(transaction_id, refund_response)
+        return refund_response
 
     def setup_recurring(
         self, customer_data: CustomerData, payment_data: PaymentData
@@ -110,19 +186,18 @@ class PaymentService(PaymentServiceProtocol):
                 "Recurring payments not supported by this processor"
             )
 
-        try:
-            request = Request(customer_data=customer_data, payment_data=payment_data)
-            self.validator.handle(request=request)
-        except ValueError as e:
-            raise e
+        with self._stage("recurring", "total"):
+            return self._setup_recurring(customer_data, payment_data)
 
-        try:
+    def _setup_recurring(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        request = self._validate("recurring", customer_data, payment_data)
+        payment_data = request.payment_data
+
+        with self._stage("recurring", "processor"), use_metrics(self.metrics):
             recurring_response = self.recurring_processor.setup_recurring_payment(
                 customer_data, payment_data
             )
-            self.notifier.send_confirmation(customer_data)
-            self.logger.log(customer_data, payment_data, recurring_response)
-            return recurring_response
-
-        except StripeError as e:
-            raise e
+        self._record_subscription(customer_data, payment_data, recurring_response)
+        return recurring_response
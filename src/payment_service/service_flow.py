@@ -0,0 +1,219 @@
+from collections.abc import Sequence
+from contextlib import AbstractContextManager, nullcontext
+
+from src.payment_service.commons import (
+    BatchItemResult,
+    CustomerData,
+    PaymentData,
+    PaymentResponse,
+    Request,
+    RowRequest,
+)
+from src.payment_service.idempotency import IdempotencyStore, fingerprint
+from src.payment_service.listeners.events import (
+    PaymentFailed,
+    PaymentSucceeded,
+    RefundProcessed,
+    SubscriptionCreated,
+)
+from src.payment_service.listeners.manager import ListenerManager
+from src.payment_service.metrics import PipelineMetrics
+from src.payment_service.validators import ChainHandler
+
+from .loggers import TransactionLogger
+from .notifiers import NotifierProtocol
+
+# Context manager compartido cuando las métricas están desactivadas
+_NO_TIMER = nullcontext()
+
+# (customer_data, payment_data, respuesta) de un pago ya procesado
+type ProcessedPayment = tuple[CustomerData, PaymentData, PaymentResponse]
+
+
+class ServiceFlow:
+    """
+    Pasos comunes de PaymentService y AsyncPaymentService.
+
+    Validación, idempotencia y sinks (log, listeners y notificaciones) no
+    dependen de cómo se espera al procesador, así los dos servicios siguen el
+    mismo flujo. Los sinks son síncronos: AsyncPaymentService los ejecuta con
+    `asyncio.to_thread` para no bloquear el event loop.
+    """
+
+    notifier: NotifierProtocol
+    validator: ChainHandler
+    logger: TransactionLogger
+    listener: ListenerManager
+    idempotency_store: IdempotencyStore | None
+    metrics: PipelineMetrics | None
+
+    def metrics_snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Latencias por operación y etapa; vacío si las métricas están desactivadas."""
+        return self.metrics.snapshot() if self.metrics else {}
+
+    def _stage(self, operation: str, stage: str) -> AbstractContextManager:
+        """Timer de una etapa, o un context manager vacío sin métricas."""
+        if self.metrics is None:
+            return _NO_TIMER
+        return self.metrics.stage(operation, stage)
+
+    def _validate(
+        self, operation: str, customer_data: CustomerData, payment_data: PaymentData
+    ) -> Request | RowRequest:
+        with self._stage(operation, "validation"):
+            request = Request.of(customer_data, payment_data)
+            self.validator.handle(request=request)
+        return request
+
+    def _cached_response(
+        self, request: Request | RowRequest, idempotency_key: str | None
+    ) -> tuple[PaymentResponse | None, str | None]:
+        """
+        Respuesta guardada para el pago y huella con la que guardar la nueva.
+
+        Sin clave explícita, la huella solo cubre dobles envíos inmediatos y
+        no se pasa a la pasarela (Stripe la recordaría 24 h).
+        """
+        if not self.idempotency_store:
+            return None, None
+        request_fingerprint = None
+        if idempotency_key:
+            cached_response = self.idempotency_store.get(idempotency_key)
+        else:
+            request_fingerprint = fingerprint(request)
+            cached_response = self.idempotency_store.get_recent(request_fingerprint)
+        if cached_response:
+            print(
+                f"Solicitud duplicada {idempotency_key or request_fingerprint}: "
+                "respuesta en caché"
+            )
+        return cached_response, request_fingerprint
+
+    def _remember(
+        self,
+        idempotency_key: str | None,
+        request_fingerprint: str | None,
+        payment_response: PaymentResponse,
+    ) -> None:
+        if not self.idempotency_store:
+            return
+        if idempotency_key:
+            self.idempotency_store.save(idempotency_key, payment_response)
+        elif request_fingerprint:
+            self.idempotency_store.save_recent(request_fingerprint, payment_response)
+
+    def _validate_batch(
+        self,
+        pairs: list[tuple[CustomerData, PaymentData]],
+        idempotency_keys: Sequence[str] | None,
+    ) -> tuple[list[BatchItemResult | None], list[int]]:
+        """
+        Valida todo el lote antes de cobrar.
+
+        Devuelve un resultado "invalid" por cada fila que no pasa y los índices
+        de las válidas. Las PaymentRow de un PaymentBatch se quedan en `pairs`
+        tal cual, sin convertirlas en modelos.
+        """
+        if idempotency_keys is not None and len(idempotency_keys) != len(pairs):
+            raise ValueError("idempotency_keys must have one key per transaction")
+        items: list[BatchItemResult | None] = [None] * len(pairs)
+        valid_indexes: list[int] = []
+        with self._stage("batch", "validation"):
+            for index, (customer_data, payment_data) in enumerate(pairs):
+                try:
+                    request = Request.of(customer_data, payment_data)
+                    self.validator.handle(request=request)
+                except Exception as e:
+                    items[index] = BatchItemResult(
+                        index=index, status="invalid", error=str(e)
+                    )
+                else:
+                    pairs[index] = (customer_data, request.payment_data)
+                    valid_indexes.append(index)
+        return items, valid_indexes
+
+    @staticmethod
+    def _processed(
+        pairs: list[tuple[CustomerData, PaymentData]],
+        items: list[BatchItemResult | None],
+        replayed: set[int],
+    ) -> list[ProcessedPayment]:
+        """Pagos del lote que hay que registrar: los cobrados en esta pasada."""
+        return [
+            (*pairs[item.index], item.response)
+            for item in items
+            if item is not None
+            and item.response is not None
+            and item.index not in replayed
+        ]
+
+    def _record_payment(
+        self,
+        operation: str,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        payment_response: PaymentResponse,
+    ) -> None:
+        with self._stage(operation, "logger"):
+            self.logger.log(customer_data, payment_data, payment_response)
+        self._notify_result(operation, customer_data, payment_response)
+
+    def _record_batch(self, processed: list[ProcessedPayment]) -> None:
+        """Sinks diferidos: un único log del lote, listeners y notificaciones"""
+        with self._stage("batch", "logger"):
+            self.logger.log_batch(processed)
+        for customer_data, _, payment_response in processed:
+            try:
+                self._notify_result("batch", customer_data, payment_response)
+            except Exception as e:
+                print(
+                    f"Fallo al notificar el pago {payment_response.transaction_id}: {e}"
+                )
+
+    def _record_refund(
+        self, transaction_id: str, refund_response: PaymentResponse
+    ) -> None:
+        with self._stage("refund", "logger"):
+            self.logger.log_refund(transaction_id, refund_response)
+        with self._stage("refund", "listeners"):
+            self.listener.publish(RefundProcessed, transaction_id, refund_response)
+
+    def _record_subscription(
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        recurring_response: PaymentResponse,
+    ) -> None:
+        with self._stage("recurring", "logger"):
+            self.logger.log(customer_data, payment_data, recurring_response)
+        with self._stage("recurring", "listeners"):
+            self.listener.publish(
+                SubscriptionCreated, customer_data, recurring_response
+            )
+        with self._stage("recurring", "notifier"):
+            self.notifier.send_confirmation(customer_data)
+
+    def _notify_result(
+        self,
+        operation: str,
+        customer_data: CustomerData,
+        payment_response: PaymentResponse,
+    ) -> None:
+        """Avisa a los listeners y al cliente del resultado de un pago"""
+        succeeded = payment_response.status == "succeeded"
+        with self._stage(operation, "listeners"):
+            # Notificar internamente (listeners)
+            self.listener.publish(
+                PaymentSucceeded if succeeded else PaymentFailed,
+                customer_data,
+                payment_response,
+            )
+
+        with self._stage(operation, "notifier"):
+            if succeeded:
+                self.notifier.send_confirmation(customer_data)
+            else:
+                # Notificar al CLIENTE del fallo
+                self.notifier.send_failure_notification(
+                    customer_data, str(payment_response.message)
+                )
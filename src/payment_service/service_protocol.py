@@ -1,5 +1,7 @@
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
+from src.payment_service.commons.batch_result import BatchResult
 from src.payment_service.commons.customer import CustomerData
 from src.payment_service.commons.payment_data import PaymentData
 from src.payment_service.commons.payment_response import PaymentResponse
@@ -13,6 +15,7 @@ from src.payment_service.validators import ChainHandler
 
 
 # paso 1, definir una interfaz para el servicio de pagos
+# (AsyncPaymentServiceProtocol es su versión asíncrona)
 class PaymentServiceProtocol(Protocol):
     payment_processor: PaymentProcessorProtocol
     notifier: NotifierProtocol
@@ -23,9 +26,19 @@ class PaymentServiceProtocol(Protocol):
     refund_processor: RefundPaymentProtocol | None = None
 
     def process_transaction(
-        self, customer_data: CustomerData, payment_data: PaymentData
+        self,
+        customer_data: CustomerData,
+        payment_data: PaymentData,
+        idempotency_key: str | None = None,
     ) -> PaymentResponse: ...
 
+    def process_batch(
+        self,
+        transactions: Iterable[tuple[CustomerData, PaymentData]],
+        max_workers: int = 8,
+        idempotency_keys: Sequence[str] | None = None,
+    ) -> BatchResult: ...
+
     def process_refund(self, transaction_id: str) -> PaymentResponse: ...
 
     def setup_recurring(
@@ -0,0 +1,4 @@
+from .profile import LatencyProfile, StubProfile
+from .server import StripeStubServer
+
+__all__ = ["LatencyProfile", "StripeStubServer", "StubProfile"]
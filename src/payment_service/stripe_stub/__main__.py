@@ -0,0 +1,50 @@
+"""
+Arranca el stand-in local de Stripe.
+
+    python -m src.payment_service.stripe_stub --latency lognormal \
+        --median-ms 40 --p99-ms 250 --error-rate 0.01 --rate-limit-rate 0.02
+
+y apunta los procesadores a él con STRIPE_API_BASE=http://127.0.0.1:12111.
+"""
+
+import argparse
+
+from .profile import LatencyProfile, StubProfile
+from .server import StripeStubServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stand-in local de la API de Stripe")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=12111)
+    parser.add_argument(
+        "--latency",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="fixed",
+    )
+    parser.add_argument("--median-ms", type=float, default=0.0)
+    parser.add_argument("--p99-ms", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    profile = StubProfile(
+        latency=LatencyProfile(args.latency, args.median_ms, args.p99_ms),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    server = StripeStubServer((args.host, args.port), profile)
+    print(f"Stripe stub listening on {server.api_base}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Requests served: {server.requests_served}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Literal
+
+# z de la normal estándar para el percentil 99
+_Z_P99 = 2.3263
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    Distribución de la latencia simulada de un endpoint, en milisegundos.
+
+    - "fixed": siempre `median_ms`.
+    - "uniform": entre 0 y 2 * `median_ms`.
+    - "exponential": exponencial con mediana `median_ms`.
+    - "lognormal": log-normal con mediana `median_ms` y p99 `p99_ms`, la
+      forma típica de la latencia de una API remota.
+    """
+
+    distribution: Literal["fixed", "uniform", "exponential", "lognormal"] = "fixed"
+    median_ms: float = 0.0
+    p99_ms: float | None = None
+
+    def sample(self, rng: random.Random) -> float:
+        """Devuelve una latencia en segundos."""
+        if self.median_ms <= 0:
+            return 0.0
+        match self.distribution:
+            case "fixed":
+                ms = self.median_ms
+            case "uniform":
+                ms = rng.uniform(0.0, 2 * self.median_ms)
+            case "exponential":
+                ms = rng.expovariate(math.log(2) / self.median_ms)
+            case "lognormal":
+                p99 = self.p99_ms or 4 * self.median_ms
+                sigma = math.log(p99 / self.median_ms) / _Z_P99
+                ms = rng.lognormvariate(math.log(self.median_ms), sigma)
+        return ms / 1000
+
+
+@dataclass(frozen=True)
+class StubProfile:
+    """
+    Comportamiento del stand-in de Stripe.
+
+    `latency` da la latencia por defecto y `endpoint_latency` la sobrescribe
+    por endpoint ("charges", "refunds", "customers", "payment_methods",
+    "subscriptions"). `error_rate` es la fracción de peticiones que fallan con
+    500 y `rate_limit_rate` la fracción que recibe un 429.
+    """
+
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    endpoint_latency: dict[str, LatencyProfile] = field(default_factory=dict)
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    seed: int | None = None
+
+    def latency_for(self, endpoint: str) -> LatencyProfile:
+        return self.endpoint_latency.get(endpoint, self.latency)
@@ -0,0 +1,262 @@
+import itertools
+import json
+import random
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+from src.payment_service.cache import TTLCache
+
+from .profile import StubProfile
+
+
+class StripeStubServer(ThreadingHTTPServer):
+    """
+    Stand-in local de la API de Stripe para pruebas de carga.
+
+    Implementa los endpoints que usan los procesadores de Stripe: cargos,
+    reembolsos, clientes, métodos de pago y suscripciones. Guarda en memoria lo
+    creado, respeta Idempotency-Key y simula latencia, errores 500 y 429
+    según el `StubProfile`. Con keep-alive HTTP/1.1 y un hilo por conexión
+    aguanta miles de peticiones por segundo en una sola máquina.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 12111),
+        profile: StubProfile | None = None,
+    ) -> None:
+        super().__init__(address, _StripeStubHandler)
+        self.profile = profile or StubProfile()
+        self.requests_served = 0
+        self._ids = itertools.count(1)
+        self._objects: dict[str, dict] = {}
+        self._idempotent: TTLCache[str, tuple[int, bytes]] = TTLCache(
+            max_entries=100_000, ttl_seconds=24 * 3600.0
+        )
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.profile.seed)
+
+    @property
+    def api_base(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_in_background(self) -> threading.Thread:
+        """Arranca el servidor en un hilo daemon (útil en benchmarks)."""
+        thread = threading.Thread(
+            target=self.serve_forever, name="stripe-stub", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def new_id(self, prefix: str) -> str:
+        return f"{prefix}_stub{next(self._ids):010d}"
+
+    def store(self, obj: dict) -> dict:
+        with self._lock:
+            self._objects[obj["id"]] = obj
+        return obj
+
+    def lookup(self, object_id: str) -> dict | None:
+        with self._lock:
+            return self._objects.get(object_id)
+
+    def replay(self, key: str) -> tuple[int, bytes] | None:
+        """Respuesta ya enviada para esta Idempotency-Key, si la hay."""
+        return self._idempotent.get(key)
+
+    def remember(self, key: str, response: tuple[int, bytes]) -> None:
+        self._idempotent.set(key, response)
+
+    def draw(self, endpoint: str) -> tuple[float, float]:
+        """Latencia (s) y un número uniforme para decidir la falla inyectada."""
+        with self._lock:
+            self.requests_served += 1
+            latency = self.profile.latency_for(endpoint).sample(self._rng)
+            return latency, self._rng.random()
+
+
+class _StripeStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: el pool del cliente reutiliza
+    # Cabeceras y cuerpo salen en dos writes; con Nagle cada respuesta
+    # esperaría al ACK retardado del cliente (~40 ms)
+    disable_nagle_algorithm = True
+    server: StripeStubServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Sin log por petición: a miles por segundo domina el tiempo
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode() if length else ""
+        params = dict(parse_qsl(body))
+        parts = self.path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) < 2 or parts[0] != "v1":
+            return self._error(HTTPStatus.NOT_FOUND, "invalid_request_error", "")
+        endpoint = parts[1]
+
+        latency, roll = self.server.draw(endpoint)
+        if latency:
+            time.sleep(latency)
+
+        profile = self.server.profile
+        if roll < profile.rate_limit_rate:
+            return self._error(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                "invalid_request_error",
+                "Too many requests hit the API too quickly.",
+                code="rate_limit",
+            )
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            return self._error(
+                HTTPStatus.INTERNAL_SERVER_ERROR, "api_error", "Injected error"
+            )
+
+        key = self.headers.get("Idempotency-Key")
+        if method == "POST" and key:
+            cached = self.server.replay(f"{self.path}:{key}")
+            if cached is not None:
+                return self._send(*cached)
+
+        status, payload = self._route(method, parts[1:], params)
+        response = (int(status), json.dumps(payload).encode())
+        if method == "POST" and key and status < 500:
+            self.server.remember(f"{self.path}:{key}", response)
+        self._send(*response)
+
+    def _route(
+        self, method: str, parts: list[str], params: dict[str, str]
+    ) -> tuple[HTTPStatus, dict]:
+        server = self.server
+        match method, parts:
+            case "POST", ["charges"]:
+                return HTTPStatus.OK, server.store(
+                    {
+                        "id": server.new_id("ch"),
+                        "object": "charge",
+                        "amount": int(params.get("amount", 0)),
+                        "currency": params.get("currency", "usd"),
+                        "description": params.get("description"),
+                        "status": "succeeded",
+                    }
+                )
+            case "POST", ["refunds"]:
+                charge = server.lookup(params.get("charge", ""))
+                if charge is None:
+                    return self._missing("charge", params.get("charge"))
+                return HTTPStatus.OK, server.store(
+                    {
+                        "id": server.new_id("re"),
+                        "object": "refund",
+                        "amount": charge["amount"],
+                        "charge": charge["id"],
+                        "status": "succeeded",
+                    }
+                )
+            case "POST", ["customers"]:
+                return HTTPStatus.OK, server.store(
+                    {
+                        "id": server.new_id("cus"),
+                        "object": "customer",
+                        "name": params.get("name"),
+                        "email": params.get("email"),
+                    }
+                )
+            case "GET", ["customers", customer_id]:
+                customer = server.lookup(customer_id)
+                if customer is None:
+                    return self._missing("customer", customer_id)
+                return HTTPStatus.OK, customer
+            case "POST", ["customers", customer_id]:
+                customer = server.lookup(customer_id)
+                if customer is None:
+                    return self._missing("customer", customer_id)
+                customer["default_payment_method"] = params.get(
+                    "invoice_settings[default_payment_method]"
+                )
+                return HTTPStatus.OK, customer
+            case "GET", ["payment_methods", payment_method_id]:
+                return HTTPStatus.OK, {
+                    "id": payment_method_id,
+                    "object": "payment_method",
+                    "customer": None,
+                }
+            case "POST", ["payment_methods", payment_method_id, "attach"]:
+                return HTTPStatus.OK, server.store(
+                    {
+                        "id": payment_method_id,
+                        "object": "payment_method",
+                        "customer": params.get("customer"),
+                    }
+                )
+            case "POST", ["subscriptions"]:
+                if server.lookup(params.get("customer", "")) is None:
+                    return self._missing("customer", params.get("customer"))
+                subscription_id = server.new_id("sub")
+                return HTTPStatus.OK, server.store(
+                    {
+                        "id": subscription_id,
+                        "object": "subscription",
+                        "customer": params["customer"],
+                        "default_payment_method": params.get("default_payment_method"),
+                        "status": "active",
+                        "items": {
+                            "object": "list",
+                            "data": [
+                                {
+                                    "id": server.new_id("si"),
+                                    "object": "subscription_item",
+                                    "price": {
+                                        "id": params.get("items[0][price]"),
+                                        "object": "price",
+                                        "unit_amount": 999,
+                                    },
+                                }
+                            ],
+                        },
+                        "latest_invoice": {
+                            "id": server.new_id("in"),
+                            "object": "invoice",
+                            "subscription": subscription_id,
+                        },
+                    }
+                )
+        return self._missing("resource", "/".join(parts))
+
+    @staticmethod
+    def _missing(kind: str, object_id: str | None) -> tuple[HTTPStatus, dict]:
+        return HTTPStatus.NOT_FOUND, {
+            "error": {
+                "type": "invalid_request_error",
+                "code": "resource_missing",
+                "message": f"No such {kind}: '{object_id}'",
+            }
+        }
+
+    def _error(
+        self, status: HTTPStatus, error_type: str, message: str, code: str = ""
+    ) -> None:
+        error = {"type": error_type, "message": message}
+        if code:
+            error["code"] = code
+        self._send(int(status), json.dumps({"error": error}).encode())
+
+    def _send(self, status: int, payload: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Request-Id", f"req_stub{self.server.requests_served}")
+        self.end_headers()
+        self.wfile.write(payload)
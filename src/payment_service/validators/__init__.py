@@ -1,14 +1,39 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .chain_handler import ChainHandler
+from .compiled_chain import CompiledChain, ValidationErrors, ValidationMode
 from .customer import CustomerData
 from .customer_handler import CustomerHandler
 from .payment import PaymentData, PaymentDataValidator
 from .payment_handler import PaymentHandler
+from .rules import ERROR_MESSAGES, PAYMENT_RULES, PaymentRule
+
+if TYPE_CHECKING:
+    from .batch import BatchPaymentValidator
+
+
+def __getattr__(name: str):
+    # El validador por lotes necesita NumPy (opcional): se importa al usarlo
+    if name == "BatchPaymentValidator":
+        value = importlib.import_module(".batch", __name__).BatchPaymentValidator
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
-    "CustomerData",
-    "PaymentData",
+    "ERROR_MESSAGES",
+    "PAYMENT_RULES",
+    "BatchPaymentValidator",
     "ChainHandler",
+    "CompiledChain",
+    "CustomerData",
     "CustomerHandler",
+    "PaymentData",
     "PaymentDataValidator",
     "PaymentHandler",
+    "PaymentRule",
+    "ValidationErrors",
+    "ValidationMode",
 ]
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depende del entorno
+    raise ImportError(
+        "BatchPaymentValidator requiere NumPy: "
+        "pip install 'solid-design-patterns[batch]'"
+    ) from e
+
+from .rules import ERROR_MESSAGES, PAYMENT_RULES, VALID
+
+if TYPE_CHECKING:
+    from src.payment_service.commons import PaymentBatch
+
+
+@dataclass
+class BatchPaymentValidator:
+    """
+    Valida un lote columnar de pagos con operaciones vectorizadas.
+
+    Recibe arrays alineados por fila (importes, códigos de PaymentType y
+    máscara de source presente) y evalúa cada regla de `rules.PAYMENT_RULES`
+    sobre el lote completo. Devuelve un array con el código de error de cada
+    fila (0 si es válida), el mismo que reportaría PaymentDataValidator.
+    """
+
+    def validate(
+        self,
+        amounts: np.ndarray,
+        type_codes: np.ndarray,
+        source_present: np.ndarray,
+    ) -> np.ndarray:
+        amounts = np.asarray(amounts)
+        type_codes = np.asarray(type_codes)
+        source_present = np.asarray(source_present, dtype=bool)
+        if not (len(amounts) == len(type_codes) == len(source_present)):
+            raise ValueError("Batch columns must have the same length")
+
+        errors = np.full(len(amounts), VALID, dtype=np.uint8)
+        # De menor a mayor prioridad: la primera regla incumplida sobrescribe
+        for rule in reversed(PAYMENT_RULES):
+            errors[rule.violated(amounts, type_codes, source_present)] = rule.code
+        return errors
+
+    def validate_batch(self, batch: "PaymentBatch") -> np.ndarray:
+        """Valida un PaymentBatch directamente sobre sus columnas."""
+        return self.validate(batch.amounts, batch.type_codes, batch.source_present())
+
+    @staticmethod
+    def messages(errors: np.ndarray) -> dict[int, str]:
+        """Mensaje de error de cada fila inválida, indexado por fila."""
+        rows = np.flatnonzero(errors)
+        return {int(row): ERROR_MESSAGES[int(errors[row])] for row in rows}
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 # from typing import Self
 from src.payment_service.commons.request import Request
 
+if TYPE_CHECKING:
+    from .compiled_chain import CompiledChain, ValidationMode
+
 
 @dataclass
 class ChainHandler(ABC):
@@ -14,5 +18,33 @@ class ChainHandler(ABC):
         return handler
 
     @abstractmethod
+    def check(self, request: Request) -> None:
+        """Validación propia del eslabón; lanza ValueError si falla."""
+
     def handle(self, request: Request):
-        pass
+        try:
+            self.check(request)
+        except Exception as e:
+            print(f"{type(self).__name__}: Validation error - {e}")
+            raise e
+        if self._next_handler:
+            self._next_handler.handle(request)
+
+    def compile(self, mode: "ValidationMode | None" = None) -> "CompiledChain":
+        """
+        Aplana la cadena que empieza en este eslabón en un CompiledChain, que
+        ejecuta todas las validaciones en un solo bucle.
+        """
+        from .compiled_chain import CompiledChain, ValidationMode
+
+        checks = []
+        handler: ChainHandler | None = self
+        while handler is not None:
+            if isinstance(handler, CompiledChain):
+                checks.extend(handler.checks)
+            else:
+                checks.append((type(handler).__name__, handler.check))
+            handler = handler._next_handler
+        return CompiledChain(
+            checks=tuple(checks), mode=mode or ValidationMode.SHORT_CIRCUIT
+        )
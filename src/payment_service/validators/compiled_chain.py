@@ -0,0 +1,66 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from src.payment_service.commons.request import Request
+
+from .chain_handler import ChainHandler
+
+
+class ValidationMode(Enum):
+    SHORT_CIRCUIT = "short_circuit"  # Se detiene en el primer error
+    COLLECT_ALL = "collect_all"  # Ejecuta todas y reporta todos los errores
+
+
+class ValidationErrors(ValueError):
+    """Varios errores de validación (modo COLLECT_ALL) en un solo ValueError."""
+
+    def __init__(self, errors: list[Exception]) -> None:
+        super().__init__("; ".join(str(error) for error in errors))
+        self.errors = errors
+
+
+@dataclass
+class CompiledChain(ChainHandler):
+    """
+    Cadena de validación aplanada por `ChainHandler.compile()`.
+
+    Guarda la función `check` de cada eslabón (con sus validadores ya
+    creados) y las ejecuta en un solo bucle, sin recursión. En SHORT_CIRCUIT
+    lanza el mismo ValueError que la cadena original; en COLLECT_ALL un único
+    error se relanza tal cual y varios se agrupan en ValidationErrors.
+    """
+
+    checks: tuple[tuple[str, Callable[[Request], None]], ...] = ()
+    mode: ValidationMode = ValidationMode.SHORT_CIRCUIT
+
+    def check(self, request: Request) -> None:
+        if self.mode is ValidationMode.SHORT_CIRCUIT:
+            # Un solo try para todo el bucle: el camino sin errores no paga
+            # por preparar un manejador en cada eslabón; `step` queda en el
+            # eslabón que falló
+            step: tuple[str, Callable[[Request], None]] | None = None
+            try:
+                for step in self.checks:
+                    step[1](request)
+            except Exception as e:
+                print(f"{step[0] if step else ''}: Validation error - {e}")
+                raise e
+            return
+
+        errors: list[Exception] = []
+        for name, check in self.checks:
+            try:
+                check(request)
+            except Exception as e:
+                print(f"{name}: Validation error - {e}")
+                errors.append(e)
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise ValidationErrors(errors)
+
+    def handle(self, request: Request):
+        self.check(request)
+        if self._next_handler:
+            self._next_handler.handle(request)
@@ -1,15 +1,16 @@
 from dataclasses import dataclass
 
-from src.payment_service.commons.payment_data import PaymentData, PaymentType
+from src.payment_service.commons.payment_data import PAYMENT_TYPE_CODES, PaymentData
+
+from .rules import PAYMENT_RULES
 
 
 @dataclass
 class PaymentDataValidator:
     def validate(self, payment_data: PaymentData):
-        if payment_data.amount <= 0:
-            print("Invalid payment data: amount must be positive")
-            raise ValueError("Invalid payment data: amount must be positive")
-        if payment_data.type == PaymentType.ONLINE:
-            if not payment_data.source:
-                print("Invalid payment data: missing source")
-                raise ValueError("Invalid payment data: missing source")
+        type_code = PAYMENT_TYPE_CODES[payment_data.type]
+        source_present = bool(payment_data.source)
+        for rule in PAYMENT_RULES:
+            if rule.violated(payment_data.amount, type_code, source_present):
+                print(rule.message)
+                raise ValueError(rule.message)
@@ -0,0 +1,45 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.payment_service.commons.payment_data import PAYMENT_TYPE_CODES, PaymentType
+
+ONLINE = PAYMENT_TYPE_CODES[PaymentType.ONLINE]
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentRule:
+    """
+    Regla de validación de un pago.
+
+    `violated(amount, type_code, source_present)` devuelve True si el pago
+    incumple la regla. Solo usa comparaciones y operadores `&`/`|`/`^`, así
+    la misma expresión sirve para un pago (escalares) y para un lote entero
+    (arrays de NumPy), y PaymentDataValidator y BatchPaymentValidator no
+    pueden divergir.
+    """
+
+    code: int
+    message: str
+    violated: Callable[[Any, Any, Any], Any]
+
+
+# En orden de prioridad: el primer incumplimiento es el que se reporta
+PAYMENT_RULES: tuple[PaymentRule, ...] = (
+    PaymentRule(
+        code=1,
+        message="Invalid payment data: amount must be positive",
+        violated=lambda amount, type_code, source_present: amount <= 0,
+    ),
+    PaymentRule(
+        code=2,
+        message="Invalid payment data: missing source",
+        # `^ True` niega tanto un bool como un array de bools
+        violated=lambda amount, type_code, source_present: (
+            (type_code == ONLINE) & (source_present ^ True)
+        ),
+    ),
+)
+
+VALID = 0
+ERROR_MESSAGES: dict[int, str] = {rule.code: rule.message for rule in PAYMENT_RULES}
@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import io
+import threading
+
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import ContactInfo, CustomerData, PaymentData
+from src.payment_service.idempotency import IdempotencyStore
+
+customer_data = CustomerData(
+    name="Ana", contact_info=ContactInfo(email="ana@example.com")
+)
+payment_data = PaymentData(amount=1500, source="tok_visa", currency="USD")
+
+
+def build_service(tmp_path):
+    service = (
+        PaymentServiceBuilder()
+        .set_async_payment_processor(payment_data)
+        .set_notifier(customer_data)
+        .set_logger()
+        .set_listener()
+        .set_payment_validator()
+        .set_idempotency_store()
+        .set_metrics()
+        .build_async()
+    )
+    service.logger.path = str(tmp_path / "transactions.log")
+    return service
+
+
+def record_threads(monkeypatch, service) -> list[str]:
+    """Hilo en que se ejecuta cada sink del servicio."""
+    threads = []
+
+    def wrap(target, name):
+        method = getattr(target, name)
+
+        def recorded(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(target, name, recorded)
+
+    wrap(service.logger, "log")
+    wrap(service.logger, "log_batch")
+    wrap(service.listener, "publish")
+    wrap(service.notifier, "send_confirmation")
+    wrap(service.notifier, "send_failure_notification")
+    return threads
+
+
+def test_sinks_run_outside_the_event_loop_thread(monkeypatch, tmp_path):
+    service = build_service(tmp_path)
+    threads = record_threads(monkeypatch, service)
+
+    async def run():
+        await service.process_transaction(customer_data, payment_data)
+        await service.process_batch([(customer_data, payment_data)])
+        return threading.current_thread().name
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        loop_thread = asyncio.run(run())
+
+    assert len(threads) == 6
+    assert loop_thread not in threads
+
+
+def test_async_service_shares_idempotency_with_the_sync_flow(tmp_path):
+    service = build_service(tmp_path)
+    service.idempotency_store = IdempotencyStore()
+
+    async def run():
+        first = await service.process_transaction(
+            customer_data, payment_data, idempotency_key="order-1"
+        )
+        retry = await service.process_transaction(
+            customer_data, payment_data, idempotency_key="order-1"
+        )
+        batch = await service.process_batch(
+            [(customer_data, payment_data)], idempotency_keys=["order-1"]
+        )
+        return first, retry, batch
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        first, retry, batch = asyncio.run(run())
+
+    assert retry.transaction_id == first.transaction_id
+    assert batch.items[0].response.transaction_id == first.transaction_id
+    assert set(service.metrics_snapshot()["transaction"]) >= {
+        "validation",
+        "processor",
+        "logger",
+        "listeners",
+        "notifier",
+    }
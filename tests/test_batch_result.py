@@ -0,0 +1,26 @@
+from src.payment_service.commons import BatchItemResult, BatchResult, PaymentResponse
+
+
+def processed(index: int, status: str) -> BatchItemResult:
+    return BatchItemResult(
+        index=index,
+        status="processed",
+        response=PaymentResponse(status=status, amount=100),
+    )
+
+
+def test_pending_payments_are_not_counted_as_declined():
+    result = BatchResult(
+        items=[
+            processed(0, "succeeded"),
+            processed(1, "offline_pending"),
+            processed(2, "pending"),
+            processed(3, "failed"),
+            BatchItemResult(index=4, status="invalid", error="amount"),
+            BatchItemResult(index=5, status="error", error="boom"),
+        ]
+    )
+
+    assert result.succeeded == 1
+    assert result.pending == 2
+    assert result.failures == {"invalid": 1, "error": 1, "declined": 1}
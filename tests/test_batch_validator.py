@@ -0,0 +1,55 @@
+import contextlib
+import io
+
+import pytest
+
+from src.payment_service.commons import PaymentData, PaymentType
+from src.payment_service.validators import PaymentDataValidator
+from src.payment_service.validators.rules import ERROR_MESSAGES, VALID
+
+pytest.importorskip("numpy")
+
+from src.payment_service.commons import PaymentBatch
+from src.payment_service.validators.batch import BatchPaymentValidator
+
+# (importe, source, tipo): válidos y cada clase de fallo, incluida la prioridad
+ROWS = [
+    (1500, "tok_visa", PaymentType.ONLINE),
+    (1500, "", PaymentType.OFFLINE),
+    (1, "tok_visa", PaymentType.OFFLINE),
+    (0, "tok_visa", PaymentType.ONLINE),
+    (-5, "", PaymentType.OFFLINE),
+    (1500, "", PaymentType.ONLINE),
+    (0, "", PaymentType.ONLINE),
+]
+CODES_BY_MESSAGE = {message: code for code, message in ERROR_MESSAGES.items()}
+
+
+def scalar_code(payment_data: PaymentData) -> int:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            PaymentDataValidator().validate(payment_data)
+    except ValueError as e:
+        return CODES_BY_MESSAGE[str(e)]
+    return VALID
+
+
+def test_batch_validator_reports_the_same_codes_as_the_scalar_validator():
+    expected = [
+        scalar_code(PaymentData(amount=amount, source=source, type=payment_type))
+        for amount, source, payment_type in ROWS
+    ]
+    batch = PaymentBatch.from_rows(
+        [
+            (amount, source, "MXN", payment_type, "ana")
+            for amount, source, payment_type in ROWS
+        ]
+    )
+
+    errors = BatchPaymentValidator().validate_batch(batch)
+
+    assert errors.tolist() == expected
+    assert set(expected) == {VALID, *ERROR_MESSAGES}
+    assert BatchPaymentValidator.messages(errors) == {
+        row: ERROR_MESSAGES[code] for row, code in enumerate(expected) if code
+    }
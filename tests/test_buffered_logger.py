@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from src.payment_service.commons import PaymentResponse
+from src.payment_service.loggers.buffered_logger import BufferedTransactionLogger
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_UNCLOSED_LOGGER = """
+from src.payment_service.commons import PaymentResponse
+from src.payment_service.loggers.buffered_logger import BufferedTransactionLogger
+
+logger = BufferedTransactionLogger(flush_interval=None)
+logger.path = {path!r}
+logger.log_refund("ch_1", PaymentResponse(status="refunded", amount=100))
+"""
+
+
+def test_pending_records_are_written_at_interpreter_exit(tmp_path):
+    path = tmp_path / "transactions.log"
+    subprocess.run(
+        [sys.executable, "-c", _UNCLOSED_LOGGER.format(path=str(path))],
+        cwd=ROOT,
+        check=True,
+    )
+
+    assert "ch_1" in path.read_text()
+
+
+def test_context_manager_closes_the_file(tmp_path):
+    path = tmp_path / "transactions.log"
+    with BufferedTransactionLogger(flush_interval=None) as logger:
+        logger.path = str(path)
+        logger.log_refund("ch_2", PaymentResponse(status="refunded", amount=100))
+        assert not path.exists()
+
+    assert "ch_2" in path.read_text()
+    assert logger._file is None
+
+
+def test_append_racing_close_does_not_reopen_the_file(tmp_path):
+    path = tmp_path / "transactions.log"
+    logger = BufferedTransactionLogger(flush_interval=None, max_buffered_bytes=1)
+    logger.path = str(path)
+    errors = []
+
+    def append():
+        try:
+            logger.log_refund("ch_3", PaymentResponse(status="refunded", amount=100))
+        except ValueError as e:
+            errors.append(e)
+
+    # El registro llega justo cuando close() ya marcó el logger como cerrado
+    with logger._lock:
+        writer = threading.Thread(target=append)
+        writer.start()
+        time.sleep(0.05)
+        logger._closed.set()
+    writer.join()
+    logger.close()
+
+    assert len(errors) == 1
+    assert not path.exists()
+    assert logger._file is None
@@ -0,0 +1,119 @@
+import json
+import threading
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+
+from src.payment_service import cli
+from src.payment_service.commons import PaymentResponse
+
+
+@dataclass
+class FakeGateway:
+    """
+    Pasarela que, como Stripe, devuelve el mismo cargo para una clave repetida.
+
+    Con `crash_after` simula que el proceso muere justo después de que la
+    pasarela aceptó ese número de cargos nuevos.
+    """
+
+    crash_after: int | None = None
+    charges: Counter = field(default_factory=Counter)
+    seen: dict[str, PaymentResponse] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def process_transaction(self, customer_data, payment_data, idempotency_key=None):
+        with self._lock:
+            if idempotency_key in self.seen:
+                return self.seen[idempotency_key]
+            response = PaymentResponse(
+                status="succeeded",
+                amount=payment_data.amount,
+                transaction_id=f"ch_{uuid.uuid4().hex[:8]}",
+            )
+            self.charges[idempotency_key or response.transaction_id] += 1
+            if idempotency_key:
+                self.seen[idempotency_key] = response
+            if self.crash_after is not None and sum(self.charges.values()) >= (
+                self.crash_after
+            ):
+                self.crash_after = None
+                raise KeyboardInterrupt
+            return response
+
+
+def write_payments(path, count):
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(count):
+            record = {
+                "customer_data": {
+                    "name": f"Cliente {i}",
+                    "contact_info": {"email": f"c{i}@example.com"},
+                },
+                "payment_data": {"amount": 100 + i, "source": "tok_visa"},
+            }
+            file.write(json.dumps(record) + "\n")
+
+
+def run_cli(monkeypatch, gateway, tmp_path, payments):
+    build_service = cli.build_service
+
+    def build_with_gateway(args, metrics):
+        service = build_service(args, metrics)
+        service.payment_processor = gateway
+        return service
+
+    monkeypatch.setattr(cli, "build_service", build_with_gateway)
+    return cli.main(
+        [
+            str(payments),
+            "--chunk-size",
+            "4",
+            "--workers",
+            "1",
+            "--log-path",
+            str(tmp_path / "transactions.log"),
+            "--quiet",
+        ]
+    )
+
+
+def test_resuming_after_a_crash_mid_chunk_charges_each_row_once(monkeypatch, tmp_path):
+    payments = tmp_path / "payments.jsonl"
+    write_payments(payments, 10)
+    # Muere en el segundo bloque (filas 5-8) con cargos ya aceptados por la pasarela
+    gateway = FakeGateway(crash_after=6)
+
+    assert run_cli(monkeypatch, gateway, tmp_path, payments) == 130
+    assert run_cli(monkeypatch, gateway, tmp_path, payments) == 0
+
+    assert len(gateway.charges) == 10
+    assert set(gateway.charges.values()) == {1}
+    checkpoint = json.loads((tmp_path / "payments.jsonl.checkpoint").read_text())
+    assert checkpoint["rows_done"] == 10
+    assert checkpoint["counts"]["succeeded"] == 10
+    log = (tmp_path / "transactions.log").read_text()
+    assert log.count(" paid ") == 10
+
+
+def test_json_arrays_are_rejected(tmp_path, capsys):
+    payments = tmp_path / "payments.json"
+    payments.write_text("[]")
+
+    assert cli.main([str(payments)]) == 2
+    assert "JSONL" in capsys.readouterr().err
+
+
+def test_offline_csv_rows_without_source_are_charged_as_pending(tmp_path):
+    payments = tmp_path / "payments.csv"
+    payments.write_text(
+        "name,email,phone,customer_id,amount,source,currency,type\n"
+        "Ana,ana@example.com,,,1500,,MXN,offline\n"
+    )
+
+    code = cli.main([str(payments), "--log-path", str(tmp_path / "t.log"), "--quiet"])
+
+    assert code == 0
+    checkpoint = json.loads((tmp_path / "payments.csv.checkpoint").read_text())
+    assert checkpoint["counts"]["pending"] == 1
+    assert checkpoint["counts"]["invalid"] == 0
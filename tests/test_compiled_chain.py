@@ -0,0 +1,89 @@
+import contextlib
+import io
+
+import pytest
+
+from src.payment_service.commons import (
+    ContactInfo,
+    CustomerData,
+    PaymentData,
+    PaymentType,
+    Request,
+)
+from src.payment_service.validators import (
+    CustomerHandler,
+    PaymentHandler,
+    ValidationErrors,
+    ValidationMode,
+)
+
+valid_customer = CustomerData(name="Ana", contact_info=ContactInfo(email="a@b.com"))
+no_contact = CustomerData(name="Ana", contact_info=ContactInfo())
+no_name = CustomerData(name="", contact_info=ContactInfo(email="a@b.com"))
+valid_payment = PaymentData(amount=100, source="tok_visa")
+
+FAILING_REQUESTS = {
+    "missing_name": Request(customer_data=no_name, payment_data=valid_payment),
+    "missing_contact": Request(customer_data=no_contact, payment_data=valid_payment),
+    "zero_amount": Request(
+        customer_data=valid_customer,
+        payment_data=PaymentData(amount=0, source="tok_visa"),
+    ),
+    "online_without_source": Request(
+        customer_data=valid_customer,
+        payment_data=PaymentData(amount=100, source=""),
+    ),
+    "offline_negative_amount": Request(
+        customer_data=no_contact,
+        payment_data=PaymentData(amount=-5, source="", type=PaymentType.OFFLINE),
+    ),
+}
+
+
+def chain():
+    customer_handler = CustomerHandler()
+    customer_handler.set_next(PaymentHandler())
+    return customer_handler
+
+
+def raised(handler, request):
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(ValueError) as e:
+        handler.handle(request)
+    return e.value
+
+
+@pytest.mark.parametrize("mode", list(ValidationMode))
+@pytest.mark.parametrize("case", FAILING_REQUESTS)
+def test_compiled_chain_raises_the_recursive_chain_error(case, mode):
+    request = FAILING_REQUESTS[case]
+
+    expected = raised(chain(), request)
+    error = raised(chain().compile(mode), request)
+
+    assert type(error) is type(expected)
+    assert str(error) == str(expected)
+
+
+def test_collect_all_reports_every_failing_link_in_chain_order():
+    request = Request(
+        customer_data=no_contact,
+        payment_data=PaymentData(amount=0, source="tok_visa"),
+    )
+
+    first = raised(chain(), request)
+    error = raised(chain().compile(ValidationMode.COLLECT_ALL), request)
+
+    assert isinstance(error, ValidationErrors)
+    assert type(error.errors[0]) is type(first)
+    assert str(error.errors[0]) == str(first)
+    assert str(error) == "; ".join(str(e) for e in error.errors)
+    assert len(error.errors) == 2
+
+
+@pytest.mark.parametrize("mode", list(ValidationMode))
+def test_compiled_chain_accepts_what_the_recursive_chain_accepts(mode):
+    request = Request(customer_data=valid_customer, payment_data=valid_payment)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        chain().handle(request)
+        chain().compile(mode).handle(request)
@@ -0,0 +1,32 @@
+import threading
+
+from src.payment_service.listeners import ConcurrentListenerManager
+
+
+class HangingListener:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.seen: list[str] = []
+
+    def notify(self, event: str) -> None:
+        if event == "hang":
+            self.release.wait()
+        self.seen.append(event)
+
+
+def test_hung_listener_is_bounded_by_handler_timeout():
+    listener = HangingListener()
+    manager = ConcurrentListenerManager(handler_timeout=0.1)
+    manager.suscribe(listener)
+
+    manager.notify("hang")
+    manager.notify("next")
+
+    assert manager.drain(timeout=5)
+    (metrics,) = manager.metrics().values()
+    assert metrics["timeouts"] == 1
+    assert metrics["processed"] == 1
+    assert listener.seen == ["next"]
+
+    listener.release.set()
+    manager.shutdown(timeout=5)
@@ -0,0 +1,72 @@
+import contextlib
+import io
+
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import ContactInfo, CustomerData, PaymentData
+from src.payment_service.idempotency import IdempotencyStore
+
+customer_data = CustomerData(
+    name="Ana", contact_info=ContactInfo(email="ana@example.com")
+)
+payment_data = PaymentData(amount=1500, source="tok_visa", currency="USD")
+
+
+def build_service(tmp_path, store: IdempotencyStore):
+    service = (
+        PaymentServiceBuilder()
+        .set_payment_processor(payment_data)
+        .set_notifier(customer_data)
+        .set_logger()
+        .set_listener()
+        .set_payment_validator()
+        .build()
+    )
+    service.logger.path = str(tmp_path / "transactions.log")
+    service.idempotency_store = store
+    return service
+
+
+def charge(service, idempotency_key=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return service.process_transaction(
+            customer_data, payment_data, idempotency_key=idempotency_key
+        )
+
+
+def test_explicit_key_returns_the_stored_response(tmp_path):
+    service = build_service(tmp_path, IdempotencyStore())
+
+    first = charge(service, "order-1")
+    retry = charge(service, "order-1")
+    other = charge(service, "order-2")
+
+    assert retry.transaction_id == first.transaction_id
+    assert other.transaction_id != first.transaction_id
+
+
+def test_identical_purchases_outside_the_fingerprint_window_are_charged(tmp_path):
+    service = build_service(tmp_path, IdempotencyStore(fingerprint_ttl_seconds=0.0))
+
+    first = charge(service)
+    second = charge(service)
+
+    assert second.transaction_id != first.transaction_id
+
+
+def test_immediate_resubmission_without_key_is_deduplicated(tmp_path):
+    service = build_service(tmp_path, IdempotencyStore())
+
+    assert charge(service).transaction_id == charge(service).transaction_id
+
+
+def test_batch_rows_with_keys_are_not_charged_twice(tmp_path):
+    service = build_service(tmp_path, IdempotencyStore())
+    rows = [(customer_data, payment_data)] * 2
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = service.process_batch(rows, idempotency_keys=["row-1", "row-2"])
+        retry = service.process_batch(rows, idempotency_keys=["row-1", "row-2"])
+
+    first_ids = [item.response.transaction_id for item in first.items]
+    assert [item.response.transaction_id for item in retry.items] == first_ids
+    assert first_ids[0] != first_ids[1]
@@ -0,0 +1,85 @@
+import json
+import threading
+import time
+
+from src.payment_service.commons import ContactInfo, CustomerData
+from src.payment_service.notifiers.dispatcher import (
+    BackpressurePolicy,
+    NotificationDispatcher,
+)
+
+customer_data = CustomerData(name="Ana", contact_info=ContactInfo(email="a@b.com"))
+
+
+class RecordingNotifier:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    def send_confirmation(self, customer_data: CustomerData) -> None:
+        self.sent.append(customer_data.name)
+
+    def send_failure_notification(
+        self, customer_data: CustomerData, error_message: str
+    ) -> None:
+        self.sent.append(error_message)
+
+
+class BlockedNotifier(RecordingNotifier):
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def send_confirmation(self, customer_data: CustomerData) -> None:
+        self.started.set()
+        self.release.wait(5)
+        super().send_confirmation(customer_data)
+
+
+def test_submit_after_shutdown_is_rejected_and_counted():
+    notifier = RecordingNotifier()
+    dispatcher = NotificationDispatcher(notifier, workers=1)
+    dispatcher.send_confirmation(customer_data)
+    assert dispatcher.shutdown(timeout=5)
+
+    dispatcher.send_failure_notification(customer_data, "declined")
+
+    assert notifier.sent == ["Ana"]
+    assert dispatcher.rejected == 1
+    assert dispatcher.pending == 0
+
+
+def test_submit_after_shutdown_spills_to_disk(tmp_path):
+    spill_path = tmp_path / "notifications.spill"
+    dispatcher = NotificationDispatcher(
+        RecordingNotifier(),
+        workers=1,
+        backpressure=BackpressurePolicy.SPILL_TO_DISK,
+        spill_path=str(spill_path),
+    )
+    dispatcher.shutdown(timeout=5)
+
+    dispatcher.send_confirmation(customer_data)
+
+    assert dispatcher.spilled == 1
+    assert json.loads(spill_path.read_text())["kind"] == "confirmation"
+
+
+def test_shutdown_with_full_queue_and_blocked_worker_honours_timeout():
+    notifier = BlockedNotifier()
+    dispatcher = NotificationDispatcher(notifier, workers=1, max_queue_size=1)
+    worker = dispatcher._threads[0]
+    dispatcher.send_confirmation(customer_data)
+    assert notifier.started.wait(5)
+    dispatcher.send_confirmation(customer_data)  # Llena la cola
+
+    start = time.monotonic()
+    drained = dispatcher.shutdown(timeout=0.2)
+
+    assert time.monotonic() - start < 2
+    assert not drained
+    assert dispatcher.rejected == 1
+    notifier.release.set()
+    worker.join(5)
+    assert not worker.is_alive()
+    assert notifier.sent == ["Ana"]
@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+import io
+
+import pytest
+
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import (
+    ContactInfo,
+    CustomerData,
+    PaymentData,
+    PaymentType,
+)
+
+pytest.importorskip("numpy")
+
+from src.payment_service.commons import PaymentBatch, PaymentRow
+
+customers = {
+    "ana": CustomerData(name="Ana", contact_info=ContactInfo(email="ana@example.com")),
+    "luis": CustomerData(
+        name="Luis", contact_info=ContactInfo(email="luis@example.com")
+    ),
+}
+batch = PaymentBatch.from_rows(
+    [
+        (1500, "tok_visa", "USD", PaymentType.ONLINE, "ana"),
+        (2500, "tok_visa", "USD", PaymentType.ONLINE, "luis"),
+        (0, "tok_visa", "USD", PaymentType.ONLINE, "ana"),
+    ]
+)
+payment_data = PaymentData(amount=1500, source="tok_visa", currency="USD")
+
+
+def builder():
+    return (
+        PaymentServiceBuilder()
+        .set_notifier(customers["ana"])
+        .set_logger()
+        .set_listener()
+        .set_chain_of_validations()
+    )
+
+
+def rows():
+    return [(customers[row.customer_ref], row) for row in batch]
+
+
+def test_row_materializes_as_payment_data():
+    row = batch[0]
+
+    assert row.to_payment_data() == PaymentData(
+        amount=1500, source="tok_visa", currency="USD", type=PaymentType.ONLINE
+    )
+
+
+def test_payment_batch_runs_through_process_batch(tmp_path):
+    service = builder().set_payment_processor(payment_data).build()
+    service.logger.path = str(tmp_path / "transactions.log")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = service.process_batch(rows())
+
+    assert [item.status for item in result.items] == [
+        "processed",
+        "processed",
+        "invalid",
+    ]
+    assert [item.response.amount for item in result.items[:2]] == [1500, 2500]
+
+
+def test_payment_batch_runs_through_async_process_batch(tmp_path):
+    service = builder().set_async_payment_processor(payment_data).build_async()
+    service.logger.path = str(tmp_path / "transactions.log")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = asyncio.run(service.process_batch(rows()))
+
+    assert [item.status for item in result.items] == [
+        "processed",
+        "processed",
+        "invalid",
+    ]
+
+
+def test_payment_row_is_accepted_by_process_transaction(tmp_path):
+    service = builder().set_payment_processor(payment_data).build()
+    service.logger.path = str(tmp_path / "transactions.log")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = service.process_transaction(customers["luis"], batch[1])
+
+    assert response.amount == 2500
+
+
+def test_process_batch_keeps_rows_as_views(monkeypatch, tmp_path):
+    service = builder().set_payment_processor(payment_data).build()
+    service.logger.path = str(tmp_path / "transactions.log")
+    charge = service.payment_processor.process_transaction
+    seen = []
+
+    def record(customer_data, payment_data, idempotency_key=None):
+        seen.append(type(payment_data))
+        return charge(customer_data, payment_data, idempotency_key)
+
+    def materialize(row):
+        raise AssertionError("process_batch materialized a PaymentRow")
+
+    monkeypatch.setattr(service.payment_processor, "process_transaction", record)
+    monkeypatch.setattr(PaymentRow, "to_payment_data", materialize)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = service.process_batch(rows())
+
+    assert [item.status for item in result.items] == [
+        "processed",
+        "processed",
+        "invalid",
+    ]
+    assert seen == [PaymentRow, PaymentRow]
@@ -0,0 +1,68 @@
+import contextlib
+import io
+
+import pytest
+
+from src.payment_service.builder import PaymentServiceBuilder
+from src.payment_service.commons import (
+    ContactInfo,
+    CustomerData,
+    PaymentData,
+    PaymentResponse,
+)
+from src.payment_service.processors import RateLimitedProcessor
+from src.payment_service.resilience import RateLimiter, RateLimitMode, TokenBucket
+
+customer_data = CustomerData(name="Ana", contact_info=ContactInfo(email="a@b.com"))
+payment_data = PaymentData(amount=100, source="tok_visa", currency="USD")
+
+
+class SubscriptionProcessor:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def setup_recurring_payment(
+        self, customer_data: CustomerData, payment_data: PaymentData
+    ) -> PaymentResponse:
+        self.calls += 1
+        return PaymentResponse(status="active", amount=100, transaction_id="sub_1")
+
+
+def test_subscription_takes_one_token_per_outbound_call():
+    bucket = TokenBucket(rate=0.001, capacity=4)
+    processor = RateLimitedProcessor(
+        wrapped_processor=SubscriptionProcessor(),
+        limiter=RateLimiter(
+            buckets={"subscriptions": bucket}, mode=RateLimitMode.REJECT
+        ),
+    )
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = processor.setup_recurring_payment(customer_data, payment_data)
+        second = processor.setup_recurring_payment(customer_data, payment_data)
+
+    assert first.status == "active"
+    assert second.status == "rate_limited"
+    assert processor.wrapped_processor.calls == 1
+    assert bucket.available() == pytest.approx(
+        4 - RateLimitedProcessor.RECURRING_CALLS, abs=0.01
+    )
+
+
+def test_cost_above_capacity_is_a_configuration_error():
+    bucket = TokenBucket(rate=1.0, capacity=1.0)
+
+    with pytest.raises(ValueError, match="capacity"):
+        bucket.try_acquire(cost=2.0)
+
+
+def test_builder_sizes_the_subscriptions_bucket_for_a_whole_setup():
+    builder = (
+        PaymentServiceBuilder()
+        .set_payment_processor(payment_data)
+        .set_rate_limit(rate=1.0)
+    )
+
+    buckets = builder.payment_processor.limiter.buckets
+    assert buckets["charges"].capacity == 1.0
+    assert buckets["subscriptions"].capacity == RateLimitedProcessor.RECURRING_CALLS
@@ -0,0 +1,30 @@
+from src.payment_service.metrics import PipelineMetrics, active_metrics, use_metrics
+from src.payment_service.processors import StripePaymentProcessor
+
+
+def test_shared_processor_records_into_the_calling_service_metrics():
+    processor = StripePaymentProcessor(client=object())
+    first, second = PipelineMetrics(), PipelineMetrics()
+
+    with use_metrics(first):
+        processor._record({"customer": 1_000})
+    with use_metrics(second):
+        processor._record({"customer": 2_000, "subscription": 3_000})
+
+    assert active_metrics() is None
+    assert set(first.snapshot()["recurring"]) == {"stripe_customer"}
+    assert set(second.snapshot()["recurring"]) == {
+        "stripe_customer",
+        "stripe_subscription",
+    }
+
+
+def test_processor_metrics_take_precedence_over_the_service_metrics():
+    own, service = PipelineMetrics(), PipelineMetrics()
+    processor = StripePaymentProcessor(client=object(), metrics=own)
+
+    with use_metrics(service):
+        processor._record({"customer": 1_000})
+
+    assert "recurring" in own.snapshot()
+    assert "recurring" not in service.snapshot()
@@ -0,0 +1,32 @@
+from src.payment_service.commons import (
+    ContactInfo,
+    CustomerData,
+    PaymentData,
+    Request,
+)
+
+customer_data = CustomerData(
+    name="Ana", contact_info=ContactInfo(email="ana@example.com")
+)
+payment_data = PaymentData(amount=1500, source="tok_visa", currency="USD")
+
+
+def test_request_of_matches_the_validated_request():
+    request = Request.of(customer_data, payment_data)
+    validated = Request(customer_data=customer_data, payment_data=payment_data)
+
+    assert request == validated
+    assert request.model_fields_set == validated.model_fields_set
+    assert request.model_dump(exclude_unset=True) == validated.model_dump(
+        exclude_unset=True
+    )
+
+
+def test_request_of_validates_plain_values():
+    request = Request.of(
+        {"name": "Ana", "contact_info": {"email": "ana@example.com"}},
+        {"amount": "1500", "source": "tok_visa"},
+    )
+
+    assert request.payment_data.amount == 1500
+    assert request.payment_data.model_fields_set == {"amount", "source"}
@@ -0,0 +1,84 @@
+import json
+
+from src.payment_service.ingestion import RequestReader
+
+
+def record(name: str, amount: int) -> dict:
+    return {
+        "customer_data": {
+            "name": name,
+            "contact_info": {"email": f"{name.lower()}@example.com"},
+        },
+        "payment_data": {"amount": amount, "source": "tok_visa"},
+    }
+
+
+def jsonl(*lines: str) -> bytes:
+    return "\n".join(lines).encode()
+
+
+def test_jsonl_rows_keep_their_line_numbers():
+    data = jsonl(
+        json.dumps(record("Ana", 100)),
+        "",
+        json.dumps(record("Luis", 200)),
+    )
+
+    (chunk,) = RequestReader().read_jsonl(data)
+
+    assert chunk.rows == [1, 3]
+    assert [r.payment_data.amount for r in chunk.requests] == [100, 200]
+
+
+def test_line_with_several_objects_does_not_shift_later_rows():
+    data = jsonl(
+        json.dumps(record("Ana", 100)),
+        json.dumps(record("Eva", 300)) + "," + json.dumps(record("Sol", 400)),
+        json.dumps(record("Luis", 200)),
+    )
+
+    (chunk,) = RequestReader().read_jsonl(data)
+
+    assert [
+        (row, r.customer_data.name)
+        for row, r in zip(chunk.rows, chunk.requests, strict=True)
+    ] == [(1, "Ana"), (3, "Luis")]
+    assert [error.row for error in chunk.errors] == [2]
+
+
+def test_invalid_row_is_reported_without_dropping_valid_rows():
+    data = jsonl(
+        json.dumps(record("Ana", 100)),
+        json.dumps(record("Luis", "mucho")),
+    )
+
+    (chunk,) = RequestReader().read_jsonl(data)
+
+    assert chunk.rows == [1]
+    assert [error.row for error in chunk.errors] == [2]
+    assert "payment_data.amount" in str(chunk.errors[0])
+
+
+def test_skip_rows_resumes_after_the_checkpoint():
+    data = jsonl(*(json.dumps(record(f"C{i}", i + 1)) for i in range(5)))
+
+    chunks = list(RequestReader(chunk_size=2).read_jsonl(data, skip_rows=2))
+
+    assert [chunk.rows for chunk in chunks] == [[3, 4], [5]]
+
+
+def test_csv_offline_row_without_source_is_valid(tmp_path):
+    payments = tmp_path / "payments.csv"
+    payments.write_text(
+        "name,email,phone,customer_id,amount,source,currency,type\n"
+        "Ana,ana@example.com,,,1500,,MXN,offline\n"
+        "Luis,luis@example.com,,,,tok_visa,USD,online\n"
+    )
+
+    (chunk,) = RequestReader().read_csv(payments)
+
+    assert chunk.rows == [2]
+    assert chunk.requests[0].payment_data.source == ""
+    assert chunk.requests[0].customer_data.contact_info.phone is None
+    assert [error.row for error in chunk.errors] == [3]
+    assert "payment_data.amount" in str(chunk.errors[0])
@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from src.payment_service.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryPolicy,
+    retry_call,
+    retry_call_async,
+)
+
+NO_WAIT = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0)
+
+
+class Transient(Exception):
+    pass
+
+
+def is_transient(error: Exception) -> bool:
+    return isinstance(error, Transient)
+
+
+def fail(error: BaseException):
+    def call():
+        raise error
+
+    return call
+
+
+def half_open(breaker: CircuitBreaker) -> None:
+    breaker.record_failure()
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout
+
+
+def test_breaker_opens_after_the_failure_threshold():
+    breaker = CircuitBreaker("charges", failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.rejected == 1
+
+
+def test_half_open_allows_a_single_trial():
+    breaker = CircuitBreaker("charges", failure_threshold=1)
+    half_open(breaker)
+
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError, match="half-open"):
+        breaker.before_call()
+
+
+def test_trial_success_closes_and_failure_reopens():
+    closed = CircuitBreaker("charges", failure_threshold=1)
+    half_open(closed)
+    closed.before_call()
+    closed.record_success()
+    assert closed.state is CircuitState.CLOSED
+
+    reopened = CircuitBreaker("charges", failure_threshold=1)
+    half_open(reopened)
+    reopened.before_call()
+    reopened.record_failure()
+    assert reopened.state is CircuitState.OPEN
+
+
+def test_retry_stops_at_max_attempts_and_counts_failures():
+    breaker = CircuitBreaker("charges", failure_threshold=10)
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise Transient
+
+    with pytest.raises(Transient):
+        retry_call(call, NO_WAIT, breaker, is_transient)
+    assert len(calls) == 3
+    assert breaker.consecutive_failures == 3
+
+
+def test_non_retryable_errors_are_not_breaker_failures():
+    breaker = CircuitBreaker("charges", failure_threshold=1)
+
+    with pytest.raises(ValueError):
+        retry_call(fail(ValueError("card declined")), NO_WAIT, breaker, is_transient)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_interrupted_trial_releases_the_half_open_breaker():
+    breaker = CircuitBreaker("charges", failure_threshold=1)
+    half_open(breaker)
+
+    with pytest.raises(KeyboardInterrupt):
+        retry_call(fail(KeyboardInterrupt()), NO_WAIT, breaker, is_transient)
+
+    assert retry_call(lambda: "ok", NO_WAIT, breaker, is_transient) == "ok"
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_cancelled_async_trial_releases_the_half_open_breaker():
+    breaker = CircuitBreaker("charges", failure_threshold=1)
+    half_open(breaker)
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def ok():
+        return "ok"
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(
+                retry_call_async(slow, NO_WAIT, breaker, is_transient), 0.01
+            )
+        return await retry_call_async(ok, NO_WAIT, breaker, is_transient)
+
+    assert asyncio.run(main()) == "ok"
+    assert breaker.state is CircuitState.CLOSED
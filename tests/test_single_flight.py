@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from src.payment_service.concurrency import AsyncSingleFlight
+
+
+def test_concurrent_calls_share_one_result():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def lookup():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "cus_1"
+
+    async def main():
+        return await asyncio.gather(*(flights.do("ana", lookup) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["cus_1"] * 5
+    assert len(calls) == 1
+    assert flights.shared == 4
+
+
+def test_leader_cancellation_does_not_reach_followers():
+    flights = AsyncSingleFlight()
+
+    async def lookup():
+        await asyncio.sleep(0.05)
+        return "cus_1"
+
+    async def main():
+        leader = asyncio.create_task(flights.do("ana", lookup))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("ana", lookup))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "cus_1"
+
+
+def test_errors_reach_every_caller_and_clear_the_key():
+    flights = AsyncSingleFlight()
+
+    async def lookup():
+        await asyncio.sleep(0.01)
+        raise LookupError("stripe down")
+
+    async def main():
+        results = await asyncio.gather(
+            flights.do("ana", lookup), flights.do("ana", lookup), return_exceptions=True
+        )
+        return results, dict(flights._calls)
+
+    results, pending = asyncio.run(main())
+    assert all(isinstance(result, LookupError) for result in results)
+    assert pending == {}
@@ -0,0 +1,20 @@
+import asyncio
+
+from src.payment_service.processors.stripe_client import (
+    StripeClientConfig,
+    build_async_stripe_client,
+)
+
+
+def test_async_client_uses_the_configured_pool_limits():
+    # Depende del parámetro privado `_lib` de stripe.HTTPXClient: si una
+    # versión admitida deja de usarlo, el pool vuelve a los límites de httpx
+    config = StripeClientConfig(api_key="sk_test", max_connections=3)
+    client = build_async_stripe_client(config)
+
+    async_client = client._requestor._client._client_async
+    try:
+        assert async_client._transport._pool._max_connections == 3
+        assert async_client._transport._pool._max_keepalive_connections == 3
+    finally:
+        asyncio.run(async_client.aclose())
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from src.payment_service.commons import ContactInfo, CustomerData, PaymentData
+from src.payment_service.processors import StripePaymentProcessor
+
+customer_data = CustomerData(
+    name="Ana",
+    contact_info=ContactInfo(email="ana@example.com"),
+    customer_id="cus_1",
+)
+payment_data = PaymentData(amount=999, source="pm_card_visa")
+
+
+def subscription(unit_amount):
+    return {
+        "id": "sub_1",
+        "status": "active",
+        "items": {"data": [{"price": {"unit_amount": unit_amount}}]},
+    }
+
+
+def processor(monkeypatch, attach, unit_amount=999):
+    stripe_processor = StripePaymentProcessor(client=object())
+    monkeypatch.setattr(
+        stripe_processor,
+        "_get_or_create_customer",
+        lambda customer_data: SimpleNamespace(id=customer_data.customer_id),
+    )
+    monkeypatch.setattr(stripe_processor, "_attach_payment_method", attach)
+    monkeypatch.setattr(
+        stripe_processor,
+        "_create_subscription",
+        lambda customer_id, payment_method_id: subscription(unit_amount),
+    )
+    return stripe_processor
+
+
+def test_recurring_steps_do_not_queue_behind_other_callers(monkeypatch):
+    callers = 8
+    # Cada adjunto espera a que los demás estén en curso a la vez
+    barrier = threading.Barrier(callers, timeout=5)
+
+    def attach(customer_id, payment_source):
+        barrier.wait()
+        return SimpleNamespace(id="pm_1")
+
+    stripe_processor = processor(monkeypatch, attach)
+
+    with (
+        contextlib.redirect_stdout(io.StringIO()),
+        ThreadPoolExecutor(max_workers=callers) as pool,
+    ):
+        responses = list(
+            pool.map(
+                lambda _: stripe_processor.setup_recurring_payment(
+                    customer_data, payment_data
+                ),
+                range(callers),
+            )
+        )
+
+    assert [response.status for response in responses] == ["active"] * callers
+
+
+def test_tiered_price_without_unit_amount_reports_zero(monkeypatch):
+    stripe_processor = processor(
+        monkeypatch,
+        lambda customer_id, payment_source: SimpleNamespace(id="pm_1"),
+        unit_amount=None,
+    )
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = stripe_processor.setup_recurring_payment(customer_data, payment_data)
+
+    assert response.status == "active"
+    assert response.amount == 0
+    assert response.transaction_id == "sub_1"